@@ -28,6 +28,22 @@ def create_app(config_name=None):
     migrate.init_app(app, db)
     login_manager.init_app(app)
     
+    # Size the in-process earnings result cache
+    from .utils.result_cache import earnings_cache
+    earnings_cache.resize(app.config['EARNINGS_CACHE_SIZE'])
+    
+    # Size the shared growth and discount factor cache
+    from .utils.factor_cache import factor_cache
+    factor_cache.resize(app.config['FACTOR_CACHE_SIZE'])
+    
+    # Commit results deferred by the write-behind policy once per request
+    from .utils.result_writer import flush_pending_results
+    app.after_request(flush_pending_results)
+    
+    # Format numbers in templates only when they are displayed
+    from .utils.formatting import register_template_filters
+    register_template_filters(app)
+    
     # Set up logging
     app.logger.setLevel(logging.DEBUG)
     
@@ -40,7 +56,8 @@ def create_app(config_name=None):
     from forensic_econ_app.routes.household import household
     from forensic_econ_app.routes.pcpm import bp as pcpm_bp
     from forensic_econ_app.routes.fringe_benefits import bp as fringe_benefits_bp
-    from .commands import init_ecec_data
+    from forensic_econ_app.routes.goal_seek import bp as goal_seek_bp
+    from .commands import init_ecec_data, numeric_parity
     
     app.logger.debug('Registering blueprints...')
     
@@ -57,8 +74,10 @@ def create_app(config_name=None):
     app.register_blueprint(pcpm_bp)
     app.register_blueprint(fringe_benefits_bp)
     app.logger.debug('Successfully registered fringe_benefits_bp')
+    app.register_blueprint(goal_seek_bp)
     
     # Register commands
     app.cli.add_command(init_ecec_data)
+    app.cli.add_command(numeric_parity)
     
     return app 
\ No newline at end of file
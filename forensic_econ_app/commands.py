@@ -97,4 +97,22 @@ def init_ecec_data():
         click.echo('Successfully initialized ECEC data.')
     except Exception as e:
         db.session.rollback()
-        click.echo(f'Error initializing ECEC data: {str(e)}', err=True) 
\ No newline at end of file
+        click.echo(f'Error initializing ECEC data: {str(e)}', err=True) 
+
+@click.command('numeric-parity')
+@with_appcontext
+def numeric_parity():
+    """Check that the float64 and Decimal backends agree to the cent."""
+    from .utils.parity import parity_report
+    
+    rows = parity_report()
+    for row in rows:
+        values = '  '.join(f"{backend}={row[backend]}" for backend in ('decimal', 'float64') if backend in row)
+        status = 'OK' if row['agrees'] else 'MISMATCH'
+        click.echo(f"{status:8} {row['model']:10} case {row['case']:<3} {row['quantity']:14} {values}")
+    
+    mismatches = sum(not row['agrees'] for row in rows)
+    if mismatches:
+        click.echo(f'{mismatches} of {len(rows)} comparisons differ.', err=True)
+        raise SystemExit(1)
+    click.echo(f'All {len(rows)} comparisons agree to the cent.')
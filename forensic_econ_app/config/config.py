@@ -7,6 +7,26 @@ class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-please-change'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    EARNINGS_CACHE_SIZE = int(os.environ.get('EARNINGS_CACHE_SIZE', 256))
+    # 'immediate' commits changed results at once, 'deferred' batches them per request
+    RESULT_WRITE_POLICY = os.environ.get('RESULT_WRITE_POLICY', 'immediate')
+    # 'float64' or 'decimal' arithmetic for the calculators (see utils/numeric.py)
+    NUMERIC_BACKEND = os.environ.get('NUMERIC_BACKEND', 'float64')
+    SIMULATION_MAX_PATHS = int(os.environ.get('SIMULATION_MAX_PATHS', 100000))
+    # Paths simulated in a request that does not ask for a number
+    SIMULATION_DEFAULT_PATHS = int(os.environ.get('SIMULATION_DEFAULT_PATHS', 10000))
+    # Worker processes used to shard simulation paths (1 runs in-process)
+    SIMULATION_PROCESSES = int(os.environ.get('SIMULATION_PROCESSES', 1))
+    # Threads used to recompute scenarios in a batch
+    EARNINGS_BATCH_WORKERS = int(os.environ.get('EARNINGS_BATCH_WORKERS', 4))
+    COMPUTE_API_MAX_SCENARIOS = int(os.environ.get('COMPUTE_API_MAX_SCENARIOS', 100))
+    AEF_BATCH_MAX_ROWS = int(os.environ.get('AEF_BATCH_MAX_ROWS', 10000))
+    # Default tornado perturbation, in percent of each AEF input
+    AEF_TORNADO_SPREAD = float(os.environ.get('AEF_TORNADO_SPREAD', 10.0))
+    # 'off', 'sampled' or 'full' audit of generated life care plan tables
+    LIFE_CARE_PLAN_VERIFY_LEVEL = os.environ.get('LIFE_CARE_PLAN_VERIFY_LEVEL', 'sampled')
+    # Growth and discount factor vectors kept by the shared factor cache
+    FACTOR_CACHE_SIZE = int(os.environ.get('FACTOR_CACHE_SIZE', 512))
     
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -23,6 +43,7 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    LIFE_CARE_PLAN_VERIFY_LEVEL = 'full'
 
 config = {
     'development': DevelopmentConfig,
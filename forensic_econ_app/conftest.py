@@ -0,0 +1,28 @@
+import pytest
+from datetime import datetime
+from forensic_econ_app import create_app
+from forensic_econ_app.models.models import db, User, Evaluee
+from forensic_econ_app.utils.result_cache import earnings_cache, healthcare_cache
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        earnings_cache.clear()
+        healthcare_cache.clear()
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def evaluee(app):
+    user = User(username='tester', email='tester@example.com')
+    user.set_password('secret')
+    db.session.add(user)
+    db.session.commit()
+    evaluee = Evaluee(user_id=user.id, first_name='Pat', last_name='Doe', state='NY',
+                      discount_rates=[4.0, 6.0], date_of_birth=datetime(1980, 3, 3))
+    db.session.add(evaluee)
+    db.session.commit()
+    return evaluee
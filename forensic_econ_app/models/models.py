@@ -6,6 +6,9 @@ import json
 import numpy as np
 from decimal import Decimal
 from typing import List
+from ..utils.annuity import growing_annuity_pv, qualifies_for_closed_form
+from ..utils.factor_cache import factor_vector
+from ..utils.numeric import float_to_cents, resolve_backend
 
 db = SQLAlchemy()
 
@@ -94,6 +97,8 @@ class EarningsScenario(db.Model):
     
     # Add relationship to offset wages
     offset_wages = db.relationship('OffsetWage', backref='scenario', lazy=True, cascade='all, delete-orphan')
+    wage_segments = db.relationship('WageSegment', backref='scenario', lazy=True, cascade='all, delete-orphan',
+                                    order_by='WageSegment.start_date')
 
 class OffsetWage(db.Model):
     """Model for storing offset wages for specific years in a scenario."""
@@ -104,6 +109,17 @@ class OffsetWage(db.Model):
     description = db.Column(db.String(200))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+class WageSegment(db.Model):
+    """Model for a wage base and growth rate that apply over part of a scenario's date range."""
+    id = db.Column(db.Integer, primary_key=True)
+    scenario_id = db.Column(db.Integer, db.ForeignKey('earnings_scenario.id'), nullable=False)
+    start_date = db.Column(db.DateTime, nullable=False)
+    end_date = db.Column(db.DateTime, nullable=False)
+    wage_base = db.Column(db.Numeric(10, 2), nullable=False)
+    growth_rate = db.Column(db.Numeric(10, 4), nullable=False)
+    description = db.Column(db.String(200))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
 class HealthcareScenario(db.Model):
     """Model for storing healthcare expense scenarios."""
     id = db.Column(db.Integer, primary_key=True)
@@ -287,11 +303,37 @@ class HouseholdServicesScenario(db.Model):
     evaluee = db.relationship('Evaluee', backref='household_services_scenarios', lazy=True)
     stages = db.relationship('HouseholdServiceStage', backref='scenario', lazy=True, cascade='all, delete-orphan')
     
-    def calculate_present_value(self):
-        """Calculate the present value of household services using the staged valuation model."""
+    def calculate_present_value(self, backend=None):
+        """
+        Calculate the present value of household services using the staged valuation model.
+
+        backend is 'float64' or 'decimal' (see utils.numeric); both agree to the cent.
+        """
         if not self.stages:
             return Decimal('0.00')
         
+        if not qualifies_for_closed_form(self.growth_rate, self.discount_rate):
+            return self._calculate_present_value_iterative()
+        
+        # Each stage restarts at local year 1: a growing annuity-immediate per stage
+        if resolve_backend(backend) == 'float64':
+            adjustment = float(self.area_wage_adjustment) * float(self.reduction_percentage)
+            total_pv = sum(
+                growing_annuity_pv(float(stage.annual_value) * adjustment, float(self.growth_rate),
+                                   float(self.discount_rate), stage.years)
+                for stage in self.stages
+            )
+            return float_to_cents(total_pv)
+        
+        total_pv = Decimal('0.0')
+        for stage in self.stages:
+            adjusted_value = stage.annual_value * self.area_wage_adjustment * self.reduction_percentage
+            total_pv += growing_annuity_pv(adjusted_value, self.growth_rate, self.discount_rate, stage.years)
+        
+        return total_pv.quantize(Decimal('0.01'))
+    
+    def _calculate_present_value_iterative(self):
+        """Year-by-year present value, used when the closed form does not apply."""
         total_pv = Decimal('0.0')
         
         # Sort stages by stage_number
@@ -344,23 +386,49 @@ class PensionScenario(db.Model):
     
     def calculate_present_value(self):
         """Calculate the present value of pension benefits."""
+        if qualifies_for_closed_form(self.growth_rate, self.discount_rate):
+            growth_rate = float(self.growth_rate)
+            discount_rate = float(self.discount_rate)
+            
+            if self.calculation_method == 'contributions':
+                # Contributions grow and are discounted from year 1 through retirement
+                annual_contribution = float(self.annual_contribution)
+                pv = growing_annuity_pv(annual_contribution * (1 + growth_rate), growth_rate,
+                                        discount_rate, self.years_to_retirement)
+                self.present_value = Decimal(str(pv))
+                return self.present_value
+            
+            elif self.calculation_method == 'payments':
+                # Payments start undiscounted at retirement age and run through life expectancy
+                pension_benefit = float(self.annual_pension_benefit)
+                periods = self.life_expectancy - self.retirement_age + 1
+                pv = growing_annuity_pv(pension_benefit, growth_rate, discount_rate, periods, due=True)
+                self.present_value = Decimal(str(pv))
+                return self.present_value
+        
+        return self._calculate_present_value_iterative()
+    
+    def _calculate_present_value_iterative(self):
+        """Year-by-year present value, used when the closed form does not apply."""
         if self.calculation_method == 'contributions':
-            years_array = np.arange(1, self.years_to_retirement + 1)
+            # Years 1 through retirement, dropping the year-zero factor
+            periods = max(self.years_to_retirement + 1, 0)
             annual_contribution = float(self.annual_contribution)
             growth_rate = float(self.growth_rate)
             discount_rate = float(self.discount_rate)
             
-            pv = np.sum((annual_contribution * (1 + growth_rate) ** years_array) / 
-                       (1 + discount_rate) ** years_array)
+            pv = np.sum((annual_contribution * factor_vector(growth_rate, 1, periods, 'growth')[1:]) / 
+                       factor_vector(discount_rate, 1, periods, 'growth')[1:])
         
         elif self.calculation_method == 'payments':
-            years_array = np.arange(self.retirement_age, self.life_expectancy + 1)
+            # Years since retirement, from zero through life expectancy
+            periods = max(self.life_expectancy - self.retirement_age + 1, 0)
             pension_benefit = float(self.annual_pension_benefit)
             growth_rate = float(self.growth_rate)
             discount_rate = float(self.discount_rate)
             
-            pv = np.sum((pension_benefit * (1 + growth_rate) ** (years_array - self.retirement_age)) / 
-                       (1 + discount_rate) ** (years_array - self.retirement_age))
+            pv = np.sum((pension_benefit * factor_vector(growth_rate, 1, periods, 'growth')) / 
+                       factor_vector(discount_rate, 1, periods, 'growth'))
         
         self.present_value = Decimal(str(pv))
         return self.present_value 
\ No newline at end of file
@@ -1,6 +1,9 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file
+from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file, jsonify, current_app
 from ..models.models import db, Evaluee
 from ..utils.calculations import calculate_aef
+from ..utils.aef_batch import read_aef_upload, aef_batch_table, aef_row_steps
+from ..utils.aef_tornado import TORNADO_FACTORS, tornado_bounds, aef_tornado
+from ..utils.result_cache import aef_batch_cache, input_fingerprint
 import os
 from tempfile import mkstemp
 import pandas as pd
@@ -119,4 +122,110 @@ def export_calculations(evaluee_id):
             if os.path.exists(temp_path):
                 os.remove(temp_path)
         except Exception:
-            pass 
\ No newline at end of file
+            pass 
+@bp.route('/aef/batch', methods=['GET', 'POST'])
+def batch():
+    """
+    Compute AEFs for a batch of inputs uploaded as CSV or JSON.
+
+    Takes a file upload (CSV with a header row, or a JSON array) or a JSON
+    body of input rows, with factors as fractions. The result table is
+    returned as JSON for JSON requests or ?format=json; step breakdowns are
+    fetched per row from batch_steps.
+    """
+    if request.method == 'GET':
+        return render_template('aef/batch.html', batch_id=None, table=None)
+
+    wants_json = request.is_json or request.args.get('format') == 'json'
+    try:
+        upload = request.files.get('file')
+        if upload is not None and upload.filename:
+            records = read_aef_upload(upload.read(), upload.filename)
+        else:
+            payload = request.get_json(silent=True)
+            records = payload.get('rows') if isinstance(payload, dict) else payload
+            if not isinstance(records, list):
+                raise ValueError('Upload a CSV or JSON file, or send a JSON array of AEF inputs')
+        if not records:
+            raise ValueError('The batch has no rows')
+        max_rows = current_app.config.get('AEF_BATCH_MAX_ROWS', 10000)
+        if len(records) > max_rows:
+            raise ValueError(f'At most {max_rows} rows can be computed per batch')
+        table, rows = aef_batch_table(records)
+    except (ValueError, UnicodeDecodeError) as e:
+        if wants_json:
+            return jsonify({'error': str(e)}), 400
+        flash(f'Error computing AEF batch: {str(e)}')
+        return redirect(url_for('aef.batch'))
+
+    batch_id = input_fingerprint(records)
+    aef_batch_cache.set(batch_id, rows)
+
+    if wants_json:
+        return jsonify({
+            'batch_id': batch_id,
+            'column_names': list(table.columns),
+            'rows': table.astype(object).where(table.notna(), None).to_dict('records')
+        })
+    return render_template('aef/batch.html', batch_id=batch_id, table=table)
+
+@bp.route('/aef/batch/<batch_id>/rows/<int:row>/steps')
+def batch_steps(batch_id, row):
+    """Step-by-step AEF breakdown of one row (1-based) of a computed batch."""
+    rows = aef_batch_cache.get(batch_id)
+    if rows is None:
+        return jsonify({'error': 'Batch not found; upload it again'}), 404
+    if row < 1 or row > len(rows) or rows[row - 1] is None:
+        return jsonify({'error': f'Row {row} has no valid AEF inputs'}), 404
+    try:
+        steps = aef_row_steps(rows[row - 1])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'row': row, 'steps': steps.to_dict('records')})
+
+def _evaluee_aef_inputs(evaluee):
+    """The evaluee's stored AEF inputs as floats."""
+    missing = [field for field in ('gross_earnings_base', 'worklife_adjustment', 'unemployment_factor',
+                                   'fringe_benefit', 'tax_liability') if getattr(evaluee, field) is None]
+    if missing:
+        raise ValueError('Calculate the AEF before running a tornado analysis')
+    return {
+        'gross_earnings_base': float(evaluee.gross_earnings_base),
+        'worklife_adjustment': float(evaluee.worklife_adjustment),
+        'unemployment_factor': float(evaluee.unemployment_factor),
+        'fringe_benefit': float(evaluee.fringe_benefit),
+        'tax_liability': float(evaluee.tax_liability),
+        'personal_percentage': float(evaluee.personal_percentage or 0),
+        'wrongful_death': bool(evaluee.wrongful_death)
+    }
+
+@bp.route('/aef/<int:evaluee_id>/tornado')
+def tornado(evaluee_id):
+    """
+    Rank the AEF inputs by how far each one moves the AEF.
+
+    Every input is perturbed by ?spread= percent of its value (default
+    AEF_TORNADO_SPREAD), or between explicit <input>_low and <input>_high
+    percentages. Returns JSON with ?format=json.
+    """
+    evaluee = Evaluee.query.get_or_404(evaluee_id)
+    wants_json = request.args.get('format') == 'json'
+    spread = request.args.get('spread', current_app.config.get('AEF_TORNADO_SPREAD', 10.0), type=float)
+    try:
+        inputs = _evaluee_aef_inputs(evaluee)
+        overrides = {}
+        for field in TORNADO_FACTORS:
+            low = request.args.get(f'{field}_low', type=float)
+            high = request.args.get(f'{field}_high', type=float)
+            if low is not None and high is not None:
+                overrides[field] = (low / 100.0, high / 100.0)
+        result = aef_tornado(inputs, tornado_bounds(inputs, spread / 100.0, overrides))
+    except ValueError as e:
+        if wants_json:
+            return jsonify({'error': str(e)}), 400
+        flash(f'Error running tornado analysis: {str(e)}')
+        return redirect(url_for('aef.form', evaluee_id=evaluee_id))
+
+    if wants_json:
+        return jsonify({'spread': spread, **result})
+    return render_template('aef/tornado.html', evaluee=evaluee, evaluee_id=evaluee_id, spread=spread, result=result)
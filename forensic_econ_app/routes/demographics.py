@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from ..models.models import db, Evaluee
+from ..utils.result_cache import invalidate_earnings_scenarios
 from datetime import datetime
 
 bp = Blueprint('demographics', __name__)
@@ -17,6 +18,7 @@ def form(evaluee_id):
         
         try:
             db.session.commit()
+            invalidate_earnings_scenarios(scenario.id for scenario in evaluee.earnings_scenarios)
             flash('Demographics updated successfully.')
             return redirect(url_for('evaluee.view', evaluee_id=evaluee_id))
         except Exception as e:
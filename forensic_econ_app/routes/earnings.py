@@ -1,13 +1,119 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file, jsonify
-from ..models.models import db, Evaluee, EarningsScenario, OffsetWage
-from ..utils.calculations import compute_earnings_table, export_to_excel
+from flask import (
+    Blueprint, render_template, request, redirect, url_for, flash, send_file, jsonify, current_app,
+    Response, stream_with_context
+)
+from flask_login import login_required, current_user
+from ..models.models import db, Evaluee, EarningsScenario, OffsetWage, WageSegment
+from ..utils.calculations import (
+    compute_earnings_state, earnings_state_results, earnings_state_columns, apply_offset_wage_change, iter_earnings_rows,
+    compute_earnings_sensitivity, present_value_column, export_to_excel
+)
+from ..utils.earnings_engine import build_year_grid
+from ..utils.simulation import simulate_earnings_losses
+from ..utils.earnings_batch import (
+    evaluee_inputs, scenario_inputs, scenario_cache_key, cached_earnings_state, recompute_earnings_scenarios
+)
+from ..utils.result_cache import earnings_cache, invalidate_earnings_scenarios
+from ..utils.result_writer import persist_results
+from ..utils.what_if import earnings_what_if
 from datetime import datetime
 from decimal import Decimal
+import csv
+import io
 import os
+import numpy as np
+import pandas as pd
 from tempfile import mkstemp
 
 bp = Blueprint('earnings', __name__)
 
+# Upper bound on the number of rates per axis of the sensitivity grid
+MAX_GRID_STEPS = 101
+
+def _scenario_inputs(scenario, evaluee):
+    """Collect every input that determines a scenario's earnings table."""
+    return scenario_inputs(scenario, evaluee_inputs(evaluee))
+
+def _cache_key(scenario, evaluee):
+    """Cache key for a scenario's earnings state under its current inputs."""
+    return scenario_cache_key(scenario.id, _scenario_inputs(scenario, evaluee))
+
+def _compute_scenario_table(scenario, evaluee):
+    """Return the earnings table for a scenario, reusing the cached result when inputs are unchanged."""
+    inputs = _scenario_inputs(scenario, evaluee)
+    try:
+        state = cached_earnings_state(scenario_cache_key(scenario.id, inputs), inputs)
+    except (ValueError, TypeError) as e:
+        print(f"Error computing earnings table: {str(e)}")
+        return pd.DataFrame(), {}, Decimal("0")
+    return earnings_state_results(state)
+
+def _patch_cached_offset(scenario, old_key, year):
+    """
+    Carry a scenario's cached earnings state over a committed change to one year's offset wage.
+
+    The cached state for the previous inputs is patched for that year using the
+    stored offset (if any) and saved under the new inputs; without a cached
+    state the scenario is simply invalidated and recomputed on the next view.
+    """
+    state = earnings_cache.get(old_key)
+    invalidate_earnings_scenarios([scenario.id])
+    if state is None:
+        return
+    amount = next((float(ow.amount) for ow in scenario.offset_wages if ow.year == year), None)
+    try:
+        state = apply_offset_wage_change(state, year, amount)
+    except (ValueError, TypeError):
+        return
+    earnings_cache.set(_cache_key(scenario, scenario.evaluee), state)
+
+def _recompute_response(scenarios, redirect_to):
+    """Recompute scenarios in one batch and report the outcome as JSON or a flash message."""
+    try:
+        summaries = recompute_earnings_scenarios(
+            scenarios, workers=current_app.config.get('EARNINGS_BATCH_WORKERS', 4)
+        )
+    except Exception as e:
+        if request.args.get('format') == 'json':
+            return jsonify({'error': str(e)}), 500
+        flash(f'Error recomputing scenarios: {str(e)}')
+        return redirect(redirect_to)
+    
+    failed = [s for s in summaries if 'error' in s]
+    if request.args.get('format') == 'json':
+        return jsonify({
+            'scenarios': summaries,
+            'recomputed': len(summaries) - len(failed),
+            'changed': sum(1 for s in summaries if s.get('changed')),
+            'failed': len(failed)
+        })
+    flash(f'Recomputed {len(summaries) - len(failed)} earnings scenario(s).')
+    for summary in failed:
+        flash(f"Could not recompute {summary['scenario_name']}: {summary['error']}")
+    return redirect(redirect_to)
+
+@bp.route('/earnings/<int:evaluee_id>/recompute', methods=['POST'])
+@login_required
+def recompute_evaluee(evaluee_id):
+    """Recompute and store the results of every earnings scenario of an evaluee."""
+    evaluee = Evaluee.query.get_or_404(evaluee_id)
+    if evaluee.user_id != current_user.id:
+        if request.args.get('format') == 'json':
+            return jsonify({'error': 'Access denied'}), 403
+        flash('Access denied.')
+        return redirect(url_for('evaluee.index'))
+    return _recompute_response(evaluee.earnings_scenarios, url_for('evaluee.view', evaluee_id=evaluee_id))
+
+@bp.route('/earnings/recompute', methods=['POST'])
+@login_required
+def recompute_caseload():
+    """Recompute and store the results of every earnings scenario in the current user's caseload."""
+    scenarios = (EarningsScenario.query.join(Evaluee)
+                 .filter(Evaluee.user_id == current_user.id)
+                 .order_by(EarningsScenario.evaluee_id, EarningsScenario.id)
+                 .all())
+    return _recompute_response(scenarios, url_for('evaluee.index'))
+
 @bp.route('/earnings/<int:evaluee_id>', methods=['GET', 'POST'])
 def form(evaluee_id):
     evaluee = Evaluee.query.get_or_404(evaluee_id)
@@ -68,6 +174,8 @@ def add_offset_wage(evaluee_id, scenario_id):
             flash('Offset year must be within the scenario date range.')
             return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
         
+        old_key = _cache_key(scenario, scenario.evaluee)
+        
         # Check if offset wage already exists for this year
         existing_offset = OffsetWage.query.filter_by(scenario_id=scenario_id, year=year).first()
         if existing_offset:
@@ -85,6 +193,7 @@ def add_offset_wage(evaluee_id, scenario_id):
             flash(f'Added new offset wage for year {year}.')
         
         db.session.commit()
+        _patch_cached_offset(scenario, old_key, year)
         
         return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
     
@@ -100,14 +209,81 @@ def delete_offset_wage(evaluee_id, scenario_id, offset_id):
     if offset_wage.scenario_id != scenario_id:
         return jsonify({'error': 'Invalid offset wage for this scenario'}), 400
     
+    scenario = offset_wage.scenario
+    year = offset_wage.year
+    old_key = _cache_key(scenario, scenario.evaluee)
+    
     try:
         db.session.delete(offset_wage)
         db.session.commit()
+        _patch_cached_offset(scenario, old_key, year)
         return jsonify({'message': 'Offset wage deleted successfully'})
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/segment', methods=['POST'])
+def add_wage_segment(evaluee_id, scenario_id):
+    """Add a wage segment with its own wage base and growth rate."""
+    scenario = EarningsScenario.query.get_or_404(scenario_id)
+    
+    if scenario.evaluee_id != evaluee_id:
+        return jsonify({'error': 'Invalid scenario for this evaluee'}), 400
+    
+    try:
+        start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d')
+        end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d')
+        wage_base = float(request.form.get('wage_base'))
+        growth_rate = float(request.form.get('growth_rate', 0)) / 100  # Entered as a percentage
+        
+        if start_date > end_date:
+            flash('Segment start date cannot be after its end date.')
+            return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+        if start_date < scenario.start_date or end_date > scenario.end_date:
+            flash('Wage segment must be within the scenario date range.')
+            return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+        if any(start_date <= seg.end_date and seg.start_date <= end_date for seg in scenario.wage_segments):
+            flash('Wage segments cannot overlap.')
+            return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+        if wage_base < 0:
+            flash('Segment wage base cannot be negative.')
+            return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+        
+        db.session.add(WageSegment(
+            scenario_id=scenario_id,
+            start_date=start_date,
+            end_date=end_date,
+            wage_base=wage_base,
+            growth_rate=growth_rate,
+            description=request.form.get('description', '')
+        ))
+        db.session.commit()
+        invalidate_earnings_scenarios([scenario_id])
+        flash('Added wage segment.')
+        return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+    
+    except (ValueError, TypeError) as e:
+        db.session.rollback()
+        flash(f'Error adding wage segment: {str(e)}')
+        return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/segment/<int:segment_id>', methods=['DELETE'])
+def delete_wage_segment(evaluee_id, scenario_id, segment_id):
+    """Delete a wage segment."""
+    segment = WageSegment.query.get_or_404(segment_id)
+    
+    if segment.scenario_id != scenario_id:
+        return jsonify({'error': 'Invalid wage segment for this scenario'}), 400
+    
+    try:
+        db.session.delete(segment)
+        db.session.commit()
+        invalidate_earnings_scenarios([scenario_id])
+        return jsonify({'message': 'Wage segment deleted successfully'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>')
 def view_scenario(evaluee_id, scenario_id):
     """View earnings scenario with offset wages."""
@@ -118,30 +294,183 @@ def view_scenario(evaluee_id, scenario_id):
         flash('Invalid scenario for this evaluee.')
         return redirect(url_for('earnings.form', evaluee_id=evaluee_id))
     
-    # Create dictionary of offset wages by year
-    offset_wages = {ow.year: float(ow.amount) for ow in scenario.offset_wages}
-    
-    raw_table, display_table, total_pv, total_loss = compute_earnings_table(
-        scenario.start_date,
-        scenario.end_date,
-        float(scenario.wage_base),
-        float(scenario.residual_base),
-        float(scenario.growth_rate),
-        float(evaluee.discount_rates[0] / 100) if evaluee.uses_discounting else None,
-        float(scenario.adjustment_factor),
-        evaluee.date_of_birth,
-        offset_wages=offset_wages
-    )
+    raw_table, pv_totals, total_loss = _compute_scenario_table(scenario, evaluee)
     
-    scenario.present_value = total_pv
-    scenario.total_loss = total_loss
-    db.session.commit()
+    # The first discount rate remains the scenario's headline present value
+    persist_results(
+        scenario,
+        present_value=next(iter(pv_totals.values()), total_loss),
+        total_loss=total_loss
+    )
     
     return render_template('earnings/view_scenario.html', 
                          evaluee=evaluee, 
                          scenario=scenario, 
-                         earnings_table=display_table,
-                         raw_earnings_table=raw_table,
+                         earnings_rows=raw_table.to_dict('records'),
+                         pv_columns=[present_value_column(rate) for rate in pv_totals],
+                         pv_totals=list(pv_totals.values()),
+                         evaluee_id=evaluee_id)
+
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/what-if')
+def what_if(evaluee_id, scenario_id):
+    """
+    Totals of a scenario with its growth rate, discount rate or adjustment factor changed.
+
+    Takes growth_rate and discount_rate as decimals and adjustment_factor in
+    percent as query parameters; omitted ones keep the scenario's values.
+    Reuses the state cached under the scenario's current inputs, so only the
+    inputs are read from the database when the scenario was viewed before.
+    """
+    scenario = EarningsScenario.query.get_or_404(scenario_id)
+    if scenario.evaluee_id != evaluee_id:
+        return jsonify({'error': 'Invalid scenario for this evaluee'}), 400
+    inputs = _scenario_inputs(scenario, scenario.evaluee)
+    try:
+        state = cached_earnings_state(scenario_cache_key(scenario_id, inputs), inputs)
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        result = earnings_what_if(
+            state,
+            growth_rate=request.args.get('growth_rate', type=float),
+            discount_rate=request.args.get('discount_rate', type=float),
+            adjustment_factor=request.args.get('adjustment_factor', type=float)
+        )
+    except (ValueError, OverflowError) as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'scenario_id': scenario_id, **result})
+
+def _rate_axis(prefix, default_min, default_max, default_steps):
+    """Parse a rate axis (percent min/max and a step count) from the query string as decimals."""
+    low = request.args.get(f'{prefix}_min', default_min, type=float)
+    high = request.args.get(f'{prefix}_max', default_max, type=float)
+    steps = request.args.get(f'{prefix}_steps', default_steps, type=int)
+    if steps < 1 or steps > MAX_GRID_STEPS:
+        raise ValueError(f'Number of {prefix} rates must be between 1 and {MAX_GRID_STEPS}')
+    if low > high:
+        raise ValueError(f'Minimum {prefix} rate cannot exceed the maximum')
+    return [round(rate, 10) for rate in (np.linspace(low, high, steps) / 100).tolist()]
+
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/sensitivity')
+def sensitivity(evaluee_id, scenario_id):
+    """Present value of a scenario across a grid of growth and discount rates."""
+    evaluee = Evaluee.query.get_or_404(evaluee_id)
+    scenario = EarningsScenario.query.get_or_404(scenario_id)
+    wants_json = request.args.get('format') == 'json'
+    
+    if scenario.evaluee_id != evaluee_id:
+        if wants_json:
+            return jsonify({'error': 'Invalid scenario for this evaluee'}), 400
+        flash('Invalid scenario for this evaluee.')
+        return redirect(url_for('earnings.form', evaluee_id=evaluee_id))
+    
+    growth = float(scenario.growth_rate) * 100
+    try:
+        growth_rates = _rate_axis('growth', growth - 2.0, growth + 2.0, 9)
+        discount_rates = _rate_axis('discount', 1.0, 7.0, 13)
+        table = compute_earnings_sensitivity(
+            scenario.start_date,
+            scenario.end_date,
+            float(scenario.wage_base),
+            float(scenario.residual_base),
+            growth_rates,
+            discount_rates,
+            float(scenario.adjustment_factor),
+            offset_wages={ow.year: float(ow.amount) for ow in scenario.offset_wages},
+            wage_segments=_scenario_inputs(scenario, evaluee)['wage_segments']
+        )
+    except (ValueError, TypeError) as e:
+        if wants_json:
+            return jsonify({'error': str(e)}), 400
+        flash(f'Error computing sensitivity grid: {str(e)}')
+        return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+    
+    if wants_json:
+        return jsonify({
+            'growth_rates': growth_rates,
+            'discount_rates': discount_rates,
+            'present_values': table.values.tolist()
+        })
+    
+    return render_template('earnings/sensitivity.html',
+                         evaluee=evaluee,
+                         scenario=scenario,
+                         table=table,
+                         evaluee_id=evaluee_id)
+
+def _distribution_spec(prefix, default_dist, default_mean, default_sd):
+    """Parse a distribution (in percent) from the query string into a spec of decimals, or None if disabled."""
+    dist = request.args.get(f'{prefix}_dist', default_dist)
+    if not dist:
+        return None
+    if dist == 'normal':
+        return {
+            'dist': 'normal',
+            'mean': request.args.get(f'{prefix}_mean', default_mean, type=float) / 100,
+            'sd': request.args.get(f'{prefix}_sd', default_sd, type=float) / 100
+        }
+    if dist == 'uniform':
+        low = request.args.get(f'{prefix}_low', default_mean - default_sd, type=float)
+        high = request.args.get(f'{prefix}_high', default_mean + default_sd, type=float)
+        if low > high:
+            raise ValueError(f'Lower {prefix} bound cannot exceed the upper bound')
+        return {'dist': 'uniform', 'low': low / 100, 'high': high / 100}
+    raise ValueError(f"Unsupported {prefix} distribution: '{dist}'")
+
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/simulate')
+def simulate(evaluee_id, scenario_id):
+    """Monte Carlo percentiles of a scenario's total loss and present value."""
+    evaluee = Evaluee.query.get_or_404(evaluee_id)
+    scenario = EarningsScenario.query.get_or_404(scenario_id)
+    wants_json = request.args.get('format') == 'json'
+
+    if scenario.evaluee_id != evaluee_id:
+        if wants_json:
+            return jsonify({'error': 'Invalid scenario for this evaluee'}), 400
+        flash('Invalid scenario for this evaluee.')
+        return redirect(url_for('earnings.form', evaluee_id=evaluee_id))
+
+    discount = float(evaluee.discount_rates[0]) if evaluee.discount_rates else 4.0
+    max_paths = current_app.config.get('SIMULATION_MAX_PATHS', 100000)
+    default_paths = min(current_app.config.get('SIMULATION_DEFAULT_PATHS', 10000), max_paths)
+    try:
+        n_paths = request.args.get('paths', default_paths, type=int)
+        if n_paths < 1 or n_paths > max_paths:
+            raise ValueError(f'Number of paths must be between 1 and {max_paths}')
+        specs = {
+            'growth_spec': _distribution_spec('growth', 'normal', float(scenario.growth_rate) * 100, 1.0),
+            'discount_spec': _distribution_spec('discount', 'normal', discount, 1.0),
+            'worklife_spec': _distribution_spec('worklife', '', 100.0, 5.0),
+            'unemployment_spec': _distribution_spec('unemployment', '', 4.0, 1.0)
+        }
+        result = simulate_earnings_losses(
+            build_year_grid(scenario.start_date, scenario.end_date),
+            float(scenario.wage_base),
+            float(scenario.residual_base),
+            float(scenario.adjustment_factor),
+            offset_wages={ow.year: float(ow.amount) for ow in scenario.offset_wages},
+            wage_segments=_scenario_inputs(scenario, evaluee)['wage_segments'],
+            n_paths=n_paths,
+            seed=request.args.get('seed', type=int),
+            processes=current_app.config.get('SIMULATION_PROCESSES', 1),
+            **specs
+        )
+    except (ValueError, TypeError) as e:
+        if wants_json:
+            return jsonify({'error': str(e)}), 400
+        flash(f'Error running simulation: {str(e)}')
+        return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+
+    if wants_json:
+        return jsonify({**result, **specs})
+
+    return render_template('earnings/simulate.html',
+                         evaluee=evaluee,
+                         scenario=scenario,
+                         result=result,
+                         specs=specs,
+                         max_paths=max_paths,
                          evaluee_id=evaluee_id)
 
 @bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/delete', methods=['POST'])
@@ -155,6 +484,7 @@ def delete_scenario(evaluee_id, scenario_id):
     try:
         db.session.delete(scenario)
         db.session.commit()
+        invalidate_earnings_scenarios([scenario_id])
         flash('Earnings scenario deleted successfully.')
     except Exception as e:
         db.session.rollback()
@@ -178,18 +508,8 @@ def export_scenario(evaluee_id):
         return redirect(url_for('earnings.form', evaluee_id=evaluee_id))
     
     try:
-        # Compute earnings table
-        raw_table, _, _, _ = compute_earnings_table(
-            scenario.start_date,
-            scenario.end_date,
-            float(scenario.wage_base),
-            float(scenario.residual_base),
-            float(scenario.growth_rate),
-            float(evaluee.discount_rates[0] / 100) if evaluee.uses_discounting else None,
-            float(scenario.adjustment_factor),
-            evaluee.date_of_birth,
-            include_discounting=evaluee.uses_discounting
-        )
+        # Compute earnings table at every discount rate
+        raw_table, _, _ = _compute_scenario_table(scenario, evaluee)
         
         # Create temporary file for Excel export
         temp_dir = os.path.dirname(os.path.abspath(__file__))
@@ -217,6 +537,159 @@ def export_scenario(evaluee_id):
         except Exception:
             pass
 
+@bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/export.csv')
+def export_csv(evaluee_id, scenario_id):
+    """Stream the earnings table as CSV, sending each row as soon as it is computed.
+
+    ?granularity=monthly exports one row per calendar month instead of per year.
+    """
+    evaluee = Evaluee.query.get_or_404(evaluee_id)
+    scenario = EarningsScenario.query.get_or_404(scenario_id)
+    
+    if scenario.evaluee_id != evaluee_id:
+        flash('Invalid scenario for this evaluee.')
+        return redirect(url_for('earnings.form', evaluee_id=evaluee_id))
+    
+    try:
+        rows = iter_earnings_rows(
+            **_scenario_inputs(scenario, evaluee),
+            granularity=request.args.get('granularity', 'annual'),
+            formatted=False
+        )
+    except (ValueError, TypeError) as e:
+        flash(f'Error exporting scenario: {str(e)}')
+        return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
+    
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        totals = {}
+        for index, (raw_row, _, totals) in enumerate(rows):
+            if index == 0:
+                columns = list(raw_row)
+                writer.writerow(columns)
+            writer.writerow(raw_row.values())
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if totals:
+            writer.writerow(['Totals'] + [totals.get(col, '') for col in columns[1:]])
+            yield buffer.getvalue()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename=earnings_scenario_{scenario.id}.csv'}
+    )
+
+def _parse_date(value, field):
+    """Parse an ISO (YYYY-MM-DD) date from a compute request."""
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Invalid date for {field}: '{value}'")
+
+def _compute_request_inputs(item):
+    """Earnings inputs for one compute request item: a stored scenario_id or explicit parameters."""
+    if not isinstance(item, dict):
+        raise ValueError('Each scenario must be a JSON object')
+    
+    if 'scenario_id' in item:
+        scenario = db.session.get(EarningsScenario, int(item['scenario_id']))
+        if scenario is None:
+            raise LookupError(f"Scenario {item['scenario_id']} not found")
+        if scenario.evaluee.user_id != current_user.id:
+            raise PermissionError(f"Access denied to scenario {scenario.id}")
+        inputs = _scenario_inputs(scenario, scenario.evaluee)
+        key_id = scenario.id
+    else:
+        missing = [f for f in ('start_date', 'end_date', 'wage_base') if f not in item]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        inputs = {
+            'start_date': _parse_date(item['start_date'], 'start_date'),
+            'end_date': _parse_date(item['end_date'], 'end_date'),
+            'wage_base': float(item['wage_base']),
+            'residual_base': float(item.get('residual_base', 0)),
+            'growth_rate': float(item.get('growth_rate', 0)),
+            'adjustment_factor': float(item.get('adjustment_factor', 100)),
+            'discount_rates': [float(r) for r in item.get('discount_rates', [])],
+            'date_of_birth': _parse_date(item.get('date_of_birth'), 'date_of_birth'),
+            'include_discounting': bool(item.get('include_discounting', True)),
+            'offset_wages': {int(year): float(amount) for year, amount in item.get('offset_wages', {}).items()},
+            'wage_segments': [
+                {
+                    'start_date': _parse_date(seg.get('start_date'), 'wage segment start_date'),
+                    'end_date': _parse_date(seg.get('end_date'), 'wage segment end_date'),
+                    'wage_base': float(seg['wage_base']),
+                    'growth_rate': float(seg.get('growth_rate', 0))
+                }
+                for seg in item.get('wage_segments', [])
+            ]
+        }
+        key_id = None
+    
+    if item.get('granularity', 'annual') != 'annual':
+        inputs['granularity'] = item['granularity']
+    return key_id, inputs
+
+@bp.route('/earnings/compute', methods=['POST'])
+@login_required
+def compute_api():
+    """
+    Compute earnings schedules as JSON, without rendering templates or display tables.
+    
+    The body is one scenario, a list of scenarios or {"scenarios": [...]}. Each
+    scenario is either {"scenario_id": id} for a stored scenario or explicit
+    parameters (ISO dates, decimal rates, discount_rates as a list). Results are
+    returned in request order with one array per column; a stored scenario of
+    another user's evaluee gets an error entry.
+    """
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict) and 'scenarios' in payload:
+        payload = payload['scenarios']
+    items = payload if isinstance(payload, list) else [payload]
+    if payload is None or not items:
+        return jsonify({'error': 'Request body must be a JSON scenario or list of scenarios'}), 400
+    max_items = current_app.config.get('COMPUTE_API_MAX_SCENARIOS', 100)
+    if len(items) > max_items:
+        return jsonify({'error': f'At most {max_items} scenarios can be computed per request'}), 400
+    
+    results = []
+    for item in items:
+        try:
+            key_id, inputs = _compute_request_inputs(item)
+            if key_id is not None:
+                state = cached_earnings_state(scenario_cache_key(key_id, inputs), inputs)
+            else:
+                state = compute_earnings_state(**inputs)
+        except (LookupError, PermissionError) as e:
+            results.append({'error': str(e)})
+            continue
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            results.append({'error': f'Invalid scenario: {str(e)}'})
+            continue
+        
+        columns = earnings_state_columns(state)
+        result = {
+            # jsonify sorts object keys, so the table's column order is sent separately
+            'column_names': list(columns),
+            'columns': columns,
+            'totals': {
+                'loss': float(state['schedule']['total_loss']),
+                'present_value': {
+                    present_value_column(rate): float(total) for rate, total in zip(state['rates'], state['pv_totals'])
+                }
+            }
+        }
+        if key_id is not None:
+            result['scenario_id'] = key_id
+        results.append(result)
+    
+    return jsonify({'results': results})
+
 @bp.route('/earnings/<int:evaluee_id>/scenario/<int:scenario_id>/duplicate', methods=['POST'])
 def duplicate_scenario(evaluee_id, scenario_id):
     """Duplicate an existing scenario with a new name."""
@@ -252,6 +725,16 @@ def duplicate_scenario(evaluee_id, scenario_id):
             )
             db.session.add(new_offset)
         
+        for segment in original_scenario.wage_segments:
+            db.session.add(WageSegment(
+                scenario_id=new_scenario.id,
+                start_date=segment.start_date,
+                end_date=segment.end_date,
+                wage_base=segment.wage_base,
+                growth_rate=segment.growth_rate,
+                description=segment.description
+            ))
+        
         db.session.commit()
         flash('Scenario duplicated successfully.')
         return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=new_scenario.id))
@@ -289,6 +772,7 @@ def edit_scenario(evaluee_id, scenario_id):
             scenario.adjustment_factor = float(request.form.get('adjustment_factor', 100))
             
             db.session.commit()
+            invalidate_earnings_scenarios([scenario_id])
             flash('Scenario updated successfully.')
             return redirect(url_for('earnings.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
         except (ValueError, TypeError) as e:
@@ -4,6 +4,7 @@ from flask import (
 )
 from flask_login import login_required, current_user
 from ..models.models import db, Evaluee
+from ..utils.result_cache import invalidate_earnings_scenarios
 from datetime import timedelta
 
 bp = Blueprint('evaluee', __name__)
@@ -103,6 +104,8 @@ def edit(evaluee_id):
         
         try:
             db.session.commit()
+            # Discount rates feed every earnings table for this evaluee
+            invalidate_earnings_scenarios(scenario.id for scenario in evaluee.earnings_scenarios)
             flash('Evaluee updated successfully.')
             return redirect(url_for('evaluee.view', evaluee_id=evaluee_id))
         except Exception as e:
@@ -123,8 +126,10 @@ def delete(evaluee_id):
         return redirect(url_for('evaluee.index'))
     
     try:
+        scenario_ids = [scenario.id for scenario in evaluee.earnings_scenarios]
         db.session.delete(evaluee)
         db.session.commit()
+        invalidate_earnings_scenarios(scenario_ids)
         flash('Evaluee deleted successfully.')
     except Exception as e:
         current_app.logger.error(f'Error deleting evaluee: {str(e)}')
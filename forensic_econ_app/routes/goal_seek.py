@@ -0,0 +1,78 @@
+from flask import Blueprint, request, jsonify, flash, redirect, url_for, current_app
+from flask_login import login_required, current_user
+from ..models.models import EarningsScenario, HouseholdServicesScenario, PensionScenario
+from ..utils.earnings_batch import evaluee_inputs, scenario_inputs
+from ..utils.goal_seek import (
+    PARAMETERS, TargetNotReachableError, solve, earnings_evaluator, household_evaluator, pension_evaluator
+)
+
+bp = Blueprint('goal_seek', __name__)
+
+MODELS = {
+    'earnings': EarningsScenario,
+    'household': HouseholdServicesScenario,
+    'pension': PensionScenario
+}
+
+# Scenario pages that form submissions return to
+VIEW_ENDPOINTS = {
+    'earnings': 'earnings.view_scenario',
+    'household': 'household.view_scenario',
+    'pension': 'pension.view_scenario'
+}
+
+def _scenario_url(model, scenario):
+    """Page a form submission returns to: the scenario's own page, or its evaluee's when that is not served."""
+    endpoint = VIEW_ENDPOINTS[model]
+    if endpoint not in current_app.view_functions:
+        return url_for('evaluee.view', evaluee_id=scenario.evaluee_id)
+    return url_for(endpoint, evaluee_id=scenario.evaluee_id, scenario_id=scenario.id)
+
+def _evaluator(model, scenario, parameter):
+    """Present value function of the free parameter for a stored scenario."""
+    if model == 'earnings':
+        return earnings_evaluator(scenario_inputs(scenario, evaluee_inputs(scenario.evaluee)), parameter)
+    if model == 'household':
+        return household_evaluator(scenario, parameter)
+    return pension_evaluator(scenario, parameter)
+
+@bp.route('/goal-seek/<model>/<int:scenario_id>', methods=['POST'])
+@login_required
+def solve_scenario(model, scenario_id):
+    """
+    Solve for the parameter value that makes a scenario's present value equal a target.
+
+    Takes target and parameter (plus optional lower/upper bounds) as JSON or
+    form fields; rates are decimals. The stored scenario is not changed. A form
+    submission gets its result or error flashed on the scenario page.
+    """
+    if model not in MODELS:
+        return jsonify({'error': f"Unknown model '{model}'; expected one of {', '.join(MODELS)}"}), 404
+    scenario = MODELS[model].query.get_or_404(scenario_id)
+    if scenario.evaluee.user_id != current_user.id:
+        return jsonify({'error': 'Access denied'}), 403
+
+    from_form = not request.is_json
+    data = request.form if from_form else (request.get_json(silent=True) or {})
+    try:
+        parameter = data.get('parameter')
+        target = float(data.get('target'))
+        evaluate = _evaluator(model, scenario, parameter)
+        result = solve(
+            evaluate,
+            target,
+            kind=PARAMETERS[model][parameter],
+            lower=data.get('lower'),
+            upper=data.get('upper')
+        )
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
+        if not from_form:
+            return jsonify({'error': str(e)}), 400
+        # An unreachable target already reads as a plain sentence
+        flash(str(e) if isinstance(e, TargetNotReachableError) else f'Error in goal seek: {str(e)}')
+        return redirect(_scenario_url(model, scenario))
+
+    if from_form:
+        flash(f"Goal seek: {parameter} = {result['value']:.6g} gives a present value of ${result['present_value']:,.2f}.")
+        return redirect(_scenario_url(model, scenario))
+    return jsonify({'model': model, 'scenario_id': scenario_id, 'parameter': parameter, **result})
@@ -1,8 +1,14 @@
-from flask import Blueprint
+from flask import Blueprint, jsonify
+from ..utils.factor_cache import factor_cache_info
 
 bp = Blueprint('health', __name__)
 
 @bp.route('/health')
 def health_check():
     """Health check endpoint."""
-    return 'healthy', 200 
\ No newline at end of file
+    return 'healthy', 200
+
+@bp.route('/health/factor-cache')
+def factor_cache_stats():
+    """Hit and miss counters of the shared factor cache, for sizing FACTOR_CACHE_SIZE."""
+    return jsonify(factor_cache_info())
@@ -8,23 +8,93 @@ import os
 from tempfile import NamedTemporaryFile
 from flask_login import login_required, current_user
 from ..utils.life_care_plan import generate_life_care_plan_table
+from ..utils.date_math import age_at
+from ..utils.result_cache import healthcare_cache, input_fingerprint, invalidate_healthcare_scenarios
+from ..utils.factor_cache import factor_vector
+from ..utils.what_if import effective_medical_rates, medical_cost_vectors, medical_what_if
 from openpyxl.utils import get_column_letter
 
 healthcare = Blueprint('healthcare', __name__)
 
+def _scenario_growth_rate(scenario):
+    """Scenario growth (inflation) rate for its growth method."""
+    if scenario.growth_method == "CPI":
+        return CPIRate.get_rate("CPI") or Decimal('0.03')
+    elif scenario.growth_method == "PCE":
+        return CPIRate.get_rate("PCE") or Decimal('0.025')
+    elif scenario.growth_method == "Medical_CPI":
+        return CPIRate.get_rate("Medical_CPI") or Decimal('0.035')
+    return scenario.growth_rate_custom
+
+def _resolved_item(item, projection_years):
+    """A medical item's inputs with defaults applied; growth_rate is None when the scenario rate applies."""
+    return {
+        "annual_cost": float(item.annual_cost) if item.annual_cost is not None else 0.0,
+        "growth_rate": float(item.growth_rate) if item.growth_rate is not None else None,
+        "duration_years": int(item.duration_years) if item.duration_years else projection_years,
+        "start_year": int(item.start_year) if item.start_year is not None else 1,
+        "interval_years": int(item.interval_years) if item.interval_years is not None else 1,
+        "is_one_time": bool(item.is_one_time)
+    }
+
+def _years_before_projection(resolved):
+    """Occurrence years of a resolved item that fall before projection year 1 and are left out."""
+    start_year = resolved["start_year"]
+    last_year = min(start_year + (1 if resolved["is_one_time"] else resolved["duration_years"]), 1)
+    return list(range(start_year, last_year, resolved["interval_years"]))
+
+def _excluded_occurrences(scenario):
+    """Items with occurrences before projection year 1, with those years, so results can flag them."""
+    excluded = []
+    for item in scenario.medical_items:
+        try:
+            years = _years_before_projection(_resolved_item(item, scenario.projection_years))
+        except (ValueError, TypeError):
+            continue
+        if years:
+            excluded.append({"Service": item.label, "Years": years})
+    return excluded
+
+def _medical_what_if_settings(scenario):
+    """Every input that determines a scenario's what-if results."""
+    items = []
+    for item in scenario.medical_items:
+        try:
+            items.append(_resolved_item(item, scenario.projection_years))
+        except (ValueError, TypeError):
+            continue
+    return {
+        "items": items,
+        "projection_years": scenario.projection_years,
+        "growth_rate": float(_scenario_growth_rate(scenario)),
+        "discount_rate": float(scenario.discount_rate),
+        "partial_offset": bool(scenario.partial_offset),
+        "total_offset": bool(scenario.total_offset),
+        "discount_method": scenario.discount_method
+    }
+
+def _medical_what_if_inputs(scenario):
+    """
+    Cost vectors and rate settings for medical_what_if.
+
+    Cached under a fingerprint of the scenario's inputs, so an edit made by
+    another process can never serve stale vectors.
+    """
+    settings = _medical_what_if_settings(scenario)
+    key = (scenario.id, input_fingerprint(settings))
+    inputs = healthcare_cache.get(key)
+    if inputs is None:
+        items, projection_years = settings.pop("items"), settings.pop("projection_years")
+        inputs = {"vectors": medical_cost_vectors(items, projection_years), **settings}
+        healthcare_cache.set(key, inputs)
+    return inputs
+
 def compute_future_medical_costs(scenario):
     """Compute future medical costs based on scenario parameters."""
     print(f"DEBUG: Starting calculations for scenario {scenario.scenario_name}")
     
     # Determine scenario growth rate (inflation rate)
-    if scenario.growth_method == "CPI":
-        scenario_growth_rate = CPIRate.get_rate("CPI") or Decimal('0.03')
-    elif scenario.growth_method == "PCE":
-        scenario_growth_rate = CPIRate.get_rate("PCE") or Decimal('0.025')
-    elif scenario.growth_method == "Medical_CPI":
-        scenario_growth_rate = CPIRate.get_rate("Medical_CPI") or Decimal('0.035')
-    else:
-        scenario_growth_rate = scenario.growth_rate_custom
+    scenario_growth_rate = _scenario_growth_rate(scenario)
 
     print(f"DEBUG: Growth rate: {scenario_growth_rate}")
 
@@ -36,30 +106,15 @@ def compute_future_medical_costs(scenario):
 
     print(f"DEBUG: Initial parameters - Discount rate: {discount_rate}, Projection years: {projection_years}")
 
-    # If total_offset => discount_rate = growth_rate
-    if total_offset:
-        discount_rate = scenario_growth_rate
-
-    # partial offset => net_discount in discrete time
-    net_discount = discount_rate
-    if partial_offset:
-        net_discount = ((1 + discount_rate)/(1 + scenario_growth_rate)) - 1
-        scenario_growth_rate = Decimal('0.0')  # treat growth as 0, discount = net_discount
-
-    # if discount_method == 'net', treat user-supplied discount_rate as net
-    if scenario.discount_method == 'net':
-        net_discount = discount_rate
+    # Total offset discounts at the growth rate, partial offset at the net rate with zero growth
+    scenario_growth_rate, net_discount = effective_medical_rates(
+        scenario_growth_rate, discount_rate, partial_offset, total_offset, scenario.discount_method
+    )
 
     print(f"DEBUG: Final discount rate: {net_discount}")
 
-    # Helper functions for inflation and discounting
-    def inflation_factor(year, inflation_rate):
-        """Return the inflation multiplier for a given year (base year = 1)."""
-        return (1 + inflation_rate) ** (year - 1)
-
-    def discount_factor(year, discount_rate):
-        """Return the discount multiplier for a given year (base year = 1)."""
-        return 1 / ((1 + discount_rate) ** (year - 1))
+    # Discount multipliers by year (base year = 1), shared by every item
+    discount_factors = factor_vector(float(net_discount), 1, projection_years, "discount")
 
     # Create results dictionary with parameters
     results = {
@@ -75,17 +130,13 @@ def compute_future_medical_costs(scenario):
         "grand_total_present_value": 0.0,
         "grand_total_undiscounted": 0.0,
         "category_tables": {},
-        "category_summaries": []
+        "category_summaries": [],
+        "excluded_occurrences": _excluded_occurrences(scenario)
     }
 
     # Calculate start age
     if scenario.evaluee.date_of_birth:
-        start_date = datetime.now()
-        current_age = float(
-            (start_date.year - scenario.evaluee.date_of_birth.year) +
-            ((start_date.month - scenario.evaluee.date_of_birth.month) / 12.0) +
-            ((start_date.day - scenario.evaluee.date_of_birth.day) / 365.25)
-        )
+        current_age = age_at(scenario.evaluee.date_of_birth, datetime.now())
     else:
         current_age = 60.39  # Default starting age if no DOB
 
@@ -97,14 +148,18 @@ def compute_future_medical_costs(scenario):
         print(f"\nDEBUG: Processing item {item.label}")
         
         try:
-            annual_cost = float(item.annual_cost) if item.annual_cost is not None else 0.0
-            growth_rate = float(item.growth_rate) if item.growth_rate is not None else float(scenario_growth_rate)
-            duration_years = int(item.duration_years) if item.duration_years else projection_years
-            start_year = int(item.start_year) if item.start_year is not None else 1
-            interval_years = int(item.interval_years) if item.interval_years is not None else 1
-
-            # Calculate yearly projections
-            for year in range(start_year, min(start_year + duration_years, projection_years + 1)):
+            resolved = _resolved_item(item, projection_years)
+            annual_cost = resolved["annual_cost"]
+            growth_rate = resolved["growth_rate"] if resolved["growth_rate"] is not None else float(scenario_growth_rate)
+            duration_years = resolved["duration_years"]
+            start_year = resolved["start_year"]
+            interval_years = resolved["interval_years"]
+            # Inflation multipliers by year (base year = 1)
+            inflation_factors = factor_vector(growth_rate, 1, projection_years, "growth")
+
+            # Calculate yearly projections; years before year 1 fall outside the projection
+            # and are listed in results["excluded_occurrences"]
+            for year in range(max(start_year, 1), min(start_year + duration_years, projection_years + 1)):
                 # Skip years that don't match the interval
                 if (year - start_year) % interval_years != 0:
                     continue
@@ -112,9 +167,9 @@ def compute_future_medical_costs(scenario):
                 if item.is_one_time and year > start_year:
                     continue
 
-                inf_factor = inflation_factor(year, growth_rate)
+                inf_factor = float(inflation_factors[year - 1])
                 infl_annual_cost = annual_cost * inf_factor
-                disc_factor = discount_factor(year, float(net_discount))
+                disc_factor = float(discount_factors[year - 1])
                 present_val = infl_annual_cost * disc_factor if discounting_enabled else infl_annual_cost
                 proj_age = current_age + (year - 1)
                 proj_year = current_year + (year - 1)
@@ -249,12 +304,44 @@ def view_scenario(evaluee_id, scenario_id):
         return redirect(url_for('healthcare.healthcare_form', evaluee_id=evaluee_id))
     
     results = compute_future_medical_costs(scenario)
+    _medical_what_if_inputs(scenario)
     return render_template('healthcare/view_scenario.html', 
                          evaluee=evaluee, 
                          scenario=scenario, 
                          results=results,
                          now=datetime.now())
 
+@healthcare.route('/healthcare/<int:evaluee_id>/scenario/<int:scenario_id>/what-if')
+def what_if(evaluee_id, scenario_id):
+    """
+    Life care plan totals with the scenario growth or discount rate changed.
+
+    Takes growth_rate and discount_rate as decimal query parameters; either may
+    be omitted to keep the scenario's own rate. Reuses the cost vectors cached
+    under the scenario's current inputs, so they are only rebuilt after a change.
+    """
+    scenario = HealthcareScenario.query.get_or_404(scenario_id)
+    if scenario.evaluee_id != evaluee_id:
+        return jsonify({'error': 'Invalid scenario for this evaluee'}), 404
+    inputs = _medical_what_if_inputs(scenario)
+
+    growth_rate = request.args.get('growth_rate', type=float)
+    discount_rate = request.args.get('discount_rate', type=float)
+    if growth_rate is not None and growth_rate <= -1:
+        return jsonify({'error': 'Growth rate must be greater than -100%'}), 400
+    if discount_rate is not None and discount_rate <= -1:
+        return jsonify({'error': 'Discount rate must be greater than -100%'}), 400
+
+    result = medical_what_if(
+        inputs['vectors'],
+        inputs['growth_rate'] if growth_rate is None else growth_rate,
+        inputs['discount_rate'] if discount_rate is None else discount_rate,
+        inputs['partial_offset'],
+        inputs['total_offset'],
+        inputs['discount_method']
+    )
+    return jsonify({'scenario_id': scenario_id, **result, 'excluded_occurrences': _excluded_occurrences(scenario)})
+
 @healthcare.route('/healthcare/<int:evaluee_id>/scenario/<int:scenario_id>/edit', methods=['GET', 'POST'])
 def edit_scenario(evaluee_id, scenario_id):
     """Edit a healthcare scenario."""
@@ -282,6 +369,7 @@ def edit_scenario(evaluee_id, scenario_id):
             scenario.projection_years = int(projection_years or 20)
         
         db.session.commit()
+        invalidate_healthcare_scenarios([scenario_id])
         flash('Healthcare scenario updated successfully.', 'success')
         return redirect(url_for('healthcare.view_scenario', evaluee_id=evaluee_id, scenario_id=scenario_id))
     
@@ -382,6 +470,7 @@ def add_item(evaluee_id, scenario_id):
     
     db.session.add(item)
     db.session.commit()
+    invalidate_healthcare_scenarios([scenario_id])
     
     flash(f'Added medical cost: {label}', 'success')
     return redirect(url_for('healthcare.manage_items', evaluee_id=evaluee_id, scenario_id=scenario_id))
@@ -396,6 +485,7 @@ def delete_item(evaluee_id, scenario_id, item_id):
     
     db.session.delete(item)
     db.session.commit()
+    invalidate_healthcare_scenarios([scenario_id])
     flash('Medical item deleted successfully.', 'success')
     return redirect(url_for('healthcare.manage_items', evaluee_id=evaluee_id, scenario_id=scenario_id))
 
@@ -454,6 +544,7 @@ def delete_scenario(evaluee_id, scenario_id):
     try:
         db.session.delete(scenario)
         db.session.commit()
+        invalidate_healthcare_scenarios([scenario_id])
         flash('Healthcare scenario deleted successfully.', 'success')
     except Exception as e:
         db.session.rollback()
@@ -1,6 +1,8 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file
 from flask_login import login_required, current_user
 from ..models.models import db, Evaluee, HouseholdServicesScenario, HouseholdServiceStage
+from ..utils.result_writer import persist_results
+from ..utils.factor_cache import factor_vector
 from decimal import Decimal
 import pandas as pd
 import os
@@ -56,9 +58,8 @@ def view_scenario(evaluee_id, scenario_id):
         flash('Access denied.')
         return redirect(url_for('household.household_form', evaluee_id=evaluee_id))
     
-    # Calculate present value
-    scenario.present_value = scenario.calculate_present_value()
-    db.session.commit()
+    # Calculate present value, persisting it only if it changed
+    persist_results(scenario, present_value=scenario.calculate_present_value())
     
     return render_template('household/view_scenario.html', evaluee=evaluee, scenario=scenario, Decimal=Decimal)
 
@@ -215,19 +216,17 @@ def export_scenario(evaluee_id, scenario_id):
         
         # For each stage, reset "local_year" so each stage starts at year 1
         for stage in sorted(scenario.stages, key=lambda x: x.stage_number):
+            growth_factors = factor_vector(float(scenario.growth_rate), 1, stage.years, "growth")
+            discount_divisors = factor_vector(float(scenario.discount_rate), 1, stage.years + 1, "growth")
             for local_year in range(1, stage.years + 1):
                 # Growth from the stage's base annual_value
-                grown_value = float(stage.annual_value) * (
-                    (1 + float(scenario.growth_rate)) ** (local_year - 1)
-                )
+                grown_value = float(stage.annual_value) * float(growth_factors[local_year - 1])
                 
                 # Apply area wage adjustment & reduction
                 adjusted_value = grown_value * float(scenario.area_wage_adjustment) * float(scenario.reduction_percentage)
                 
                 # Discount from year 1..n (local_year)
-                present_value = adjusted_value / (
-                    (1 + float(scenario.discount_rate)) ** local_year
-                )
+                present_value = adjusted_value / float(discount_divisors[local_year])
                 
                 total_pv += present_value
                 
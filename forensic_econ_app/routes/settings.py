@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from forensic_econ_app.models.models import db, CPIRate
+from forensic_econ_app.utils.result_cache import invalidate_healthcare_scenarios
 from decimal import Decimal
 
 settings = Blueprint('settings', __name__)
@@ -29,6 +30,8 @@ def update_cpi_rates():
                 db.session.add(rate)
         
         db.session.commit()
+        # Scenarios on a CPI growth method pick up the new rates
+        invalidate_healthcare_scenarios()
         flash('CPI rates updated successfully.', 'success')
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,41 @@
+import io
+import pytest
+from forensic_econ_app.utils.aef_batch import aef_batch_table, read_aef_upload
+from forensic_econ_app.utils.calculations import calculate_aef
+
+CSV = b"""label,gross_earnings_base,worklife_adjustment,unemployment_factor,fringe_benefit,tax_liability,personal_percentage,wrongful_death
+Smith,1.0,0.7153,0.025,0.12,0.12,,
+Jones,1.0,0.82,0.04,0.18,0.15,0.3,true
+Lee,1.0,0.82,0.04,0.18,0.15,0.3,false
+Broken,1.0,,0.04,0.18,0.15,,
+"""
+
+def test_batch_matches_single_calculator():
+    table, rows = aef_batch_table(read_aef_upload(CSV, 'docket.csv'))
+    assert list(table['Label']) == ['Smith', 'Jones', 'Lee', 'Broken']
+    assert 'worklife_adjustment' in table.loc[3, 'Error']
+
+    for position in range(3):
+        row = rows[position]
+        _, expected = calculate_aef(row['gross_earnings_base'], row['worklife_adjustment'], row['unemployment_factor'],
+                                    row['fringe_benefit'], row['tax_liability'], row['wrongful_death'], '',
+                                    row['personal_percentage'], backend='decimal')
+        assert table.loc[position, 'aef'] == pytest.approx(float(expected), abs=1e-12)
+    assert table.loc[1, 'aef'] < table.loc[2, 'aef']  # personal consumption only applies with wrongful death
+
+def test_batch_route_returns_table_and_lazy_steps(app):
+    client = app.test_client()
+    response = client.post('/aef/batch?format=json', data={'file': (io.BytesIO(CSV), 'docket.csv')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [row['Error'] for row in data['rows']][3] and data['rows'][3]['aef'] is None
+
+    steps = client.get(f"/aef/batch/{data['batch_id']}/rows/2/steps").get_json()['steps']
+    assert steps[-1]['Step'] == 'AEF' and steps[-1]['Amount'] == f"{data['rows'][1]['aef'] * 100:.2f}%"
+    assert client.get(f"/aef/batch/{data['batch_id']}/rows/4/steps").status_code == 404
+
+    json_rows = [{'gross_earnings_base': 1, 'worklife_adjustment': 0.9, 'unemployment_factor': 0.05,
+                  'fringe_benefit': 0.2, 'tax_liability': 0.1}]
+    assert client.post('/aef/batch', json=json_rows).get_json()['rows'][0]['aef'] == pytest.approx(0.9 * 0.95 * 0.9 * 1.2)
+    assert client.post('/aef/batch', json=[]).status_code == 400
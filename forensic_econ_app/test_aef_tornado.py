@@ -0,0 +1,46 @@
+import pytest
+from decimal import Decimal
+from forensic_econ_app.models.models import db
+from forensic_econ_app.utils.aef_tornado import aef_tornado, tornado_bounds
+from forensic_econ_app.utils.calculations import calculate_aef
+
+INPUTS = dict(gross_earnings_base=1.0, worklife_adjustment=0.7153, unemployment_factor=0.025, fringe_benefit=0.12,
+              tax_liability=0.15, personal_percentage=0.3, wrongful_death=True)
+
+def _single(**changes):
+    params = dict(INPUTS, **changes)
+    _, aef = calculate_aef(params['gross_earnings_base'], params['worklife_adjustment'], params['unemployment_factor'],
+                           params['fringe_benefit'], params['tax_liability'], params['wrongful_death'], '',
+                           params['personal_percentage'], backend='decimal')
+    return float(aef)
+
+def test_tornado_matches_one_at_a_time_calculator():
+    result = aef_tornado(INPUTS, tornado_bounds(INPUTS, 0.10, {'tax_liability': (0.05, 0.35)}))
+    assert result['base_aef'] == pytest.approx(_single(), abs=1e-12)
+    assert [row['swing'] for row in result['rows']] == sorted((row['swing'] for row in result['rows']), reverse=True)
+    for row in result['rows']:
+        assert row['low_aef'] == pytest.approx(_single(**{row['factor']: row['low_input']}), abs=1e-12)
+        assert row['high_aef'] == pytest.approx(_single(**{row['factor']: row['high_input']}), abs=1e-12)
+    assert result['rows'][0]['factor'] == 'tax_liability'
+
+    no_death = aef_tornado(dict(INPUTS, wrongful_death=False), tornado_bounds(dict(INPUTS, wrongful_death=False)))
+    assert 'personal_percentage' not in [row['factor'] for row in no_death['rows']]
+
+def test_bounds_stay_ordered_for_bases_above_one():
+    inputs = dict(INPUTS, worklife_adjustment=1.05, fringe_benefit=1.2)
+    bounds = tornado_bounds(inputs, 0.10)
+    assert bounds['worklife_adjustment'] == (pytest.approx(0.945), 1.0)
+    assert bounds['fringe_benefit'] == (1.0, 1.0)
+    assert all(low <= high for low, high in bounds.values())
+    chart = aef_tornado(inputs, bounds)['chart']
+    assert all(low <= high for low, high in zip(chart['low'], chart['high']))
+
+def test_tornado_route(app, evaluee):
+    for field, value in INPUTS.items():
+        setattr(evaluee, field, Decimal(str(value)) if isinstance(value, float) else value)
+    db.session.commit()
+    client = app.test_client()
+    data = client.get(f'/aef/{evaluee.id}/tornado?format=json&spread=20').get_json()
+    assert data['spread'] == 20 and len(data['chart']['labels']) == 5
+    assert client.get(f'/aef/{evaluee.id}/tornado').status_code == 200
+    assert client.get(f'/aef/{evaluee.id}/tornado?format=json&spread=-5').status_code == 400
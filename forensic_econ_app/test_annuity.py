@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import HouseholdServicesScenario, HouseholdServiceStage, PensionScenario
+from forensic_econ_app.utils.annuity import (
+    growing_annuity_pv, deferred_growing_annuity_pv, partial_growing_annuity_pv, qualifies_for_closed_form
+)
+from forensic_econ_app.utils.earnings_engine import build_year_grid, compute_earnings_schedule
+
+@pytest.mark.parametrize("growth, discount", [(0.03, 0.05), (0.04, 0.04), (-0.02, 0.0), (0.0, 0.07)])
+def test_growing_annuity_matches_summation(growth, discount):
+    n = 37
+    immediate = sum(1000 * (1 + growth) ** k / (1 + discount) ** (k + 1) for k in range(n))
+    due = sum(1000 * (1 + growth) ** k / (1 + discount) ** k for k in range(n))
+    assert growing_annuity_pv(1000.0, growth, discount, n) == pytest.approx(immediate, rel=1e-12)
+    assert growing_annuity_pv(1000.0, growth, discount, n, due=True) == pytest.approx(due, rel=1e-12)
+    assert deferred_growing_annuity_pv(1000.0, growth, discount, n, 5) == pytest.approx(immediate / (1 + discount) ** 5, rel=1e-12)
+
+def test_partial_growing_annuity_matches_summation():
+    weights = [0.37] + [1.0] * 10 + [0.58]
+    expected = sum(w * 500 * 1.03 ** k / 1.05 ** k for k, w in enumerate(weights))
+    assert partial_growing_annuity_pv(500.0, 0.03, 0.05, len(weights), 0.37, 0.58) == pytest.approx(expected, rel=1e-12)
+    assert partial_growing_annuity_pv(500.0, 0.03, 0.05, 1, 0.37, 0.58) == pytest.approx(0.37 * 500)
+
+def test_household_closed_form_matches_loop():
+    scenario = HouseholdServicesScenario(
+        area_wage_adjustment=Decimal('1.0450'), reduction_percentage=Decimal('0.6500'),
+        growth_rate=Decimal('0.0275'), discount_rate=Decimal('0.0410')
+    )
+    scenario.stages = [
+        HouseholdServiceStage(stage_number=1, years=12, annual_value=Decimal('18250.00')),
+        HouseholdServiceStage(stage_number=2, years=25, annual_value=Decimal('9400.00')),
+    ]
+    assert scenario.calculate_present_value() == scenario._calculate_present_value_iterative()
+
+@pytest.mark.parametrize("fields", [
+    dict(calculation_method='contributions', years_to_retirement=28, annual_contribution=Decimal('6200.00')),
+    dict(calculation_method='payments', retirement_age=67, life_expectancy=84, annual_pension_benefit=Decimal('31000.00')),
+])
+def test_pension_closed_form_matches_loop(fields):
+    scenario = PensionScenario(growth_rate=Decimal('0.0200'), discount_rate=Decimal('0.0450'), **fields)
+    closed_form = scenario.calculate_present_value()
+    iterative = scenario._calculate_present_value_iterative()
+    assert abs(closed_form - iterative) < Decimal('0.000001')
+
+def test_earnings_totals_match_row_sums():
+    grid = build_year_grid(datetime(2024, 5, 20), datetime(2061, 3, 9))
+    schedule = compute_earnings_schedule(grid, 64000.0, 18000.0, 0.031, None, 91.9)
+    assert schedule["total_loss"] == pytest.approx(schedule["loss"].sum(), abs=1e-6)
+    assert schedule["total_pv"] == schedule["total_loss"]
+
+@pytest.mark.parametrize("growth, discount, qualifies", [
+    (Decimal('0.0300'), Decimal('0.0450'), True),
+    (Decimal('0.0300'), Decimal('0.0300'), True),
+    (0.03, 0.03, True),
+    (Decimal('0.0300'), Decimal('0.0300000001'), False),
+    (0.03, 0.03 + 1e-12, False),
+    (Decimal('0.0200'), Decimal('-1.0000'), False),
+])
+def test_closed_form_predicate(growth, discount, qualifies):
+    assert qualifies_for_closed_form(growth, discount) is qualifies
+
+def test_near_equal_rates_use_year_by_year_loop(monkeypatch):
+    from forensic_econ_app.models import models
+
+    def closed_form(*args, **kwargs):
+        raise AssertionError('closed form used for near-equal rates')
+
+    monkeypatch.setattr(models, 'growing_annuity_pv', closed_form)
+    household = HouseholdServicesScenario(
+        area_wage_adjustment=Decimal('1.0'), reduction_percentage=Decimal('1.0'),
+        growth_rate=Decimal('0.0300'), discount_rate=Decimal('0.0300000001')
+    )
+    household.stages = [HouseholdServiceStage(stage_number=1, years=30, annual_value=Decimal('10000.00'))]
+    assert household.calculate_present_value() == household._calculate_present_value_iterative()
+
+    pension = PensionScenario(calculation_method='payments', retirement_age=65, life_expectancy=90,
+                              annual_pension_benefit=Decimal('20000.00'), growth_rate=Decimal('0.0300'),
+                              discount_rate=Decimal('0.0300000001'))
+    assert pension.calculate_present_value() == pension._calculate_present_value_iterative()
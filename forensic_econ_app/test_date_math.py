@@ -0,0 +1,18 @@
+import pytest
+from datetime import datetime
+from forensic_econ_app.utils.date_math import year_table, age_at, period_fractions
+
+def test_year_table_is_memoized_and_read_only():
+    first = year_table(datetime(2024, 3, 1, 9, 30), datetime(2030, 6, 30), datetime(1985, 5, 5))
+    second = year_table(datetime(2024, 3, 1), datetime(2030, 6, 30, 17, 0), datetime(1985, 5, 5))
+    assert first is second
+    assert first["portions"][0] == pytest.approx(306 / 366)
+    assert first["portions"][-1] == pytest.approx(181 / 365)
+    assert first["ages"][1] == pytest.approx(age_at(datetime(1985, 5, 5), datetime(2025, 1, 1)))
+    with pytest.raises(ValueError):
+        first["portions"][0] = 1.0
+
+def test_period_fractions_include_final_partial_period():
+    periods = period_fractions(2.3, 4)
+    assert [p for p, _ in periods] == list(range(11))
+    assert periods[-1][1] == pytest.approx(2.3)
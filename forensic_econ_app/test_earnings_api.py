@@ -0,0 +1,63 @@
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import db, EarningsScenario, User
+from forensic_econ_app.utils.calculations import compute_earnings_table_multi_rate
+
+PARAMS = dict(start_date='2024-03-01', end_date='2040-06-30', wage_base=55000.0, residual_base=12000.0,
+              growth_rate=0.03, adjustment_factor=85.0, discount_rates=[0.04, 0.06], date_of_birth='1980-03-03',
+              offset_wages={'2027': 4000.0})
+
+def test_compute_api_returns_columns_for_parameters_and_stored_scenarios(app, evaluee):
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name='Stored', start_date=datetime(2024, 3, 1),
+                                end_date=datetime(2040, 6, 30), wage_base=Decimal('55000'),
+                                residual_base=Decimal('12000'), growth_rate=Decimal('0.03'),
+                                adjustment_factor=Decimal('85'))
+    db.session.add(scenario)
+    db.session.commit()
+    client = app.test_client()
+    client.post('/login', data={'username': 'tester', 'password': 'secret'})
+
+    response = client.post('/earnings/compute', json={'scenarios': [
+        PARAMS, {'scenario_id': scenario.id}, {'scenario_id': 9999}, {'start_date': '2024-01-01'}
+    ]})
+    assert response.status_code == 200
+    explicit, stored, missing, invalid = response.get_json()['results']
+
+    raw, _, pv_totals, total_loss = compute_earnings_table_multi_rate(
+        datetime(2024, 3, 1), datetime(2040, 6, 30), 55000.0, 12000.0, 0.03, [0.04, 0.06], 85.0,
+        date_of_birth=datetime(1980, 3, 3), offset_wages={2027: 4000.0}
+    )
+    assert explicit['column_names'] == list(raw.columns)
+    assert explicit['columns']['Loss'] == raw['Loss'].tolist()
+    assert abs(explicit['totals']['loss'] - float(total_loss)) < 0.005
+    assert abs(explicit['totals']['present_value']['Present Value @ 4.00%'] - float(pv_totals[0.04])) < 0.005
+
+    assert stored['scenario_id'] == scenario.id
+    assert stored['columns']['Loss'][:10] != explicit['columns']['Loss'][:10]  # no offset on the stored scenario
+    assert 'not found' in missing['error']
+    assert 'Missing required fields' in invalid['error']
+
+def test_compute_api_rejects_bad_body(app, evaluee):
+    client = app.test_client()
+    client.post('/login', data={'username': 'tester', 'password': 'secret'})
+    assert client.post('/earnings/compute', data='not json').status_code == 400
+    app.config['COMPUTE_API_MAX_SCENARIOS'] = 2
+    assert client.post('/earnings/compute', json=[PARAMS] * 3).status_code == 400
+
+def test_compute_api_only_serves_the_users_own_scenarios(app, evaluee):
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name='Stored', start_date=datetime(2024, 3, 1),
+                                end_date=datetime(2040, 6, 30), wage_base=Decimal('55000'),
+                                residual_base=Decimal('12000'), growth_rate=Decimal('0.03'),
+                                adjustment_factor=Decimal('85'))
+    intruder = User(username='intruder', email='intruder@example.com')
+    intruder.set_password('secret')
+    db.session.add_all([scenario, intruder])
+    db.session.commit()
+    client = app.test_client()
+    body = [{'scenario_id': scenario.id}, PARAMS]
+
+    assert client.post('/earnings/compute', json=body).status_code == 302
+    client.post('/login', data={'username': 'intruder', 'password': 'secret'})
+    denied, explicit = client.post('/earnings/compute', json=body).get_json()['results']
+    assert denied == {'error': f'Access denied to scenario {scenario.id}'}
+    assert 'columns' in explicit
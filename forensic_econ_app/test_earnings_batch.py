@@ -0,0 +1,50 @@
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import db, EarningsScenario, OffsetWage, User
+from forensic_econ_app.utils.calculations import compute_earnings_table
+from forensic_econ_app.utils.earnings_batch import recompute_earnings_scenarios
+
+def _scenario(evaluee, name, start, end, wage_base):
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name=name, start_date=start, end_date=end,
+                                wage_base=wage_base, residual_base=Decimal('10000'),
+                                growth_rate=Decimal('0.03'), adjustment_factor=Decimal('85'))
+    db.session.add(scenario)
+    db.session.commit()
+    return scenario
+
+def test_batch_recompute_persists_every_scenario(evaluee):
+    first = _scenario(evaluee, 'A', datetime(2024, 3, 1), datetime(2055, 6, 30), Decimal('60000'))
+    second = _scenario(evaluee, 'B', datetime(2025, 1, 1), datetime(2040, 12, 31), Decimal('45000'))
+    broken = _scenario(evaluee, 'Bad', datetime(2030, 1, 1), datetime(2025, 1, 1), Decimal('45000'))
+    db.session.add(OffsetWage(scenario_id=first.id, year=2026, amount=Decimal('5000')))
+    db.session.commit()
+
+    summaries = recompute_earnings_scenarios(evaluee.earnings_scenarios, workers=2)
+
+    assert [s['scenario_id'] for s in summaries] == [first.id, second.id, broken.id]
+    assert 'error' in summaries[2] and broken.present_value is None
+    for scenario, offsets in ((first, {2026: 5000.0}), (second, None)):
+        _, _, total_pv, total_loss = compute_earnings_table(
+            scenario.start_date, scenario.end_date, float(scenario.wage_base), 10000.0, 0.03, 0.04, 85.0,
+            date_of_birth=evaluee.date_of_birth, offset_wages=offsets
+        )
+        assert scenario.present_value == total_pv.quantize(Decimal('0.01'))
+        assert scenario.total_loss == total_loss.quantize(Decimal('0.01'))
+
+    assert not any(s.get('changed') for s in recompute_earnings_scenarios(evaluee.earnings_scenarios))
+
+def test_recompute_routes_require_the_evaluees_owner(app, evaluee):
+    _scenario(evaluee, 'Owned', datetime(2024, 1, 1), datetime(2040, 12, 31), Decimal('50000'))
+    intruder = User(username='intruder', email='intruder@example.com')
+    intruder.set_password('secret')
+    db.session.add(intruder)
+    db.session.commit()
+    client = app.test_client()
+    url = f'/earnings/{evaluee.id}/recompute?format=json'
+
+    assert client.post(url).status_code == 302
+    client.post('/login', data={'username': 'intruder', 'password': 'secret'})
+    assert client.post(url).status_code == 403
+    client.get('/logout')
+    client.post('/login', data={'username': 'tester', 'password': 'secret'})
+    assert client.post(url).get_json()['recomputed'] == 1
@@ -0,0 +1,248 @@
+import random
+import pytest
+import pandas as pd
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import datetime, timedelta
+from forensic_econ_app.utils.formatting import format_earnings_frame
+from forensic_econ_app.utils.calculations import (
+    compute_earnings_table, compute_earnings_table_decimal, compute_earnings_table_multi_rate,
+    compute_earnings_sensitivity, present_value_column, compute_earnings_state, earnings_state_results,
+    apply_offset_wage_change, iter_earnings_rows, rollup_to_annual
+)
+
+SCENARIOS = [
+    dict(start_date=datetime(2023, 3, 15), end_date=datetime(2065, 8, 1), wage_base=58250.0,
+         residual_base=21000.0, growth_rate=0.0325, discount_rate=0.045, adjustment_factor=87.5,
+         date_of_birth=datetime(1990, 6, 2)),
+    dict(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 9, 30), wage_base=41000.0,
+         residual_base=0.0, growth_rate=0.02, discount_rate=0.03, adjustment_factor=100.0),
+    dict(start_date=datetime(2020, 7, 4), end_date=datetime(2031, 12, 31), wage_base=97500.0,
+         residual_base=30000.0, growth_rate=-0.01, discount_rate=None, adjustment_factor=72.3,
+         date_of_birth=datetime(1975, 2, 28), offset_wages={2022: 12000.0, 2025: 0.0, 2031: 45000.0}),
+]
+
+@pytest.mark.parametrize("params", SCENARIOS)
+def test_vectorized_matches_decimal(params):
+    raw, display, total_pv, total_loss = compute_earnings_table(**params)
+    ref_raw, ref_display, ref_pv, ref_loss = compute_earnings_table_decimal(**params)
+
+    assert list(raw.columns) == list(ref_raw.columns)
+    assert len(raw) == len(ref_raw)
+    assert abs(total_pv - ref_pv) < 0.005
+    assert abs(total_loss - ref_loss) < 0.005
+    for col in ["Portion of Year", "Wage Base Years", "Residual Earning Capacity", "Gross Earnings", "Loss", "Present Value"]:
+        assert (raw[col] - ref_raw[col]).abs().max() < 0.005
+    assert display.equals(ref_display)
+
+def _cents(value):
+    return Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+def _random_scenario(rng):
+    start = datetime(2012, 1, 1) + timedelta(days=rng.randrange(5000))
+    end = start + timedelta(days=rng.randrange(30, 15000))
+    years = range(start.year, end.year + 1)
+    return dict(
+        start_date=start, end_date=end, wage_base=round(rng.uniform(15000, 400000), 2),
+        residual_base=round(rng.uniform(0, 40000), 2), growth_rate=round(rng.uniform(-0.02, 0.06), 4),
+        discount_rate=rng.choice([None, 0.0, round(rng.uniform(0, 0.07), 4)]),
+        adjustment_factor=round(rng.uniform(50, 100), 2),
+        date_of_birth=rng.choice([None, start - timedelta(days=rng.randrange(6000, 20000))]),
+        offset_wages={year: round(rng.uniform(0, 50000), 2) for year in rng.sample(years, min(len(years), rng.randrange(4)))}
+    )
+
+@pytest.mark.parametrize("seed", range(4))
+def test_randomized_tables_match_decimal_to_the_cent(seed):
+    rng = random.Random(seed)
+    for _ in range(60):
+        params = _random_scenario(rng)
+        _, display, total_pv, total_loss = compute_earnings_table(**params, backend="float64")
+        _, ref_display, ref_pv, ref_loss = compute_earnings_table_decimal(**params)
+
+        assert _cents(total_pv) == _cents(ref_pv), params
+        assert _cents(total_loss) == _cents(ref_loss), params
+        assert display.equals(ref_display), params
+
+@pytest.mark.parametrize("seed", range(2))
+def test_randomized_segments_match_decimal_parts_to_the_cent(seed):
+    rng = random.Random(seed)
+    for _ in range(40):
+        params = _random_scenario(rng)
+        start, end = params["start_date"], params["end_date"]
+        splits = sorted(rng.sample(range(start.year + 1, end.year + 1), min(end.year - start.year, 2)))
+        bounds = [start] + [datetime(year, 1, 1) for year in splits] + [end + timedelta(days=1)]
+        segments = [
+            dict(start_date=lo, end_date=hi - timedelta(days=1), wage_base=round(rng.uniform(15000, 400000), 2),
+                 growth_rate=round(rng.uniform(-0.02, 0.06), 4))
+            for lo, hi in zip(bounds, bounds[1:])
+        ]
+        common = dict(residual_base=0.0, discount_rate=params["discount_rate"],
+                      adjustment_factor=params["adjustment_factor"], reference_start=start)
+        _, _, total_pv, total_loss = compute_earnings_table(
+            start, end, 0.0, growth_rate=0.0, wage_segments=segments, offset_wages=params["offset_wages"],
+            backend="float64", **common
+        )
+        parts = [
+            compute_earnings_table_decimal(
+                seg["start_date"], seg["end_date"], seg["wage_base"], growth_rate=seg["growth_rate"],
+                offset_wages={year: amount for year, amount in params["offset_wages"].items()
+                              if seg["start_date"].year <= year <= seg["end_date"].year},
+                **common
+            )
+            for seg in segments
+        ]
+
+        assert _cents(total_pv) == _cents(sum(part[2] for part in parts)), params
+        assert _cents(total_loss) == _cents(sum(part[3] for part in parts)), params
+
+def test_invalid_dates_return_empty_tables():
+    raw, display, total_pv, total_loss = compute_earnings_table(
+        datetime(2030, 1, 1), datetime(2025, 1, 1), 50000.0, 0.0, 0.03, 0.04, 100.0
+    )
+    assert raw.empty and display.empty
+    assert total_pv == 0 and total_loss == 0
+
+def test_multi_rate_matches_single_rate_runs():
+    params = dict(SCENARIOS[0])
+    params.pop("discount_rate")
+    raw, _, pv_totals, total_loss = compute_earnings_table_multi_rate(discount_rates=[0.03, 0.05, 0.07], **params)
+
+    for rate in [0.03, 0.05, 0.07]:
+        single_raw, _, single_pv, single_loss = compute_earnings_table(discount_rate=rate, **params)
+        assert abs(pv_totals[rate] - single_pv) < 0.005
+        assert abs(total_loss - single_loss) < 0.005
+        assert (raw[present_value_column(rate)] - single_raw["Present Value"]).abs().max() < 1e-6
+
+def test_repeated_rates_are_discounted_once():
+    params = dict(SCENARIOS[0])
+    params.pop("discount_rate")
+    raw, _, pv_totals, total_loss = compute_earnings_table_multi_rate(discount_rates=[0.05, 0.03, 0.05], **params)
+    state = compute_earnings_state(discount_rates=[0.05, 0.03, 0.05], **params)
+    rows = list(iter_earnings_rows(discount_rates=[0.05, 0.03, 0.05], **params))
+
+    assert list(pv_totals) == [0.05, 0.03]
+    assert state["rates"] == [0.05, 0.03] and state["pv_matrix"].shape[1] == 2
+    assert [c for c in raw.columns if c.startswith("Present Value")] == [present_value_column(0.05),
+                                                                         present_value_column(0.03)]
+    for rate in pv_totals:
+        assert abs(float(pv_totals[rate]) - raw[present_value_column(rate)].sum()) < 0.005
+        assert abs(rows[-1][2][present_value_column(rate)] - float(pv_totals[rate])) < 0.005
+
+def test_sensitivity_grid_matches_individual_tables():
+    params = dict(SCENARIOS[2])
+    for key in ("growth_rate", "discount_rate", "date_of_birth"):
+        params.pop(key)
+    growth_rates, discount_rates = [-0.01, 0.0, 0.025], [0.0, 0.04, 0.06]
+    table = compute_earnings_sensitivity(growth_rates=growth_rates, discount_rates=discount_rates, **params)
+
+    for growth in growth_rates:
+        for discount in discount_rates:
+            _, _, total_pv, _ = compute_earnings_table(growth_rate=growth, discount_rate=discount, **params)
+            assert abs(table.loc[growth, discount] - float(total_pv)) < 0.005
+
+def test_offset_patch_matches_full_recompute():
+    params = dict(start_date=datetime(2023, 3, 15), end_date=datetime(2065, 8, 1), wage_base=58250.0,
+                  residual_base=21000.0, growth_rate=0.0325, discount_rates=[0.03, 0.05], adjustment_factor=87.5,
+                  date_of_birth=datetime(1990, 6, 2), offset_wages={2030: 15000.0})
+    state = compute_earnings_state(**params)
+    state = apply_offset_wage_change(state, 2040, 8000.0)
+    state = apply_offset_wage_change(state, 2030, None)
+    patched = earnings_state_results(state)
+    expected = earnings_state_results(compute_earnings_state(**{**params, "offset_wages": {2040: 8000.0}}))
+
+    assert format_earnings_frame(patched[0]).equals(format_earnings_frame(expected[0]))
+    assert (patched[0].drop(columns="Age") - expected[0].drop(columns="Age")).abs().max().max() < 1e-6
+    assert all(abs(patched[1][r] - expected[1][r]) < Decimal('1e-6') for r in expected[1])
+    assert abs(patched[2] - expected[2]) <= 0.01
+
+def test_streamed_rows_match_table():
+    params = dict(SCENARIOS[2], discount_rates=[0.03, 0.05])
+    params.pop("discount_rate")
+    raw, display, pv_totals, total_loss = compute_earnings_table_multi_rate(**params)
+    rows = list(iter_earnings_rows(**params, chunk_size=5))
+
+    assert [r[1] for r in rows] == display.to_dict("records")
+    assert [r[0]["Loss"] for r in rows] == pytest.approx(raw["Loss"].tolist())
+    totals = rows[-1][2]
+    assert abs(totals["Loss"] - float(total_loss)) < 0.005
+    assert all(abs(totals[present_value_column(r)] - float(pv_totals[r])) < 0.005 for r in pv_totals)
+
+def test_monthly_rollup_matches_annual_without_growth():
+    params = dict(start_date=datetime(2024, 1, 1), end_date=datetime(2033, 12, 31), wage_base=60000.0,
+                  residual_base=20000.0, growth_rate=0.0, discount_rate=None, adjustment_factor=90.0,
+                  date_of_birth=datetime(1985, 4, 9), offset_wages={2027: 5000.0})
+    annual, _, _, annual_loss = compute_earnings_table(**params)
+    monthly, _, _, monthly_loss = compute_earnings_table(**params, granularity="monthly")
+
+    assert len(monthly) == 120 and list(monthly.columns[:2]) == ["Year", "Month"]
+    rolled = rollup_to_annual(monthly)
+    assert list(rolled.columns) == list(annual.columns)
+    assert (rolled["Loss"] - annual["Loss"]).abs().max() < 1e-6
+    assert (rolled["Age"] == annual["Age"]).all()
+    assert abs(monthly_loss - annual_loss) < 0.005
+
+@pytest.mark.parametrize("wage_segments", [None, [dict(start_date=datetime(2027, 1, 1), end_date=datetime(2029, 12, 31),
+                                                         wage_base=75000.0, growth_rate=0.045)]])
+def test_monthly_rollup_matches_annual_with_growth(wage_segments):
+    # Whole calendar years, since partial years are prorated by days and partial months by months
+    params = dict(start_date=datetime(2024, 1, 1), end_date=datetime(2033, 12, 31), wage_base=60000.0,
+                  residual_base=20000.0, growth_rate=0.035, discount_rate=None, adjustment_factor=90.0,
+                  offset_wages={2027: 5000.0}, wage_segments=wage_segments)
+    annual, _, _, annual_loss = compute_earnings_table(**params)
+    monthly, _, _, monthly_loss = compute_earnings_table(**params, granularity="monthly")
+
+    # Growth steps once per calendar year on both grids, so every month of a year shares its factor
+    rolled = rollup_to_annual(monthly)
+    for col in ("Portion of Year", "Wage Base Years", "Residual Earning Capacity", "Loss"):
+        assert (rolled[col] - annual[col]).abs().max() < 1e-6
+    assert abs(monthly_loss - annual_loss) < 0.005
+
+def test_monthly_offset_patch_matches_full_recompute():
+    params = dict(start_date=datetime(2024, 3, 10), end_date=datetime(2030, 6, 30), wage_base=48000.0,
+                  residual_base=12000.0, growth_rate=0.03, discount_rates=[0.04], adjustment_factor=85.0,
+                  granularity="monthly")
+    state = apply_offset_wage_change(compute_earnings_state(**params), 2026, 3000.0)
+    patched = earnings_state_results(state)
+    expected = earnings_state_results(compute_earnings_state(**params, offset_wages={2026: 3000.0}))
+
+    assert (patched[0].drop(columns="Age") - expected[0].drop(columns="Age")).abs().max().max() < 1e-6
+    assert all(abs(patched[1][r] - expected[1][r]) < Decimal('1e-6') for r in expected[1])
+
+@pytest.mark.parametrize("split", [datetime(2029, 8, 16), datetime(2030, 1, 1)])
+def test_wage_segments_match_separate_scenarios(split):
+    start, end = datetime(2024, 3, 1), datetime(2050, 6, 30)
+    segments = [
+        dict(start_date=start, end_date=split - timedelta(days=1), wage_base=52000.0, growth_rate=0.025),
+        dict(start_date=split, end_date=end, wage_base=71000.0, growth_rate=0.035),
+    ]
+    common = dict(residual_base=0.0, discount_rate=0.045, adjustment_factor=88.0, reference_start=start)
+    raw, _, total_pv, total_loss = compute_earnings_table(
+        start, end, wage_base=0.0, growth_rate=0.0, wage_segments=segments, **common
+    )
+    parts = [
+        compute_earnings_table(seg["start_date"], seg["end_date"], seg["wage_base"], growth_rate=seg["growth_rate"], **common)
+        for seg in segments
+    ]
+
+    combined = pd.concat([part[0] for part in parts]).groupby("Year")["Loss"].sum()
+    assert (raw.set_index("Year")["Loss"] - combined).abs().max() < 1e-6
+    assert abs(total_loss - sum(part[3] for part in parts)) <= 0.01
+    if split.month == 1 and split.day == 1:
+        # A mid-year split discounts the second part from its own start date instead of January 1
+        assert abs(total_pv - sum(part[2] for part in parts)) <= 0.01
+
+    rows = list(iter_earnings_rows(start, end, 0.0, 0.0, 0.0, [0.045], 88.0, reference_start=start,
+                                   wage_segments=segments, chunk_size=4, formatted=False))
+    assert [r[0]["Loss"] for r in rows] == pytest.approx(raw["Loss"].tolist())
+
+def test_sensitivity_grid_keeps_wage_segment_rates():
+    params = dict(start_date=datetime(2024, 3, 1), end_date=datetime(2045, 6, 30), wage_base=58000.0,
+                  residual_base=14000.0, adjustment_factor=85.0, offset_wages={2027: 4000.0},
+                  wage_segments=[dict(start_date=datetime(2030, 1, 1), end_date=datetime(2034, 12, 31),
+                                      wage_base=70000.0, growth_rate=0.02)])
+    growth_rates, discount_rates = [0.01, 0.03, 0.05], [0.0, 0.045]
+    table = compute_earnings_sensitivity(growth_rates=growth_rates, discount_rates=discount_rates, **params)
+
+    for growth in growth_rates:
+        for discount in discount_rates:
+            _, _, total_pv, _ = compute_earnings_table(growth_rate=growth, discount_rate=discount, **params)
+            assert abs(table.loc[growth, discount] - float(total_pv)) < 0.005
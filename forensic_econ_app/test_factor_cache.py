@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from forensic_econ_app.utils.date_math import period_fractions
+from forensic_econ_app.utils.factor_cache import (
+    clear_factor_cache, factor_cache, factor_cache_info, factor_vector
+)
+from forensic_econ_app.utils.life_care_plan import FREQ_MAP, life_care_plan_matrices
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_factor_cache()
+    yield
+    clear_factor_cache()
+
+def test_vector_matches_python_power():
+    growth = factor_vector(0.035, 12, 121, 'growth')
+    discount = factor_vector(0.035, 12, 121, 'discount')
+    assert growth.tolist() == [1.035 ** (k / 12.0) for k in range(121)]
+    assert discount.tolist() == [1 / 1.035 ** (k / 12.0) for k in range(121)]
+    assert growth[0] == 1.0
+
+def test_vectors_are_read_only_and_shared():
+    vector = factor_vector(0.03, 1, 40)
+    with pytest.raises(ValueError):
+        vector[1] = 0.0
+    assert factor_vector(0.03, 1, 40) is vector
+    assert factor_cache_info() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': factor_cache.maxsize}
+
+def test_key_includes_every_dimension():
+    factor_vector(0.03, 1, 40, 'growth')
+    factor_vector(0.03, 1, 40, 'discount')
+    factor_vector(0.03, 12, 40, 'growth')
+    factor_vector(0.03, 1, 41, 'growth')
+    factor_vector(0.05, 1, 40, 'growth')
+    assert factor_cache_info()['misses'] == 5
+
+def test_least_recently_used_vector_is_evicted():
+    maxsize = factor_cache.maxsize
+    factor_cache.resize(2)
+    try:
+        factor_vector(0.03, 1, 20)
+        factor_vector(0.05, 1, 20)
+        factor_vector(0.03, 1, 20)
+        factor_vector(0.07, 1, 20)
+        factor_vector(0.03, 1, 20)
+        factor_vector(0.05, 1, 20)
+        assert factor_cache_info()['hits'] == 2
+        assert factor_cache_info()['misses'] == 4
+    finally:
+        factor_cache.resize(maxsize)
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        factor_vector(0.03, 1, 10, 'continuous')
+    with pytest.raises(ValueError):
+        factor_vector(0.03, 0, 10)
+    with pytest.raises(ValueError):
+        factor_vector(0.03, 1, -1)
+
+@pytest.mark.parametrize("frequency", list(FREQ_MAP))
+def test_life_care_plan_cached_factors_are_exact(frequency):
+    items = [
+        {"name": "Therapy", "base_cost": 125.37, "growth_rate": 0.035, "quantity_per_period": 1 / 52},
+        {"name": "Surgery", "base_cost": 41000.0, "growth_rate": 0.04, "pattern": "once", "year_offset": 2.5},
+    ]
+    fracs = [frac_yr for _, frac_yr in period_fractions(37.4, FREQ_MAP[frequency], 41.2)]
+    direct = life_care_plan_matrices(fracs, items, 0.0425)
+    cached = life_care_plan_matrices(fracs, items, 0.0425, periods_per_year=FREQ_MAP[frequency])
+    for expected, actual in zip(direct, cached):
+        assert np.array_equal(expected, actual)
+    # The discount rate and the recurring item's rate; the one-time item is raised at its event only
+    assert factor_cache_info()['misses'] == 2
+
+def test_health_endpoint_reports_counters(app):
+    factor_vector(0.03, 1, 10)
+    factor_vector(0.03, 1, 10)
+    data = app.test_client().get('/health/factor-cache').get_json()
+    assert data['hits'] == 1 and data['misses'] == 1 and data['size'] == 1
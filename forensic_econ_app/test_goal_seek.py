@@ -0,0 +1,73 @@
+import pytest
+from flask import url_for
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import db, HouseholdServicesScenario, HouseholdServiceStage, PensionScenario
+from forensic_econ_app.utils.calculations import compute_earnings_table
+from forensic_econ_app.utils.goal_seek import TargetNotReachableError, solve, earnings_evaluator, pension_evaluator
+
+EARNINGS_INPUTS = dict(start_date=datetime(2024, 3, 1), end_date=datetime(2055, 6, 30), wage_base=60000.0,
+                       residual_base=15000.0, growth_rate=0.03, adjustment_factor=85.0, discount_rates=[0.05],
+                       include_discounting=True, date_of_birth=datetime(1985, 5, 5), offset_wages={2027: 4000.0})
+
+@pytest.mark.parametrize("parameter, target", [
+    ("discount_rate", 900000.0), ("growth_rate", 1500000.0), ("wage_base", 1000000.0), ("adjustment_factor", 750000.0)
+])
+def test_earnings_goal_seek_hits_target(parameter, target):
+    result = solve(earnings_evaluator(EARNINGS_INPUTS, parameter), target,
+                   kind="amount" if parameter in ("wage_base", "adjustment_factor") else "rate")
+    assert result["converged"] and abs(result["residual"]) <= 0.005
+
+    params = {k: v for k, v in EARNINGS_INPUTS.items() if k not in ("discount_rates", "include_discounting")}
+    params["discount_rate"] = EARNINGS_INPUTS["discount_rates"][0]
+    params[parameter] = result["value"]
+    _, _, total_pv, _ = compute_earnings_table(**params)
+    assert abs(float(total_pv) - target) <= 0.01
+
+def test_pension_goal_seek_matches_model():
+    scenario = PensionScenario(calculation_method='payments', growth_rate=Decimal('0.02'), discount_rate=Decimal('0.04'),
+                               retirement_age=65, life_expectancy=85, annual_pension_benefit=Decimal('20000'))
+    result = solve(pension_evaluator(scenario, 'discount_rate'), 300000.0)
+    assert result["converged"] and result["iterations"] < 30
+
+    scenario.discount_rate = result["value"]
+    assert abs(float(scenario.calculate_present_value()) - 300000.0) <= 0.01
+
+def test_unreachable_target_raises():
+    scenario = PensionScenario(calculation_method='contributions', growth_rate=Decimal('0.02'),
+                               discount_rate=Decimal('0.04'), years_to_retirement=10,
+                               annual_contribution=Decimal('5000'))
+    with pytest.raises(TargetNotReachableError) as excinfo:
+        solve(pension_evaluator(scenario, 'annual_amount'), -1000.0, kind='amount')
+    assert str(excinfo.value) == ('A present value of $-1,000.00 cannot be reached with '
+                                  'any value between 0.00 and 1,000,000,000,000.00.')
+    assert isinstance(excinfo.value, ValueError)
+
+def test_unreachable_target_is_flashed_on_form_posts(app, evaluee):
+    household = HouseholdServicesScenario(evaluee_id=evaluee.id, scenario_name='Household',
+                                          area_wage_adjustment=Decimal('1.0'), reduction_percentage=Decimal('0.5'),
+                                          growth_rate=Decimal('0.02'), discount_rate=Decimal('0.04'))
+    household.stages = [HouseholdServiceStage(stage_number=1, years=10, annual_value=Decimal('12000'))]
+    pension = PensionScenario(evaluee_id=evaluee.id, scenario_name='Pension', calculation_method='contributions',
+                              growth_rate=Decimal('0.02'), discount_rate=Decimal('0.04'), years_to_retirement=10,
+                              annual_contribution=Decimal('5000'))
+    db.session.add_all([household, pension])
+    db.session.commit()
+    client = app.test_client()
+    client.post('/login', data={'username': 'tester', 'password': 'secret'})
+    body = {'parameter': 'area_wage_adjustment', 'target': '-1000'}
+    message = 'A present value of $-1,000.00 cannot be reached with any value between 0.00 and 1,000,000,000,000.00.'
+
+    response = client.post(f'/goal-seek/household/{household.id}', data=body)
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith(f'/household/{evaluee.id}/scenario/{household.id}')
+    with client.session_transaction() as session:
+        assert [text for _, text in session.pop('_flashes')] == [message]
+
+    response = client.post(f'/goal-seek/household/{household.id}', json=body)
+    assert response.status_code == 400 and response.get_json()['error'] == message
+
+    # Pension scenarios have no page of their own, so the form returns to the evaluee
+    response = client.post(f'/goal-seek/pension/{pension.id}', data={'parameter': 'annual_amount', 'target': '-1000'})
+    with app.test_request_context():
+        assert response.headers['Location'].endswith(url_for('evaluee.view', evaluee_id=evaluee.id))
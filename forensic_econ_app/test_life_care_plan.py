@@ -0,0 +1,117 @@
+import math
+import numpy as np
+import pytest
+from forensic_econ_app.utils.date_math import period_fractions
+from forensic_econ_app.utils.life_care_plan import (
+    FREQ_MAP, VERIFY_SAMPLE_ROWS, build_life_care_plan, generate_life_care_plan_table, item_events,
+    life_care_plan_matrices, merge_summary_rows, resolve_verify_level, round_cents, verify_dataframe
+)
+
+ITEMS = [
+    {"name": "Therapy", "base_cost": 125.37, "growth_rate": 0.035, "quantity_per_period": 1 / 52},
+    {"name": "Attendant", "base_cost": 18250.0, "growth_rate": 0.031, "pattern": "continuous", "quantity_per_period": 0.5},
+    {"name": "Surgery", "base_cost": 41000.0, "growth_rate": 0.04, "pattern": "once", "year_offset": 2.5},
+    {"name": "Wheelchair", "base_cost": 3499.99, "growth_rate": 0.02, "pattern": "interval", "year_offset": 1.0,
+     "repeat_interval": 5.0},
+    {"name": "Brace", "base_cost": 650.0, "growth_rate": 0.0, "pattern": "interval", "year_offset": 0.25,
+     "repeat_interval": 0.5, "duration_years": 10.5},
+]
+
+def _reference_cell(item, frac_yr, rate, discounting_enabled):
+    """The original per-cell computation."""
+    pattern = item.get("pattern", "recurring")
+    year_offset = item.get("year_offset", 0.0)
+    if pattern == "once":
+        applies = math.isclose(frac_yr, year_offset, abs_tol=1e-5)
+    elif pattern == "interval":
+        passed = (frac_yr - year_offset) / item.get("repeat_interval", 1.0)
+        applies = (frac_yr >= year_offset - 1e-9 and passed >= -1e-9 and abs(passed - round(passed)) < 1e-5
+                   and ("duration_years" not in item or frac_yr < year_offset + item["duration_years"]))
+    else:
+        applies = True
+    if not applies:
+        return 0.0, 0.0
+    undiscounted = item["base_cost"] * ((1 + item.get("growth_rate", 0.0)) ** frac_yr) * item.get("quantity_per_period", 1.0)
+    discounted = undiscounted / ((1 + rate) ** frac_yr) if discounting_enabled else undiscounted
+    return round(undiscounted, 2), round(discounted, 2)
+
+@pytest.mark.parametrize("frequency", list(FREQ_MAP))
+@pytest.mark.parametrize("discounting_enabled", [True, False])
+def test_matrices_match_per_cell_rounding_exactly(frequency, discounting_enabled):
+    fracs = [frac_yr for _, frac_yr in period_fractions(37.4, FREQ_MAP[frequency], 41.2)]
+    undiscounted, discounted = life_care_plan_matrices(fracs, ITEMS, 0.0425, discounting_enabled)
+    for row, frac_yr in enumerate(fracs):
+        for col, item in enumerate(ITEMS):
+            assert (undiscounted[row, col], discounted[row, col]) == \
+                _reference_cell(item, frac_yr, 0.0425, discounting_enabled)
+
+@pytest.mark.parametrize("item", [
+    {"pattern": "once", "year_offset": 10 / 12},
+    {"pattern": "once", "year_offset": 12 + 1e-5},
+    {"pattern": "interval", "year_offset": 1 / 3, "repeat_interval": 0.1},
+    {"pattern": "interval", "year_offset": 3 / 52, "repeat_interval": 1 / 104, "duration_years": 4},
+    {"pattern": "interval", "year_offset": 0.0, "repeat_interval": 7 / 52},
+])
+def test_item_events_match_per_period_check(item):
+    item = dict(item, name="Event", base_cost=100.0)
+    fracs = [frac_yr for _, frac_yr in period_fractions(12 + 2e-5, 52, 30.0)]
+    expected = [row for row, frac_yr in enumerate(fracs) if _reference_cell(item, frac_yr, 0.0, False)[0]]
+    assert item_events(fracs, item).tolist() == expected
+
+def test_sparse_items_only_raise_factors_at_their_events(monkeypatch):
+    from forensic_econ_app.utils import life_care_plan
+    built = []
+    power_columns = life_care_plan._power_columns
+
+    def recording_power_columns(fracs, rates, *args):
+        built.append(list(rates))
+        return power_columns(fracs, rates, *args)
+
+    monkeypatch.setattr(life_care_plan, "_power_columns", recording_power_columns)
+    items = [item for item in ITEMS if item.get("pattern") in ("once", "interval")]
+    fracs = [frac_yr for _, frac_yr in period_fractions(60.0, 52, 20.0)]
+    undiscounted, _ = life_care_plan_matrices(fracs, items, 0.0425, True, 52)
+    # Only the shared discount column spans every period
+    assert built == [[0.0425]]
+    assert np.count_nonzero(undiscounted) == sum(len(item_events(fracs, item)) for item in items)
+
+def test_round_cents_matches_round_near_half_cents():
+    values = np.array([0.125, 1.005, 2.675, 1.115, 1234.565, 0.285, 10.0049999999, 7.5 / 3])
+    assert round_cents(values).tolist() == [round(float(value), 2) for value in values]
+
+def test_table_totals():
+    df = generate_life_care_plan_table("Medical", 2025, 41.2, 12, ITEMS, 0.0425, frequency="monthly")
+    surgery = df.loc[df["Age"] == "Surgery TOTAL", "Surgery (Undiscounted)"].iloc[0]
+    assert surgery == f"{round(41000.0 * 1.04 ** 2.5, 2):,.2f}"
+
+def test_build_keeps_numeric_table_and_separate_summary():
+    table, summary = build_life_care_plan("Medical", 2025, 41.2, 20, ITEMS, 0.0425, frequency="quarterly")
+    assert all(dtype.kind in "if" for dtype in table.dtypes)
+    surgery = summary["items"][2]
+    assert surgery["name"] == "Surgery"
+    assert surgery["undiscounted"] == pytest.approx(table["Surgery (Undiscounted)"].sum(), abs=1e-6)
+    assert summary["total_discounted"] == pytest.approx(table["Total (Discounted)"].sum(), abs=1e-6)
+
+    merged = merge_summary_rows(table, summary)
+    assert len(merged) == len(table) + len(ITEMS) + 1
+    assert merged["Age"].iloc[0] == f"{41.2:.2f}"
+    assert merged["Total (Undiscounted)"].iloc[-1] == f"{summary['total_undiscounted']:,.2f}"
+
+def test_verify_levels():
+    table, summary = build_life_care_plan("Medical", 2025, 41.2, 60, ITEMS, 0.0425, frequency="weekly")
+    assert len(table) > VERIFY_SAMPLE_ROWS * 10
+    table.loc[[3, 7], "Brace (Discounted)"] = table.loc[[3, 7], "Brace (Undiscounted)"] + 1.0
+
+    with pytest.raises(AssertionError, match=r"2 cell\(s\): item 'Brace' at row index 3 .*row index 7"):
+        verify_dataframe(table, ITEMS, True, summary=summary, level="full")
+    verify_dataframe(table, ITEMS, True, summary=summary, level="sampled")  # rows 3 and 7 are not sampled
+    verify_dataframe(table, ITEMS, True, summary=dict(summary, total_discounted=0.0), level="off")
+    with pytest.raises(AssertionError, match="Grand TOTAL"):
+        verify_dataframe(table, ITEMS, True, summary=dict(summary, total_discounted=0.0), level="sampled")
+    with pytest.raises(ValueError):
+        verify_dataframe(table, ITEMS, True, summary=summary, level="strict")
+
+def test_verify_level_from_config(app):
+    assert resolve_verify_level() == "full"
+    app.config["LIFE_CARE_PLAN_VERIFY_LEVEL"] = "off"
+    assert resolve_verify_level() == "off"
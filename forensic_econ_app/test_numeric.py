@@ -0,0 +1,29 @@
+import pytest
+from decimal import Decimal
+from forensic_econ_app.utils.numeric import resolve_backend
+from forensic_econ_app.utils.calculations import calculate_aef
+from forensic_econ_app.utils.parity import parity_report
+
+def test_backends_agree_to_the_cent_on_corpus():
+    mismatches = [row for row in parity_report() if not row['agrees']]
+    assert mismatches == []
+
+def test_resolve_backend():
+    assert resolve_backend() == 'float64'
+    assert resolve_backend('decimal') == 'decimal'
+    with pytest.raises(ValueError):
+        resolve_backend('int128')
+
+@pytest.mark.parametrize("params", [
+    dict(gross_earnings_base=0.1, worklife_adjustment=3.0, unemployment_factor=0.0,
+         fringe_benefit=0.0, tax_liability=0.0),
+    dict(gross_earnings_base=1.0, worklife_adjustment=0.7, unemployment_factor=0.1,
+         fringe_benefit=0.3, tax_liability=0.05, wrongful_death=True, personal_percentage=0.3),
+])
+def test_float_aef_steps_match_decimal_steps(params):
+    decimal_steps, decimal_aef = calculate_aef(**params, backend='decimal')
+    float_steps, float_aef = calculate_aef(**params, backend='float64')
+    assert float_steps['Step'].tolist() == decimal_steps['Step'].tolist()
+    assert float_steps['Amount'].tolist() == decimal_steps['Amount'].tolist()
+    # The factor itself keeps full precision; only the displayed steps are rounded
+    assert abs(float_aef - decimal_aef) < Decimal('1e-15')
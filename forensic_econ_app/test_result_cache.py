@@ -0,0 +1,25 @@
+from datetime import datetime
+from forensic_econ_app.utils.result_cache import LRUCache, input_fingerprint
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set((1, 'a'), 'first')
+    cache.set((2, 'b'), 'second')
+    assert cache.get((1, 'a')) == 'first'
+    cache.set((3, 'c'), 'third')
+    assert cache.get((2, 'b')) is None
+    assert cache.get((1, 'a')) == 'first'
+
+def test_invalidate_by_scenario_id():
+    cache = LRUCache()
+    cache.set((1, 'a'), 'x')
+    cache.set((1, 'b'), 'y')
+    cache.set((2, 'a'), 'z')
+    assert cache.invalidate(lambda key: key[0] == 1) == 2
+    assert len(cache) == 1
+
+def test_fingerprint_changes_with_inputs():
+    inputs = {'start_date': datetime(2024, 1, 1), 'offset_wages': {2025: 1000.0}, 'discount_rates': [0.03]}
+    changed = dict(inputs, offset_wages={2025: 1500.0})
+    assert input_fingerprint(inputs) == input_fingerprint(dict(inputs))
+    assert input_fingerprint(inputs) != input_fingerprint(changed)
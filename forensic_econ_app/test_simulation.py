@@ -0,0 +1,112 @@
+import math
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import db, EarningsScenario, WageSegment
+from forensic_econ_app.utils.earnings_engine import build_year_grid, compute_earnings_schedule
+from forensic_econ_app.utils.simulation import simulate_earnings_losses
+
+GRID = build_year_grid(datetime(2024, 3, 1), datetime(2050, 6, 30))
+
+def test_seeded_simulation_is_reproducible_across_processes():
+    kwargs = dict(
+        growth_spec={"dist": "normal", "mean": 0.03, "sd": 0.01},
+        discount_spec={"dist": "uniform", "low": 0.02, "high": 0.06},
+        unemployment_spec={"dist": "normal", "mean": 0.04, "sd": 0.01},
+        offset_wages={2030: 25000.0},
+        n_paths=25_000,
+        seed=1234
+    )
+    in_process = simulate_earnings_losses(GRID, 60000.0, 20000.0, 85.0, **kwargs)
+    sharded = simulate_earnings_losses(GRID, 60000.0, 20000.0, 85.0, processes=2, **kwargs)
+    assert in_process == sharded
+    assert in_process["total_pv"][5] < in_process["total_pv"][50] < in_process["total_pv"][95]
+
+def test_fixed_distributions_match_deterministic_schedule():
+    result = simulate_earnings_losses(
+        GRID, 60000.0, 20000.0, 85.0,
+        growth_spec={"dist": "fixed", "value": 0.03},
+        discount_spec={"dist": "fixed", "value": 0.05},
+        offset_wages={2030: 25000.0},
+        n_paths=10, seed=7
+    )
+    schedule = compute_earnings_schedule(GRID, 60000.0, 20000.0, 0.03, 0.05, 85.0, {2030: 25000.0})
+    assert result["total_loss"][50] == pytest.approx(schedule["loss"].sum(), rel=1e-12)
+    assert result["total_pv"][50] == pytest.approx(schedule["total_pv"], rel=1e-12)
+
+SEGMENTS = [{"start_date": datetime(2030, 1, 1), "end_date": datetime(2034, 12, 31),
+             "wage_base": 70000.0, "growth_rate": 0.02}]
+
+def test_fixed_distributions_match_segmented_schedule():
+    result = simulate_earnings_losses(
+        GRID, 60000.0, 20000.0, 85.0,
+        growth_spec={"dist": "fixed", "value": 0.03},
+        discount_spec={"dist": "fixed", "value": 0.05},
+        offset_wages={2040: 25000.0},
+        wage_segments=SEGMENTS,
+        n_paths=10, seed=7
+    )
+    schedule = compute_earnings_schedule(GRID, 60000.0, 20000.0, 0.03, 0.05, 85.0, {2040: 25000.0}, SEGMENTS)
+    assert result["total_loss"][50] == pytest.approx(schedule["loss"].sum(), rel=1e-12)
+    assert result["total_pv"][50] == pytest.approx(schedule["total_pv"], rel=1e-12)
+
+def test_segmented_scenario_routes_match_table(app, evaluee):
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name='Segmented', start_date=datetime(2024, 3, 1),
+                                end_date=datetime(2050, 6, 30), wage_base=60000, residual_base=20000,
+                                growth_rate=Decimal('0.03'), adjustment_factor=Decimal('85'))
+    db.session.add(scenario)
+    db.session.flush()
+    db.session.add(WageSegment(scenario_id=scenario.id, start_date=datetime(2030, 1, 1),
+                               end_date=datetime(2034, 12, 31), wage_base=70000, growth_rate=Decimal('0.02')))
+    db.session.commit()
+    schedule = compute_earnings_schedule(GRID, 60000.0, 20000.0, 0.03, 0.04, 85.0, None, SEGMENTS)
+    client = app.test_client()
+    base = f'/earnings/{evaluee.id}/scenario/{scenario.id}'
+
+    grid = client.get(f'{base}/sensitivity?format=json&growth_min=3&growth_max=3&growth_steps=1'
+                      '&discount_min=4&discount_max=4&discount_steps=1').get_json()
+    assert grid['present_values'][0][0] == pytest.approx(schedule['total_pv'], rel=1e-9)
+
+    simulated = client.get(f'{base}/simulate?format=json&paths=10&seed=1&growth_sd=0'
+                           '&discount_mean=4&discount_sd=0').get_json()
+    assert simulated['total_loss']['50'] == pytest.approx(schedule['loss'].sum(), rel=1e-9)
+    assert simulated['total_pv']['50'] == pytest.approx(schedule['total_pv'], rel=1e-9)
+
+def test_wide_rate_distributions_stay_finite():
+    result = simulate_earnings_losses(
+        GRID, 60000.0, 20000.0, 85.0,
+        growth_spec={"dist": "normal", "mean": 0.03, "sd": 0.8},
+        discount_spec={"dist": "normal", "mean": 0.04, "sd": 0.8},
+        n_paths=2_000, seed=11
+    )
+    values = list(result["total_loss"].values()) + list(result["total_pv"].values())
+    assert all(math.isfinite(value) for value in values)
+    assert math.isfinite(result["mean_pv"])
+
+@pytest.mark.parametrize("specs", [
+    {"growth_spec": {"dist": "fixed", "value": -1.0}},
+    {"discount_spec": {"dist": "normal", "mean": -1.2, "sd": 0.01}},
+    {"discount_spec": {"dist": "uniform", "low": -1.5, "high": 0.05}},
+    {"growth_spec": {"dist": "normal", "mean": 0.03, "sd": -0.01}},
+    {"growth_spec": {"dist": "triangular", "low": 0.0, "mode": 0.1, "high": 0.05}},
+    {"discount_spec": {"dist": "uniform", "low": 0.05}},
+    {"discount_spec": None},
+])
+def test_invalid_specs_are_rejected(specs):
+    kwargs = dict(growth_spec={"dist": "fixed", "value": 0.03}, discount_spec={"dist": "fixed", "value": 0.05})
+    kwargs.update(specs)
+    with pytest.raises(ValueError):
+        simulate_earnings_losses(GRID, 60000.0, 20000.0, 85.0, n_paths=10, seed=1, **kwargs)
+
+def test_simulate_route_caps_paths(app, evaluee):
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name='Capped', start_date=datetime(2024, 3, 1),
+                                end_date=datetime(2040, 6, 30), wage_base=60000, residual_base=20000,
+                                growth_rate=Decimal('0.03'), adjustment_factor=Decimal('85'))
+    db.session.add(scenario)
+    db.session.commit()
+    client = app.test_client()
+    url = f'/earnings/{evaluee.id}/scenario/{scenario.id}/simulate?format=json&seed=3'
+
+    assert client.get(f"{url}&paths={app.config['SIMULATION_MAX_PATHS'] + 1}").status_code == 400
+    assert client.get(url).get_json()['n_paths'] == app.config['SIMULATION_DEFAULT_PATHS']
+    assert client.get(f'{url}&paths=10&discount_mean=-120&discount_sd=1').status_code == 400
@@ -0,0 +1,129 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from forensic_econ_app.models.models import db, EarningsScenario, Evaluee, HealthcareScenario, MedicalItem
+from forensic_econ_app.routes.healthcare import compute_future_medical_costs
+from forensic_econ_app.utils.calculations import compute_earnings_state, present_value_column
+from forensic_econ_app.utils.what_if import earnings_what_if
+
+INPUTS = dict(start_date=datetime(2024, 3, 1), end_date=datetime(2045, 6, 30), wage_base=58000.0,
+              residual_base=14000.0, growth_rate=0.03, discount_rates=[0.04, 0.06], adjustment_factor=85.0,
+              date_of_birth=datetime(1980, 3, 3), offset_wages={2027: 4000.0},
+              wage_segments=[{'start_date': datetime(2030, 1, 1), 'end_date': datetime(2034, 12, 31),
+                              'wage_base': 70000.0, 'growth_rate': 0.02}])
+
+@pytest.mark.parametrize("granularity", ["annual", "monthly"])
+@pytest.mark.parametrize("changes", [
+    {"growth_rate": 0.045}, {"discount_rate": 0.035}, {"adjustment_factor": 72.5},
+    {"growth_rate": 0.01, "discount_rate": 0.05, "adjustment_factor": 90.0}
+])
+def test_earnings_what_if_matches_full_recompute(changes, granularity):
+    state = compute_earnings_state(**INPUTS, granularity=granularity)
+    result = earnings_what_if(state, **changes)
+
+    expected_inputs = dict(INPUTS, granularity=granularity)
+    for name in ("growth_rate", "adjustment_factor"):
+        expected_inputs[name] = changes.get(name, INPUTS[name])
+    if "discount_rate" in changes:
+        expected_inputs["discount_rates"] = [changes["discount_rate"]]
+    expected = compute_earnings_state(**expected_inputs)
+
+    assert result["total_loss"] == pytest.approx(float(expected["schedule"]["loss"].sum()), abs=1e-6)
+    for rate, total in zip(expected["rates"], expected["pv_totals"]):
+        assert result["present_value"][present_value_column(rate)] == pytest.approx(float(total), abs=1e-6)
+
+def test_earnings_what_if_rejects_bad_values():
+    state = compute_earnings_state(**INPUTS)
+    with pytest.raises(ValueError):
+        earnings_what_if(state, adjustment_factor=0)
+    with pytest.raises(ValueError):
+        earnings_what_if(state, discount_rate=-0.01)
+
+@pytest.mark.parametrize("offsets", [(False, False), (True, False), (False, True)])
+def test_medical_what_if_matches_full_recompute(app, evaluee, offsets):
+    partial_offset, total_offset = offsets
+    scenario = HealthcareScenario(evaluee_id=evaluee.id, scenario_name='Plan', growth_method='custom',
+                                  growth_rate_custom=Decimal('0.03'), discount_method='nominal',
+                                  discount_rate=Decimal('0.05'), partial_offset=partial_offset,
+                                  total_offset=total_offset, projection_years=25)
+    db.session.add(scenario)
+    db.session.flush()
+    db.session.add_all([
+        MedicalItem(scenario_id=scenario.id, label='Therapy', annual_cost=Decimal('5200'), start_year=1),
+        MedicalItem(scenario_id=scenario.id, label='Wheelchair', annual_cost=Decimal('3000'), start_year=2,
+                    interval_years=5, growth_rate=Decimal('0.02')),
+        MedicalItem(scenario_id=scenario.id, label='Surgery', annual_cost=Decimal('40000'), start_year=3,
+                    is_one_time=True)
+    ])
+    db.session.commit()
+
+    client = app.test_client()
+    url = f'/healthcare/{evaluee.id}/scenario/{scenario.id}/what-if'
+    baseline = client.get(url).get_json()
+    expected = compute_future_medical_costs(scenario)
+    assert baseline['grand_total_present_value'] == pytest.approx(expected['grand_total_present_value'], abs=1e-6)
+    assert baseline['grand_total_undiscounted'] == pytest.approx(expected['grand_total_undiscounted'], abs=1e-6)
+
+    changed = client.get(url, query_string={'growth_rate': 0.04, 'discount_rate': 0.045}).get_json()
+    scenario.growth_rate_custom = Decimal('0.04')
+    scenario.discount_rate = Decimal('0.045')
+    expected = compute_future_medical_costs(scenario)
+    assert changed['grand_total_present_value'] == pytest.approx(expected['grand_total_present_value'], abs=1e-6)
+    assert changed['grand_total_undiscounted'] == pytest.approx(expected['grand_total_undiscounted'], abs=1e-6)
+
+def test_what_if_routes_check_ownership_and_follow_other_workers_edits(app, evaluee):
+    other = Evaluee(user_id=evaluee.user_id, first_name='Sam', last_name='Roe', state='NY', discount_rates=[4.0])
+    scenario = EarningsScenario(evaluee_id=evaluee.id, scenario_name='Earnings', start_date=datetime(2024, 3, 1),
+                                end_date=datetime(2045, 6, 30), wage_base=58000, residual_base=14000,
+                                growth_rate=Decimal('0.03'), adjustment_factor=Decimal('85'))
+    plan = HealthcareScenario(evaluee_id=evaluee.id, scenario_name='Plan', growth_method='custom',
+                              growth_rate_custom=Decimal('0.03'), discount_rate=Decimal('0.05'), projection_years=20)
+    db.session.add_all([other, scenario, plan])
+    db.session.flush()
+    db.session.add(MedicalItem(scenario_id=plan.id, label='Therapy', annual_cost=Decimal('5200'), start_year=1))
+    db.session.commit()
+
+    client = app.test_client()
+    earnings_url = f'/earnings/{evaluee.id}/scenario/{scenario.id}/what-if'
+    healthcare_url = f'/healthcare/{evaluee.id}/scenario/{plan.id}/what-if'
+    before = client.get(earnings_url).get_json()
+    before_plan = client.get(healthcare_url).get_json()
+
+    # Cached results are never served under another evaluee's URL
+    assert client.get(f'/earnings/{other.id}/scenario/{scenario.id}/what-if').status_code == 400
+    assert client.get(f'/healthcare/{other.id}/scenario/{plan.id}/what-if').status_code == 404
+
+    # An edit committed elsewhere, without invalidating this process's cache, is picked up
+    scenario.wage_base = 64000
+    plan.medical_items[0].annual_cost = Decimal('6000')
+    db.session.commit()
+    after = client.get(earnings_url).get_json()
+    after_plan = client.get(healthcare_url).get_json()
+    assert after['total_loss'] > before['total_loss']
+    assert after_plan['grand_total_undiscounted'] == pytest.approx(
+        before_plan['grand_total_undiscounted'] * 6000 / 5200, rel=1e-12)
+
+def test_items_starting_before_year_one_skip_years_outside_the_projection(app, evaluee):
+    scenario = HealthcareScenario(evaluee_id=evaluee.id, scenario_name='Early', growth_method='custom',
+                                  growth_rate_custom=Decimal('0.03'), discount_rate=Decimal('0.05'), projection_years=10)
+    db.session.add(scenario)
+    db.session.flush()
+    db.session.add_all([
+        MedicalItem(scenario_id=scenario.id, label='Early', annual_cost=Decimal('1000'), start_year=-1,
+                    duration_years=5, interval_years=2),
+        MedicalItem(scenario_id=scenario.id, label='Past', annual_cost=Decimal('5000'), start_year=0,
+                    is_one_time=True)
+    ])
+    db.session.commit()
+
+    results = compute_future_medical_costs(scenario)
+    # Of years -1, 1 and 3 only the last two are projected; the one-time year 0 cost is dropped
+    assert results['grand_total_undiscounted'] == pytest.approx(1000.0 + 1000.0 * 1.03 ** 2)
+    assert results['grand_total_present_value'] == pytest.approx(1000.0 + 1000.0 * 1.03 ** 2 / 1.05 ** 2)
+    response = app.test_client().get(f'/healthcare/{evaluee.id}/scenario/{scenario.id}/what-if').get_json()
+    assert response['grand_total_undiscounted'] == pytest.approx(results['grand_total_undiscounted'])
+    assert response['grand_total_present_value'] == pytest.approx(results['grand_total_present_value'])
+    assert results['excluded_occurrences'] == [{'Service': 'Early', 'Years': [-1]}, {'Service': 'Past', 'Years': [0]}]
+    assert response['excluded_occurrences'] == results['excluded_occurrences']
+    page = app.test_client().get(f'/healthcare/{evaluee.id}/scenario/{scenario.id}').get_data(as_text=True)
+    assert 'Costs before projection year 1 are not included' in page and 'Past (year 0)' in page
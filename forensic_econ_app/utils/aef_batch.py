@@ -0,0 +1,144 @@
+"""
+AEF Batch Module.
+
+Computes Annual Earnings Factors for many sets of inputs at once. Inputs are
+parsed into one array per factor and every AEF is evaluated with array math;
+the formatted step breakdown of calculate_aef is only built for rows a user
+asks to see.
+"""
+
+import csv
+import io
+import json
+import math
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .calculations import calculate_aef
+
+# Input columns, as fractions (0.12 for 12%); personal_percentage is optional
+REQUIRED_FIELDS = (
+    'gross_earnings_base', 'worklife_adjustment', 'unemployment_factor', 'fringe_benefit', 'tax_liability'
+)
+FACTOR_FIELDS = REQUIRED_FIELDS + ('personal_percentage',)
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'on'}
+
+
+def read_aef_upload(data: bytes, filename: str = '') -> List[dict]:
+    """
+    Read AEF input records from an uploaded CSV or JSON file.
+
+    JSON is either an array of objects or {"rows": [...]}; anything else is
+    read as CSV with a header row.
+    """
+    text = data.decode('utf-8-sig')
+    if filename.lower().endswith('.json') or text.lstrip()[:1] in ('[', '{'):
+        payload = json.loads(text)
+        if isinstance(payload, dict):
+            payload = payload.get('rows')
+        if not isinstance(payload, list):
+            raise ValueError('JSON input must be an array of AEF input objects')
+        return payload
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def _is_true(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def _parse_record(record) -> dict:
+    """Validate one input record and convert its factors to floats."""
+    if not isinstance(record, dict):
+        raise ValueError('Each row must be an object of AEF inputs')
+    missing = [f for f in REQUIRED_FIELDS if record.get(f) in (None, '')]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    row = {field: float(record.get(field) or 0.0) for field in FACTOR_FIELDS}
+    if not all(math.isfinite(value) for value in row.values()):
+        raise ValueError('AEF inputs must be finite numbers')
+    wrongful_death = record.get('wrongful_death')
+    # Without an explicit flag, a personal consumption percentage implies a wrongful death case
+    row['wrongful_death'] = row['personal_percentage'] > 0 if wrongful_death in (None, '') else _is_true(wrongful_death)
+    row['personal_type'] = str(record.get('personal_type') or '')
+    row['label'] = str(record.get('label') or '')
+    return row
+
+
+def parse_aef_records(records: Iterable) -> Tuple[List[dict], Dict[int, str]]:
+    """
+    Parse AEF input records, keeping the valid ones.
+
+    Returns the parsed rows in input order (None for invalid rows) and the
+    error message of each invalid row by position.
+    """
+    rows, errors = [], {}
+    for position, record in enumerate(records):
+        try:
+            rows.append(_parse_record(record))
+        except (ValueError, TypeError, AttributeError) as e:
+            rows.append(None)
+            errors[position] = str(e)
+    return rows, errors
+
+
+def compute_aef_batch(rows: List[dict]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every AEF in one pass over factor arrays.
+
+    Follows calculate_aef: gross base x worklife x (1 - unemployment) x
+    (1 - tax) x (1 + fringe), times (1 - personal consumption) for wrongful
+    death rows. Returns the intermediate and final factors as float arrays.
+    """
+    factors = {field: np.array([row[field] for row in rows], dtype=float) for field in FACTOR_FIELDS}
+    wrongful_death = np.array([row['wrongful_death'] for row in rows], dtype=bool)
+
+    adjusted_base = (factors['gross_earnings_base'] * factors['worklife_adjustment']
+                     * (1.0 - factors['unemployment_factor']))
+    tax_adjusted = adjusted_base * (1.0 - factors['tax_liability']) * (1.0 + factors['fringe_benefit'])
+    personal = factors['personal_percentage']
+    aef = tax_adjusted * np.where(wrongful_death & (personal > 0), 1.0 - personal, 1.0)
+    return {'adjusted_base_earnings': adjusted_base, 'fringe_tax_adjusted_earnings': tax_adjusted, 'aef': aef}
+
+
+def aef_batch_table(records: Iterable) -> Tuple[pd.DataFrame, List[dict]]:
+    """
+    Result table for a batch of AEF inputs, one row per input record.
+
+    Invalid records keep their position with an Error and no factors. Also
+    returns the parsed rows, which aef_row_steps needs for a drill-down.
+    """
+    records = list(records)
+    rows, errors = parse_aef_records(records)
+    valid = [position for position, row in enumerate(rows) if row is not None]
+    columns = {
+        'Row': np.arange(1, len(rows) + 1),
+        'Label': [str(record.get('label') or '') if isinstance(record, dict) else '' for record in records]
+    }
+    for field in FACTOR_FIELDS:
+        columns[field] = np.full(len(rows), np.nan)
+        columns[field][valid] = [rows[position][field] for position in valid]
+    for field, values in compute_aef_batch([rows[position] for position in valid]).items():
+        columns[field] = np.full(len(rows), np.nan)
+        columns[field][valid] = values
+    columns['Error'] = [errors.get(position, '') for position in range(len(rows))]
+    return pd.DataFrame(columns), rows
+
+
+def aef_row_steps(row: dict) -> pd.DataFrame:
+    """Formatted step breakdown of one parsed batch row."""
+    steps, _ = calculate_aef(
+        row['gross_earnings_base'],
+        row['worklife_adjustment'],
+        row['unemployment_factor'],
+        row['fringe_benefit'],
+        row['tax_liability'],
+        row['wrongful_death'],
+        row['personal_type'],
+        row['personal_percentage']
+    )
+    return steps
@@ -0,0 +1,107 @@
+"""
+AEF Tornado Module.
+
+One-at-a-time sensitivity of the Annual Earnings Factor. Each input is moved
+to a low and a high value while the others stay at their base values; every
+perturbed set of inputs is stacked into one batch and evaluated in a single
+call to compute_aef_batch. Inputs are then ranked by the swing (high AEF
+minus low AEF) they cause, which is the ordering a tornado chart draws.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .aef_batch import compute_aef_batch
+
+# Inputs a tornado analysis perturbs, with their display labels
+TORNADO_FACTORS = {
+    'worklife_adjustment': 'Worklife Adjustment',
+    'unemployment_factor': 'Unemployment Factor',
+    'tax_liability': 'Tax Liability',
+    'fringe_benefit': 'Fringe Benefit',
+    'personal_percentage': 'Personal Consumption'
+}
+
+# Default perturbation, relative to each input's base value
+DEFAULT_SPREAD = 0.10
+
+
+def tornado_bounds(inputs: dict, spread: float = DEFAULT_SPREAD,
+                   overrides: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Tuple[float, float]]:
+    """
+    Low and high value of every perturbed input.
+
+    Each input moves by spread times its base value, with both ends clipped
+    to [0, 1];
+    overrides gives explicit (low, high) values for some inputs. Personal
+    consumption is only perturbed in wrongful death cases.
+    """
+    if spread < 0:
+        raise ValueError('The perturbation range cannot be negative')
+    overrides = overrides or {}
+    bounds = {}
+    for field in TORNADO_FACTORS:
+        if field == 'personal_percentage' and not inputs.get('wrongful_death'):
+            continue
+        if field in overrides:
+            low, high = overrides[field]
+            if low > high:
+                raise ValueError(f'The low {TORNADO_FACTORS[field].lower()} cannot exceed the high value')
+        else:
+            base = inputs[field]
+            # Clip both ends so a base outside [0, 1] cannot leave low above high
+            low, high = sorted(min(1.0, max(0.0, base * (1 + step))) for step in (-spread, spread))
+        bounds[field] = (float(low), float(high))
+    return bounds
+
+
+def aef_tornado(inputs: dict, bounds: Dict[str, Tuple[float, float]]) -> Dict:
+    """
+    Tornado table of AEF swings for the given input bounds.
+
+    inputs holds the base AEF inputs as fractions (the fields calculate_aef
+    takes). Returns the base AEF, one row per input sorted by descending
+    swing, and chart data with each bar's low and high end relative to the
+    base AEF.
+    """
+    base_row = {
+        'gross_earnings_base': float(inputs['gross_earnings_base']),
+        'worklife_adjustment': float(inputs['worklife_adjustment']),
+        'unemployment_factor': float(inputs['unemployment_factor']),
+        'fringe_benefit': float(inputs['fringe_benefit']),
+        'tax_liability': float(inputs['tax_liability']),
+        'personal_percentage': float(inputs.get('personal_percentage') or 0.0),
+        'wrongful_death': bool(inputs.get('wrongful_death'))
+    }
+    fields = list(bounds)
+    batch = [base_row]
+    for field in fields:
+        low, high = bounds[field]
+        batch.append({**base_row, field: low})
+        batch.append({**base_row, field: high})
+    aef = compute_aef_batch(batch)['aef']
+    base_aef = float(aef[0])
+
+    rows = []
+    for position, field in enumerate(fields):
+        low_aef, high_aef = float(aef[1 + 2 * position]), float(aef[2 + 2 * position])
+        rows.append({
+            'factor': field,
+            'label': TORNADO_FACTORS[field],
+            'base_input': base_row[field],
+            'low_input': bounds[field][0],
+            'high_input': bounds[field][1],
+            'low_aef': low_aef,
+            'high_aef': high_aef,
+            'swing': abs(high_aef - low_aef)
+        })
+    rows.sort(key=lambda row: row['swing'], reverse=True)
+
+    return {
+        'base_aef': base_aef,
+        'rows': rows,
+        'chart': {
+            'labels': [row['label'] for row in rows],
+            'low': [min(row['low_aef'], row['high_aef']) - base_aef for row in rows],
+            'high': [max(row['low_aef'], row['high_aef']) - base_aef for row in rows]
+        }
+    }
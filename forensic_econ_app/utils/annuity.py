@@ -0,0 +1,115 @@
+"""
+Annuity Math Module.
+
+Closed-form present values for growing annuities, shared by the household
+services and pension calculators and the goal-seek evaluators. Every function accepts either
+Decimal or float arguments and returns the same type, so the Decimal-based
+models keep their precision.
+
+The earnings calculators do not use these forms. An earnings table needs
+every row anyway, and the vectorized engine builds all of them in one pass,
+so a closed-form total saves no work there. Its present values are also
+discounted by day-count exponents from the reference date rather than by
+whole periods, so a closed form would only cover the undiscounted loss, and
+it could drift from the sum of the displayed rows. Earnings totals are
+therefore always summed from the schedule arrays.
+"""
+
+from decimal import Decimal
+from typing import Union
+
+Number = Union[Decimal, float]
+
+# Closest a growth/discount ratio may come to 1, short of equalling it, for the closed forms
+RATIO_TOLERANCE = 1e-9
+
+
+def _one(value: Number) -> Number:
+    """Return 1 in the numeric type of value."""
+    return Decimal(1) if isinstance(value, Decimal) else 1.0
+
+
+def growing_annuity_factor(ratio: Number, periods: int) -> Number:
+    """Sum of ratio**k for k = 0..periods-1 (the geometric series)."""
+    one = _one(ratio)
+    if periods <= 0:
+        return ratio * 0
+    if ratio == one:
+        return one * periods
+    return (one - ratio ** periods) / (one - ratio)
+
+
+def qualifies_for_closed_form(growth_rate: Number, discount_rate: Number) -> bool:
+    """
+    True when the closed forms give an accurate present value for these rates.
+
+    A discount rate of -100% or below leaves no positive discount base, and a
+    growth/discount ratio within RATIO_TOLERANCE of 1 (but not equal to it)
+    makes the geometric series divide a cancellation error by a near-zero
+    1 - ratio. Both cases are left to the year-by-year loop.
+    """
+    growth_rate, discount_rate = float(growth_rate), float(discount_rate)
+    if discount_rate <= -1.0:
+        return False
+    ratio = (1.0 + growth_rate) / (1.0 + discount_rate)
+    return ratio == 1.0 or abs(1.0 - ratio) >= RATIO_TOLERANCE
+
+
+def growing_annuity_pv(
+    payment: Number,
+    growth_rate: Number,
+    discount_rate: Number,
+    periods: int,
+    due: bool = False
+) -> Number:
+    """
+    Present value of `periods` payments that grow at growth_rate per period.
+
+    The first payment equals `payment`. Payments fall at the end of each period
+    (annuity-immediate) unless due=True (annuity-due, first payment at time 0).
+    """
+    one = _one(payment)
+    ratio = (one + growth_rate) / (one + discount_rate)
+    pv = payment * growing_annuity_factor(ratio, periods)
+    return pv if due else pv / (one + discount_rate)
+
+
+def deferred_growing_annuity_pv(
+    payment: Number,
+    growth_rate: Number,
+    discount_rate: Number,
+    periods: int,
+    deferral: int,
+    due: bool = False
+) -> Number:
+    """Present value of a growing annuity whose first period starts after `deferral` periods."""
+    one = _one(payment)
+    return growing_annuity_pv(payment, growth_rate, discount_rate, periods, due) / (one + discount_rate) ** deferral
+
+
+def partial_growing_annuity_pv(
+    payment: Number,
+    growth_rate: Number,
+    discount_rate: Number,
+    periods: int,
+    first_portion: Number,
+    last_portion: Number,
+    due: bool = True
+) -> Number:
+    """
+    Present value of a growing annuity whose first and last payments are prorated.
+
+    Payment k (k = 0..periods-1) is payment * (1 + growth_rate)**k, scaled by
+    first_portion for k = 0 and last_portion for k = periods-1. With a single
+    period only first_portion applies. Use discount_rate = 0 for the
+    undiscounted total.
+    """
+    one = _one(payment)
+    if periods <= 0:
+        return payment * 0
+    ratio = (one + growth_rate) / (one + discount_rate)
+    total = growing_annuity_factor(ratio, periods) - (one - first_portion)
+    if periods > 1:
+        total -= (one - last_portion) * ratio ** (periods - 1)
+    pv = payment * total
+    return pv if due else pv / (one + discount_rate)
@@ -1,15 +1,25 @@
 from datetime import datetime
 from decimal import Decimal, getcontext, ROUND_HALF_UP
-from typing import Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 import os
 import decimal
+from .earnings_engine import (
+    build_year_grid, build_period_grid, compute_earnings_schedule, compute_present_value_matrix, compute_sensitivity_grid,
+    patch_offset_year
+)
+from .formatting import format_earnings_frame, format_earnings_row
+from .numeric import float_to_decimal, resolve_backend
 
 # Configure decimal context
 getcontext().prec = 28
 getcontext().rounding = ROUND_HALF_UP
 
+# Rows computed together when streaming an earnings table
+STREAM_CHUNK_ROWS = 120
+
 # Default configuration values
 DEFAULT_CONFIG = {
     "worklife_adjustment": Decimal("0.919"),
@@ -62,52 +72,62 @@ def calculate_aef(
     tax_liability: float,
     wrongful_death: bool = False,
     personal_type: str = "",
-    personal_percentage: float = 0.0
+    personal_percentage: float = 0.0,
+    backend: Optional[str] = None
 ) -> Tuple[pd.DataFrame, Decimal]:
     """Calculate Annual Earnings Factor with detailed steps."""
     try:
-        # Convert inputs to Decimal for precise calculations
-        gross_base = Decimal(str(gross_earnings_base))
-        worklife_adj = Decimal(str(worklife_adjustment))
-        unemp_factor = Decimal(str(unemployment_factor))
-        fringe = Decimal(str(fringe_benefit))
-        tax = Decimal(str(tax_liability))
+        # Convert inputs to the backend's number type; Decimal for the reference path
+        if resolve_backend(backend) == 'float64':
+            num = float
+            as_decimal = lambda x: Decimal(repr(x))
+            pct = lambda x: float_to_decimal(x * 100.0)
+        else:
+            num = lambda x: Decimal(str(x))
+            as_decimal = lambda x: x
+            pct = lambda x: x * Decimal('100')
+        one = num(1)
+        gross_base = num(gross_earnings_base)
+        worklife_adj = num(worklife_adjustment)
+        unemp_factor = num(unemployment_factor)
+        fringe = num(fringe_benefit)
+        tax = num(tax_liability)
         
         # Step-by-step calculations
-        adjusted_base_earnings = gross_base * worklife_adj * (Decimal('1.0') - unemp_factor)
-        tax_adjusted_earnings = adjusted_base_earnings * (Decimal('1.0') - tax)
-        final_adjusted_earnings = tax_adjusted_earnings * (Decimal('1.0') + fringe)
+        adjusted_base_earnings = gross_base * worklife_adj * (one - unemp_factor)
+        tax_adjusted_earnings = adjusted_base_earnings * (one - tax)
+        final_adjusted_earnings = tax_adjusted_earnings * (one + fringe)
         
         # Apply personal consumption adjustment if wrongful death case
         if wrongful_death and personal_percentage > 0:
-            personal_adj = Decimal(str(personal_percentage))
-            final_adjusted_earnings = final_adjusted_earnings * (Decimal('1.0') - personal_adj)
+            personal_adj = num(personal_percentage)
+            final_adjusted_earnings = final_adjusted_earnings * (one - personal_adj)
         
         # Create calculation steps table
         steps = []
-        steps.append(("Gross Earnings Base", gross_base * Decimal('100')))
-        steps.append(("x Worklife Adjustment", worklife_adj * Decimal('100')))
-        steps.append((f"x (1 - {unemp_factor * Decimal('100'):.2f}% Unemployment Factor)", 
-                     (Decimal('1.0') - unemp_factor) * Decimal('100')))
-        steps.append(("= Adjusted Base Earnings", adjusted_base_earnings * Decimal('100')))
-        steps.append((f"x (1 - {tax * Decimal('100'):.2f}% Tax Liabilities)", 
-                     (Decimal('1.0') - tax) * Decimal('100')))
-        steps.append((f"x (1 + {fringe * Decimal('100'):.2f}% Fringe Benefits)", 
-                     (Decimal('1.0') + fringe) * Decimal('100')))
+        steps.append(("Gross Earnings Base", pct(gross_base)))
+        steps.append(("x Worklife Adjustment", pct(worklife_adj)))
+        steps.append((f"x (1 - {pct(unemp_factor):.2f}% Unemployment Factor)", 
+                     pct(one - unemp_factor)))
+        steps.append(("= Adjusted Base Earnings", pct(adjusted_base_earnings)))
+        steps.append((f"x (1 - {pct(tax):.2f}% Tax Liabilities)", 
+                     pct(one - tax)))
+        steps.append((f"x (1 + {pct(fringe):.2f}% Fringe Benefits)", 
+                     pct(one + fringe)))
         steps.append(("= Fringe Benefits/Tax Adjusted Earnings Base", 
-                     final_adjusted_earnings * Decimal('100')))
+                     pct(final_adjusted_earnings)))
         
         if wrongful_death and personal_percentage > 0:
-            steps.append((f"x (1 - {personal_percentage * Decimal('100'):.2f}% Personal Consumption)", 
-                         (Decimal('1.0') - Decimal(str(personal_percentage))) * Decimal('100')))
+            steps.append((f"x (1 - {pct(personal_adj):.2f}% Personal Consumption)", 
+                         pct(one - personal_adj)))
             
-        steps.append(("AEF", final_adjusted_earnings * Decimal('100')))
+        steps.append(("AEF", pct(final_adjusted_earnings)))
         
         # Create DataFrame
         df = pd.DataFrame(steps, columns=['Step', 'Amount'])
         df['Amount'] = df['Amount'].apply(lambda x: f"{x:.2f}%")
         
-        return df, final_adjusted_earnings
+        return df, as_decimal(final_adjusted_earnings)
         
     except (ValueError, decimal.InvalidOperation) as e:
         raise ValueError(f"Error in AEF calculation: {str(e)}")
@@ -141,7 +161,6 @@ def compute_present_value(
 
 def calculate_age(birth_date: datetime, current_date: datetime) -> Decimal:
     """Calculate decimal age at a given date."""
-    days_in_year = 366 if current_date.year % 4 == 0 else 365
     age_days = (current_date - birth_date).days
     return Decimal(str(age_days)) / Decimal("365.25")
 
@@ -151,9 +170,11 @@ def export_to_excel(df: pd.DataFrame, filename: str, include_discounting: bool =
         # Create a copy of the DataFrame to modify
         export_df = df.copy()
         
-        # Drop Present Value column if discounting is not included
-        if not include_discounting and 'Present Value' in export_df.columns:
-            export_df = export_df.drop(columns=['Present Value'])
+        # Drop Present Value column(s) if discounting is not included
+        pv_cols = [col for col in export_df.columns if col.startswith('Present Value')]
+        if not include_discounting and pv_cols:
+            export_df = export_df.drop(columns=pv_cols)
+            pv_cols = []
         
         # Create Excel writer with xlsxwriter engine
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
@@ -176,14 +197,14 @@ def export_to_excel(df: pd.DataFrame, filename: str, include_discounting: bool =
                 worksheet.column_dimensions[col_letter].width = 18
                 
                 # Format cells based on content type
-                if col in ['Wage Base Years', 'Residual Earning Capacity', 'Gross Earnings', 'Loss', 'Present Value']:
+                if col in ['Wage Base Years', 'Residual Earning Capacity', 'Gross Earnings', 'Loss'] + pv_cols:
                     # Currency format for data cells
                     for row in range(2, last_row):
                         cell = f"{col_letter}{row}"
                         worksheet[cell].number_format = '$#,##0.00'
                     
                     # Add sum formula only for Loss and Present Value columns
-                    if col in ['Loss', 'Present Value']:
+                    if col in ['Loss'] + pv_cols:
                         sum_cell = f"{col_letter}{total_row}"
                         worksheet[sum_cell] = f'=SUM({col_letter}2:{col_letter}{last_row-1})'
                         worksheet[sum_cell].number_format = '$#,##0.00'
@@ -220,7 +241,430 @@ def export_to_excel(df: pd.DataFrame, filename: str, include_discounting: bool =
         print(f"Error exporting to Excel: {str(e)}")
         return ""
 
+def _validate_earnings_inputs(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    growth_rate: float,
+    adjustment_factor: float,
+    date_of_birth: Optional[datetime],
+    offset_wages: Optional[dict]
+) -> Dict[int, float]:
+    """Validate earnings inputs and return offset wages keyed by integer year."""
+    if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
+        raise ValueError("Start date and end date must be datetime objects")
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+    if wage_base < 0:
+        raise ValueError("Wage base cannot be negative")
+    if adjustment_factor <= 0:  # Allow any positive adjustment factor
+        raise ValueError("Adjustment factor must be positive")
+    if growth_rate < -1:  # Allow negative growth but not less than -100%
+        raise ValueError("Growth rate cannot be less than -100%")
+    if date_of_birth and date_of_birth > start_date:
+        raise ValueError("Date of birth cannot be after start date")
+
+    offset_wages_dict = {}
+    if offset_wages:
+        try:
+            for year, amount in offset_wages.items():
+                year_int = int(year)
+                if year_int < start_date.year or year_int > end_date.year:
+                    raise ValueError(f"Offset wage year {year} is outside scenario date range")
+                if amount < 0:
+                    raise ValueError(f"Offset wage amount cannot be negative for year {year}")
+                offset_wages_dict[year_int] = float(amount)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid offset wage data: {str(e)}")
+    return offset_wages_dict
+
+def _validate_wage_segments(wage_segments: Optional[List[dict]]) -> List[dict]:
+    """Validate wage segments and return them as float-valued dicts ordered by start date."""
+    segments = []
+    for seg in sorted(wage_segments or [], key=lambda seg: seg["start_date"]):
+        if not isinstance(seg["start_date"], datetime) or not isinstance(seg["end_date"], datetime):
+            raise ValueError("Wage segment dates must be datetime objects")
+        if seg["start_date"] > seg["end_date"]:
+            raise ValueError("Wage segment start date cannot be after its end date")
+        if segments and seg["start_date"] <= segments[-1]["end_date"]:
+            raise ValueError("Wage segments cannot overlap")
+        if seg["wage_base"] < 0:
+            raise ValueError("Wage segment base cannot be negative")
+        if seg["growth_rate"] < -1:
+            raise ValueError("Wage segment growth rate cannot be less than -100%")
+        segments.append({
+            "start_date": seg["start_date"],
+            "end_date": seg["end_date"],
+            "wage_base": float(seg["wage_base"]),
+            "growth_rate": float(seg["growth_rate"])
+        })
+    return segments
+
+def present_value_column(discount_rate: float) -> str:
+    """Column label for the present value at a given decimal discount rate."""
+    return f"Present Value @ {discount_rate * 100:.2f}%"
+
+def _earnings_columns(
+    grid: dict,
+    schedule: dict,
+    pv_columns: Dict[str, list],
+    has_age: bool
+) -> Dict[str, list]:
+    """Raw earnings table columns; formatting is left to utils.formatting."""
+    raw_columns = {"Year": grid["years"].tolist()}
+    if "months" in grid:
+        raw_columns["Month"] = grid["months"].tolist()
+    raw_columns.update({
+        "Portion of Year": grid["portions"].tolist(),
+        "Age": [float(age) if has_age else None for age in grid["ages"]],
+        "Wage Base Years": schedule["wage_base"].tolist(),
+        "Residual Earning Capacity": schedule["residual"].tolist(),
+        "Gross Earnings": schedule["gross"].tolist(),
+        "Loss": schedule["loss"].tolist()
+    })
+    raw_columns.update(pv_columns)
+    return raw_columns
+
 def compute_earnings_table(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    residual_base: float,
+    growth_rate: float,
+    discount_rate: Optional[float],
+    adjustment_factor: float,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None,
+    config: dict = DEFAULT_CONFIG,
+    include_discounting: bool = True,
+    offset_wages: dict = None,
+    backend: Optional[str] = None,
+    granularity: str = "annual",
+    wage_segments: Optional[List[dict]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, Decimal, Decimal]:
+    """
+    Compute earnings table with growth and present value calculations.
+
+    backend selects the vectorized 'float64' engine or the 'decimal' reference
+    loop (see utils.numeric); both produce the same columns and cent totals.
+    granularity "monthly" adds a Month column and one row per calendar month
+    (float64 backend only); see rollup_to_annual for annual totals.
+    wage_segments (float64 backend only) replace the single wage base and
+    growth rate for the date ranges they cover.
+    """
+    use_decimal = resolve_backend(backend) == 'decimal'
+    if use_decimal and granularity == "annual" and not wage_segments:
+        return compute_earnings_table_decimal(
+            start_date, end_date, wage_base, residual_base, growth_rate, discount_rate, adjustment_factor,
+            date_of_birth, reference_start, config, include_discounting, offset_wages
+        )
+    try:
+        if use_decimal:
+            raise ValueError("The decimal backend only supports annual granularity without wage segments")
+        offset_wages_dict = _validate_earnings_inputs(
+            start_date, end_date, wage_base, growth_rate, adjustment_factor, date_of_birth, offset_wages
+        )
+        segments = _validate_wage_segments(wage_segments)
+        if include_discounting and discount_rate is not None:
+            if discount_rate < 0:
+                raise ValueError("Discount rate cannot be negative")
+            discount = float(discount_rate)
+        else:
+            discount = None
+
+        grid = build_period_grid(start_date, end_date, date_of_birth, reference_start, granularity)
+        schedule = compute_earnings_schedule(
+            grid,
+            float(wage_base),
+            float(residual_base),
+            float(growth_rate),
+            discount,
+            float(adjustment_factor),
+            offset_wages_dict,
+            segments
+        )
+
+        pv_columns = {"Present Value": schedule["present_value"].tolist()} if include_discounting else {}
+        raw_df = pd.DataFrame(_earnings_columns(grid, schedule, pv_columns, date_of_birth is not None))
+
+        return raw_df, format_earnings_frame(raw_df), float_to_decimal(schedule["total_pv"]), float_to_decimal(schedule["total_loss"])
+    except (ValueError, TypeError) as e:
+        print(f"Error in compute_earnings_table: {str(e)}")
+        return pd.DataFrame(), pd.DataFrame(), Decimal("0"), Decimal("0")
+
+def compute_earnings_state(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    residual_base: float,
+    growth_rate: float,
+    discount_rates: List[float],
+    adjustment_factor: float,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None,
+    include_discounting: bool = True,
+    offset_wages: dict = None,
+    granularity: str = "annual",
+    wage_segments: Optional[List[dict]] = None
+) -> dict:
+    """
+    Compute an earnings table at every discount rate, keeping the per-period vectors.
+
+    The returned state holds the period grid, the engine schedule, the
+    (periods x rates) present value matrix, the raw DataFrame and the scalar
+    inputs, so a later offset wage change can be applied with
+    apply_offset_wage_change, and a what-if change of rate or adjustment
+    factor with utils.what_if, instead of a full recompute. Raises ValueError
+    on invalid inputs.
+    """
+    offset_wages_dict = _validate_earnings_inputs(
+        start_date, end_date, wage_base, growth_rate, adjustment_factor, date_of_birth, offset_wages
+    )
+    segments = _validate_wage_segments(wage_segments)
+    # A repeated rate would share its column name and totals key, so keep one of each
+    rates = list(dict.fromkeys(float(r) for r in discount_rates)) if include_discounting else []
+    if any(r < 0 for r in rates):
+        raise ValueError("Discount rate cannot be negative")
+
+    grid = build_period_grid(start_date, end_date, date_of_birth, reference_start, granularity)
+    schedule = compute_earnings_schedule(
+        grid,
+        float(wage_base),
+        float(residual_base),
+        float(growth_rate),
+        None,
+        float(adjustment_factor),
+        offset_wages_dict,
+        segments
+    )
+
+    pv_matrix = compute_present_value_matrix(grid, schedule["loss"], rates)
+    pv_columns = {present_value_column(r): pv_matrix[:, k].tolist() for k, r in enumerate(rates)}
+    raw_df = pd.DataFrame(_earnings_columns(grid, schedule, pv_columns, date_of_birth is not None))
+
+    return {
+        "grid": grid,
+        "schedule": schedule,
+        "wage_base": float(wage_base),
+        "residual_base": float(residual_base),
+        "growth_rate": float(growth_rate),
+        "adjustment_factor": float(adjustment_factor),
+        "offset_wages": offset_wages_dict,
+        "wage_segments": segments,
+        "rates": rates,
+        "pv_matrix": pv_matrix,
+        "pv_totals": pv_matrix.sum(axis=0),
+        "raw_df": raw_df
+    }
+
+def earnings_state_results(state: dict) -> Tuple[pd.DataFrame, Dict[float, Decimal], Decimal]:
+    """Return the numeric (raw_df, pv_totals, total_loss) results of an earnings state."""
+    pv_totals = {r: float_to_decimal(float(total)) for r, total in zip(state["rates"], state["pv_totals"])}
+    return state["raw_df"], pv_totals, float_to_decimal(state["schedule"]["total_loss"])
+
+def earnings_state_columns(state: dict) -> Dict[str, list]:
+    """Numeric schedule of an earnings state laid out by column (one list per column)."""
+    raw_df = state["raw_df"]
+    return {col: raw_df[col].tolist() for col in raw_df.columns}
+
+def apply_offset_wage_change(state: dict, year: int, amount: Optional[float]) -> dict:
+    """
+    Return a copy of an earnings state with one year's offset wage set (or removed when amount is None).
+
+    Only the residual, loss and present value cells of that year's rows are
+    recomputed; the totals are adjusted by the delta.
+    """
+    grid = state["grid"]
+    if year < grid["years"][0] or year > grid["years"][-1]:
+        raise ValueError(f"Offset wage year {year} is outside scenario date range")
+    if amount is not None and amount < 0:
+        raise ValueError(f"Offset wage amount cannot be negative for year {year}")
+
+    schedule = {key: value.copy() if isinstance(value, np.ndarray) else value
+                for key, value in state["schedule"].items()}
+    rows, _ = patch_offset_year(grid, schedule, state["residual_base"], year, amount)
+    offset_wages = {y: a for y, a in state["offset_wages"].items() if y != year}
+    if amount is not None:
+        offset_wages[year] = float(amount)
+
+    pv_matrix = state["pv_matrix"].copy()
+    old_rows = pv_matrix[rows].copy()
+    pv_matrix[rows] = compute_present_value_matrix(
+        {"years_from_ref": grid["years_from_ref"][rows]}, schedule["loss"][rows], state["rates"]
+    )
+
+    raw_df = state["raw_df"].copy()
+    cells = {
+        "Residual Earning Capacity": schedule["residual"][rows],
+        "Loss": schedule["loss"][rows]
+    }
+    cells.update({present_value_column(r): pv_matrix[rows, k] for k, r in enumerate(state["rates"])})
+    for col, values in cells.items():
+        raw_df.loc[rows, col] = values
+
+    return {
+        **state,
+        "schedule": schedule,
+        "offset_wages": offset_wages,
+        "pv_matrix": pv_matrix,
+        "pv_totals": state["pv_totals"] + (pv_matrix[rows] - old_rows).sum(axis=0),
+        "raw_df": raw_df
+    }
+
+def compute_earnings_table_multi_rate(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    residual_base: float,
+    growth_rate: float,
+    discount_rates: List[float],
+    adjustment_factor: float,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None,
+    include_discounting: bool = True,
+    offset_wages: dict = None,
+    granularity: str = "annual",
+    wage_segments: Optional[List[dict]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[float, Decimal], Decimal]:
+    """
+    Compute the earnings table once and discount it at every rate in discount_rates.
+
+    Returns one "Present Value @ r%" column per distinct rate and a dict
+    mapping each decimal rate to its total present value.
+    """
+    try:
+        raw_df, pv_totals, total_loss = earnings_state_results(compute_earnings_state(
+            start_date, end_date, wage_base, residual_base, growth_rate, discount_rates, adjustment_factor,
+            date_of_birth, reference_start, include_discounting, offset_wages, granularity,
+            wage_segments
+        ))
+        return raw_df, format_earnings_frame(raw_df), pv_totals, total_loss
+    except (ValueError, TypeError) as e:
+        print(f"Error in compute_earnings_table_multi_rate: {str(e)}")
+        return pd.DataFrame(), pd.DataFrame(), {}, Decimal("0")
+
+def iter_earnings_rows(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    residual_base: float,
+    growth_rate: float,
+    discount_rates: List[float],
+    adjustment_factor: float,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None,
+    include_discounting: bool = True,
+    offset_wages: dict = None,
+    granularity: str = "annual",
+    wage_segments: Optional[List[dict]] = None,
+    chunk_size: int = STREAM_CHUNK_ROWS,
+    formatted: bool = True
+) -> Iterator[Tuple[dict, Optional[dict], Dict[str, float]]]:
+    """
+    Yield earnings table rows as they are computed.
+
+    Each item is (raw_row, display_row, running_totals), where running_totals
+    maps "Loss" and every present value column to its cumulative sum so far.
+    display_row is None when formatted is False.
+    Rows are computed chunk_size at a time, so memory stays bounded however
+    long the horizon is. Raises ValueError on invalid inputs before the first
+    row is produced.
+    """
+    offset_wages_dict = _validate_earnings_inputs(
+        start_date, end_date, wage_base, growth_rate, adjustment_factor, date_of_birth, offset_wages
+    )
+    segments = _validate_wage_segments(wage_segments)
+    # A repeated rate would share its column name and totals key, so keep one of each
+    rates = list(dict.fromkeys(float(r) for r in discount_rates)) if include_discounting else []
+    if any(r < 0 for r in rates):
+        raise ValueError("Discount rate cannot be negative")
+
+    grid = build_period_grid(start_date, end_date, date_of_birth, reference_start, granularity)
+    return _iter_earnings_chunks(grid, float(wage_base), float(residual_base), float(growth_rate), rates,
+                                 float(adjustment_factor), offset_wages_dict, segments, date_of_birth is not None,
+                                 chunk_size, formatted)
+
+def _iter_earnings_chunks(grid, wage_base, residual_base, growth_rate, rates, adjustment_factor,
+                          offset_wages, wage_segments, has_age, chunk_size, formatted):
+    """Row generator behind iter_earnings_rows, run on validated inputs."""
+    running_totals = {"Loss": 0.0, **{present_value_column(r): 0.0 for r in rates}}
+    for lo in range(0, len(grid["years"]), chunk_size):
+        chunk = {key: values[lo:lo + chunk_size] for key, values in grid.items()}
+        first_year, last_year = chunk["years"][0], chunk["years"][-1]
+        schedule = compute_earnings_schedule(
+            chunk,
+            wage_base,
+            residual_base,
+            growth_rate,
+            None,
+            adjustment_factor,
+            {year: amount for year, amount in offset_wages.items() if first_year <= year <= last_year},
+            wage_segments
+        )
+        pv_matrix = compute_present_value_matrix(chunk, schedule["loss"], rates)
+        pv_columns = {present_value_column(r): pv_matrix[:, k].tolist() for k, r in enumerate(rates)}
+        raw_columns = _earnings_columns(chunk, schedule, pv_columns, has_age)
+
+        for i in range(len(chunk["years"])):
+            raw_row = {col: values[i] for col, values in raw_columns.items()}
+            for col in running_totals:
+                running_totals[col] += raw_row[col]
+            yield raw_row, format_earnings_row(raw_row) if formatted else None, dict(running_totals)
+
+def rollup_to_annual(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll a monthly raw earnings table up to one row per calendar year.
+
+    Amounts and year portions are summed; the age is taken from the first
+    month of each year. Annual tables are returned unchanged.
+    """
+    if "Month" not in raw_df.columns:
+        return raw_df
+    aggregations = {col: "sum" for col in raw_df.columns if col not in ("Year", "Month", "Age")}
+    aggregations["Age"] = "first"
+    annual = raw_df.drop(columns="Month").groupby("Year", as_index=False, sort=True).agg(aggregations)
+    return annual[[col for col in raw_df.columns if col != "Month"]]
+
+def compute_earnings_sensitivity(
+    start_date: datetime,
+    end_date: datetime,
+    wage_base: float,
+    residual_base: float,
+    growth_rates: List[float],
+    discount_rates: List[float],
+    adjustment_factor: float,
+    reference_start: Optional[datetime] = None,
+    offset_wages: dict = None,
+    wage_segments: Optional[List[dict]] = None
+) -> pd.DataFrame:
+    """
+    Present value of the earnings loss across a grid of growth and discount rates.
+
+    Returns a DataFrame indexed by growth rate with one column per discount rate
+    (both as decimals). The growth rates replace the scenario growth rate;
+    wage_segments keep their own.
+    """
+    offset_wages_dict = _validate_earnings_inputs(
+        start_date, end_date, wage_base, min(growth_rates), adjustment_factor, None, offset_wages
+    )
+    segments = _validate_wage_segments(wage_segments)
+    if min(discount_rates) < 0:
+        raise ValueError("Discount rate cannot be negative")
+
+    grid = build_year_grid(start_date, end_date, None, reference_start)
+    matrix = compute_sensitivity_grid(
+        grid,
+        float(wage_base),
+        float(residual_base),
+        growth_rates,
+        discount_rates,
+        float(adjustment_factor),
+        offset_wages_dict,
+        segments
+    )
+    return pd.DataFrame(matrix, index=pd.Index(growth_rates, name="Growth Rate"), columns=discount_rates)
+
+def compute_earnings_table_decimal(
     start_date: datetime,
     end_date: datetime,
     wage_base: float,
@@ -234,7 +678,7 @@ def compute_earnings_table(
     include_discounting: bool = True,
     offset_wages: dict = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame, Decimal, Decimal]:
-    """Compute earnings table with growth and present value calculations."""
+    """Reference Decimal implementation of compute_earnings_table, stepping one year at a time."""
     try:
         # Input validation
         if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
@@ -405,5 +849,5 @@ def compute_earnings_table(
         display_df = pd.DataFrame(display_data)
         return raw_df, display_df, total_pv, total_loss
     except (ValueError, TypeError, decimal.InvalidOperation) as e:
-        print(f"Error in compute_earnings_table: {str(e)}")
+        print(f"Error in compute_earnings_table_decimal: {str(e)}")
         return pd.DataFrame(), pd.DataFrame(), Decimal("0"), Decimal("0") 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Date Math Module.
+
+Calendar and day-count helpers shared by the earnings, healthcare and life
+care plan calculators. Year tables (portion of each calendar year covered,
+age at the start of each period and decimal years from a reference date) are
+built in one vectorized pass and memoized by their dates, so repeated
+scenarios for the same evaluee reuse them. Memoized arrays are read-only.
+"""
+
+import math
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Day count used to convert elapsed days into decimal years
+DAYS_PER_YEAR = 365.25
+
+DateLike = Union[date, datetime]
+
+
+def _as_date(value: Optional[DateLike]) -> Optional[date]:
+    """Drop any time component so memoization keys on the calendar day."""
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def days_in_year(year: int) -> int:
+    """Days in a calendar year, using the calculators' every-fourth-year leap rule."""
+    return 366 if year % 4 == 0 else 365
+
+
+def age_at(date_of_birth: DateLike, on_date: DateLike) -> float:
+    """Decimal age on a date: elapsed days over DAYS_PER_YEAR."""
+    return (_as_date(on_date) - _as_date(date_of_birth)).days / DAYS_PER_YEAR
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+@lru_cache(maxsize=512)
+def _year_table(start: date, end: date, date_of_birth: Optional[date], reference: date) -> Dict[str, np.ndarray]:
+    start_day = np.datetime64(start, 'D')
+    end_day = np.datetime64(end, 'D')
+    ref_day = np.datetime64(reference, 'D')
+
+    years = np.arange(start.year, end.year + 1)
+    year_starts = (years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    year_ends = (years - 1970 + 1).astype('datetime64[Y]').astype('datetime64[D]') - 1
+
+    # The first and last periods are clipped to the range
+    period_starts = year_starts.copy()
+    period_starts[0] = start_day
+    period_ends = year_ends.copy()
+    period_ends[-1] = end_day
+
+    days_in_period = (period_ends - period_starts).astype(np.int64) + 1
+    year_lengths = np.where(years % 4 == 0, 366, 365)
+
+    if date_of_birth is not None:
+        ages = (period_starts - np.datetime64(date_of_birth, 'D')).astype(np.int64) / DAYS_PER_YEAR
+    else:
+        ages = np.full(len(years), np.nan)
+
+    return {
+        "years": _read_only(years),
+        "portions": _read_only(days_in_period / year_lengths),
+        "growth_periods": _read_only(years - start.year),
+        "ages": _read_only(ages),
+        "years_from_ref": _read_only((period_starts - ref_day).astype(np.int64) / DAYS_PER_YEAR),
+        "period_starts": _read_only(period_starts),
+        "period_ends": _read_only(period_ends)
+    }
+
+
+def year_table(
+    start_date: DateLike,
+    end_date: DateLike,
+    date_of_birth: Optional[DateLike] = None,
+    reference_start: Optional[DateLike] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calendar-year table for a start/end date range, memoized by its dates.
+
+    Returns read-only arrays with one entry per calendar year: the year, the
+    portion of the year falling inside the range, the growth exponent (years
+    since the start year), the age at the start of the period (NaN without a
+    date of birth), the decimal years from the reference date (default: the
+    start date) and the first and last day of each period (datetime64[D]).
+    """
+    start = _as_date(start_date)
+    return _year_table(start, _as_date(end_date), _as_date(date_of_birth), _as_date(reference_start) or start)
+
+
+@lru_cache(maxsize=512)
+def _month_table(start: date, end: date, date_of_birth: Optional[date], reference: date) -> Dict[str, np.ndarray]:
+    start_day = np.datetime64(start, 'D')
+    end_day = np.datetime64(end, 'D')
+    ref_day = np.datetime64(reference, 'D')
+
+    month_numbers = np.arange(start.year * 12 + start.month - 1, end.year * 12 + end.month)
+    month_starts = (month_numbers - 1970 * 12).astype('datetime64[M]').astype('datetime64[D]')
+    month_ends = (month_numbers - 1970 * 12 + 1).astype('datetime64[M]').astype('datetime64[D]') - 1
+
+    # The first and last periods are clipped to the range
+    period_starts = month_starts.copy()
+    period_starts[0] = start_day
+    period_ends = month_ends.copy()
+    period_ends[-1] = end_day
+
+    days_in_period = (period_ends - period_starts).astype(np.int64) + 1
+    days_in_month = (month_ends - month_starts).astype(np.int64) + 1
+
+    if date_of_birth is not None:
+        ages = (period_starts - np.datetime64(date_of_birth, 'D')).astype(np.int64) / DAYS_PER_YEAR
+    else:
+        ages = np.full(len(month_numbers), np.nan)
+
+    return {
+        "years": _read_only(month_numbers // 12),
+        "months": _read_only(month_numbers % 12 + 1),
+        "portions": _read_only(days_in_period / days_in_month / 12),
+        "growth_periods": _read_only(month_numbers // 12 - start.year),
+        "ages": _read_only(ages),
+        "years_from_ref": _read_only((period_starts - ref_day).astype(np.int64) / DAYS_PER_YEAR),
+        "period_starts": _read_only(period_starts),
+        "period_ends": _read_only(period_ends)
+    }
+
+
+def month_table(
+    start_date: DateLike,
+    end_date: DateLike,
+    date_of_birth: Optional[DateLike] = None,
+    reference_start: Optional[DateLike] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calendar-month table for a start/end date range, memoized by its dates.
+
+    Same keys as year_table plus "months", with one entry per calendar month.
+    Portions are fractions of a year (a full month is 1/12, prorated by days
+    in the first and last months), so annual amounts apply unchanged. Growth
+    periods step once per calendar year like year_table's, so every month of
+    a year shares that year's growth and the months roll up to the annual
+    schedule.
+    """
+    start = _as_date(start_date)
+    return _month_table(start, _as_date(end_date), _as_date(date_of_birth), _as_date(reference_start) or start)
+
+
+@lru_cache(maxsize=256)
+def period_fractions(
+    duration_years: float,
+    periods_per_year: int,
+    start_age: float = 0.0
+) -> Tuple[Tuple[int, float], ...]:
+    """
+    (period index, years elapsed) for each period of a duration, memoized.
+
+    Periods fall every 1/periods_per_year years from zero through the end of
+    the duration, plus a final partial period when the duration does not
+    divide evenly. The end check is made on ages (start_age + elapsed) so the
+    result matches the life care plan's historical period list exactly.
+    """
+    total_periods = int(math.floor(duration_years * periods_per_year))
+    fractional_part = (duration_years * periods_per_year) - total_periods
+    end_age = start_age + duration_years
+
+    periods = [
+        (p_idx, p_idx / float(periods_per_year))
+        for p_idx in range(total_periods + 1)
+        if start_age + p_idx / float(periods_per_year) <= end_age
+    ]
+    if fractional_part > 1e-6:
+        frac_yr = (total_periods + fractional_part) / float(periods_per_year)
+        if start_age + frac_yr <= end_age:
+            periods.append((total_periods + 1, frac_yr))
+    return tuple(periods)
+
+
+def clear_caches() -> None:
+    """Drop every memoized table."""
+    _year_table.cache_clear()
+    _month_table.cache_clear()
+    period_fractions.cache_clear()
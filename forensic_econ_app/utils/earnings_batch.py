@@ -0,0 +1,108 @@
+"""
+Earnings Batch Module.
+
+Recomputes many earnings scenarios in one call: every scenario of an evaluee,
+or a user's whole caseload. Evaluee-level inputs (date of birth, discount
+rates, discounting flag) are read once per evaluee, year grids are shared
+through date_math's memoized tables and cached states are reused. Scenarios
+that need computing run concurrently on a thread pool, and every changed
+result is written back in a single transaction.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+from .calculations import compute_earnings_state, earnings_state_results
+from .result_cache import earnings_cache, input_fingerprint
+from .result_writer import persist_results_batch
+
+DEFAULT_WORKERS = 4
+
+
+def evaluee_inputs(evaluee) -> dict:
+    """Earnings inputs that come from the evaluee and are shared by all of their scenarios."""
+    return {
+        'discount_rates': [rate / 100 for rate in evaluee.discount_rates] if evaluee.uses_discounting else [],
+        'date_of_birth': evaluee.date_of_birth,
+        'include_discounting': evaluee.uses_discounting
+    }
+
+
+def scenario_inputs(scenario, shared: dict) -> dict:
+    """Collect every input that determines a scenario's earnings table."""
+    return {
+        'start_date': scenario.start_date,
+        'end_date': scenario.end_date,
+        'wage_base': float(scenario.wage_base),
+        'residual_base': float(scenario.residual_base),
+        'growth_rate': float(scenario.growth_rate),
+        'adjustment_factor': float(scenario.adjustment_factor),
+        'offset_wages': {ow.year: float(ow.amount) for ow in scenario.offset_wages},
+        'wage_segments': [
+            {
+                'start_date': seg.start_date,
+                'end_date': seg.end_date,
+                'wage_base': float(seg.wage_base),
+                'growth_rate': float(seg.growth_rate)
+            }
+            for seg in scenario.wage_segments
+        ],
+        **shared
+    }
+
+
+def scenario_cache_key(scenario_id: int, inputs: dict) -> Tuple[int, str]:
+    """Cache key for a scenario's earnings state under the given inputs."""
+    return (scenario_id, input_fingerprint(inputs))
+
+
+def cached_earnings_state(key: Hashable, inputs: dict) -> dict:
+    """Return the cached earnings state for key, computing and caching it on a miss."""
+    state = earnings_cache.get(key)
+    if state is None:
+        state = compute_earnings_state(**inputs)
+        earnings_cache.set(key, state)
+    return state
+
+
+def recompute_earnings_scenarios(scenarios: Iterable, workers: int = DEFAULT_WORKERS) -> List[Dict]:
+    """
+    Recompute a set of earnings scenarios and persist their results together.
+
+    Model attributes are read on the calling thread; only the array work runs
+    on the pool. Returns one summary per scenario with its present value and
+    total loss, or the error that stopped it. Scenarios that fail are left
+    untouched and do not block the others from being written.
+    """
+    shared_inputs = {}
+    jobs = []
+    for scenario in scenarios:
+        evaluee = scenario.evaluee
+        if evaluee.id not in shared_inputs:
+            shared_inputs[evaluee.id] = evaluee_inputs(evaluee)
+        inputs = scenario_inputs(scenario, shared_inputs[evaluee.id])
+        jobs.append((scenario, scenario_cache_key(scenario.id, inputs), inputs))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(cached_earnings_state, key, inputs) for _, key, inputs in jobs]
+
+    summaries, updates = [], []
+    for (scenario, _, _), future in zip(jobs, futures):
+        summary = {'scenario_id': scenario.id, 'evaluee_id': scenario.evaluee_id, 'scenario_name': scenario.scenario_name}
+        try:
+            _, pv_totals, total_loss = earnings_state_results(future.result())
+        except (ValueError, TypeError) as e:
+            summary['error'] = str(e)
+            summaries.append(summary)
+            continue
+        # The first discount rate remains the scenario's headline present value
+        present_value = next(iter(pv_totals.values()), total_loss)
+        updates.append((scenario, {'present_value': present_value, 'total_loss': total_loss}))
+        summary.update(present_value=round(float(present_value), 2), total_loss=round(float(total_loss), 2))
+        summaries.append(summary)
+
+    changed = persist_results_batch(updates)
+    for summary in summaries:
+        if 'error' not in summary:
+            summary['changed'] = summary['scenario_id'] in changed
+    return summaries
@@ -0,0 +1,258 @@
+"""
+Vectorized Earnings Engine Module.
+
+This module computes earnings loss schedules as NumPy arrays covering the whole
+horizon in one pass: year portions, growth factors, wage segments, offset
+overrides, losses and present values. It backs compute_earnings_table in
+calculations.py.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .date_math import month_table, year_table
+
+GRANULARITIES = ("annual", "monthly")
+
+
+def build_year_grid(
+    start_date: datetime,
+    end_date: datetime,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Build the calendar-year grid for a start/end date range.
+
+    Returns a dict of read-only arrays with one entry per calendar year: the
+    year, the portion of the year falling inside the range, the growth
+    exponent (years since the start year), the age at the start of the period
+    (NaN without a date of birth) and the decimal years from the reference
+    date. Grids are memoized by date_math.year_table.
+    """
+    return year_table(start_date, end_date, date_of_birth, reference_start)
+
+
+def build_period_grid(
+    start_date: datetime,
+    end_date: datetime,
+    date_of_birth: Optional[datetime] = None,
+    reference_start: Optional[datetime] = None,
+    granularity: str = "annual"
+) -> Dict[str, np.ndarray]:
+    """
+    Build the period grid for a granularity: calendar years or calendar months.
+
+    Monthly grids carry an extra "months" array; their portions are fractions
+    of a year, so the schedule functions below work on either grid.
+    """
+    if granularity == "annual":
+        return year_table(start_date, end_date, date_of_birth, reference_start)
+    if granularity == "monthly":
+        return month_table(start_date, end_date, date_of_birth, reference_start)
+    raise ValueError(f"Unsupported granularity: '{granularity}'. Must be one of {list(GRANULARITIES)}.")
+
+
+def offset_rows(grid: Dict[str, np.ndarray], offset_wages: Dict[int, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid rows falling in an offset year, and the annual offset amount for each row."""
+    years = grid["years"]
+    rows = np.nonzero(np.isin(years, np.fromiter(offset_wages.keys(), dtype=np.int64)))[0]
+    amounts = np.array([offset_wages[int(year)] for year in years[rows]], dtype=float)
+    return rows, amounts
+
+
+def segment_wage_parts(grid: Dict[str, np.ndarray], wage_segments: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unprorated segment wages and uncovered share of each grid period.
+
+    Each segment is a dict with start_date, end_date, wage_base and
+    growth_rate; its base grows from the segment's start year and is
+    weighted by the days of each period it covers. Every segment is evaluated
+    at once as a (segments x periods) matrix. Returns the summed segment
+    wages and the share of each period no segment covers, which falls back to
+    the scenario wage_base and growth_rate.
+    """
+    period_starts, period_ends = grid["period_starts"], grid["period_ends"]
+    seg_starts = np.array([seg["start_date"] for seg in wage_segments], dtype='datetime64[D]')
+    seg_ends = np.array([seg["end_date"] for seg in wage_segments], dtype='datetime64[D]')
+    bases = np.array([seg["wage_base"] for seg in wage_segments], dtype=float)
+    rates = np.array([seg["growth_rate"] for seg in wage_segments], dtype=float)
+
+    overlap_days = (
+        np.minimum(seg_ends[:, np.newaxis], period_ends[np.newaxis, :])
+        - np.maximum(seg_starts[:, np.newaxis], period_starts[np.newaxis, :])
+    ).astype(np.int64) + 1
+    overlap_days = np.clip(overlap_days, 0, None)
+    period_days = (period_ends - period_starts).astype(np.int64) + 1
+    coverage = overlap_days / period_days
+
+    # Growth periods of each segment's start year, relative to the grid's first row (which may be a chunk)
+    seg_years = seg_starts.astype('datetime64[Y]').astype(np.int64) + 1970
+    seg_offsets = (seg_years - grid["years"][0]) + grid["growth_periods"][0]
+
+    exponents = np.where(coverage > 0, grid["growth_periods"][np.newaxis, :] - seg_offsets[:, np.newaxis], 0.0)
+    segment_wages = bases[:, np.newaxis] * (1.0 + rates[:, np.newaxis]) ** exponents * coverage
+    return segment_wages.sum(axis=0), np.clip(1.0 - coverage.sum(axis=0), 0.0, None)
+
+
+def segment_wage_vector(
+    grid: Dict[str, np.ndarray],
+    wage_base: float,
+    growth_rate: float,
+    wage_segments: List[dict]
+) -> np.ndarray:
+    """
+    Prorated wage base for each grid period under a list of wage segments.
+
+    Days not covered by any segment fall back to the scenario wage_base and
+    growth_rate (see segment_wage_parts).
+    """
+    segment_wages, uncovered = segment_wage_parts(grid, wage_segments)
+    fallback = wage_base * (1.0 + growth_rate) ** grid["growth_periods"] * uncovered
+    return (segment_wages + fallback) * grid["portions"]
+
+def compute_earnings_schedule(
+    grid: Dict[str, np.ndarray],
+    wage_base: float,
+    residual_base: float,
+    growth_rate: float,
+    discount_rate: Optional[float],
+    adjustment_factor: float,
+    offset_wages: Optional[Dict[int, float]] = None,
+    wage_segments: Optional[List[dict]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the earnings loss schedule over a year grid.
+
+    adjustment_factor is a percentage (100 = no adjustment) and discount_rate
+    is a decimal, or None to skip discounting. Offset wages replace the grown
+    residual earning capacity for their year and are prorated by the portion.
+    wage_segments, if given, replace the single wage path (see
+    segment_wage_vector); the residual keeps the scenario growth rate.
+    """
+    portions = grid["portions"]
+    growth_factors = (1.0 + growth_rate) ** grid["growth_periods"]
+
+    if wage_segments:
+        wage = segment_wage_vector(grid, wage_base, growth_rate, wage_segments)
+    else:
+        wage = wage_base * growth_factors * portions
+    gross = wage * (adjustment_factor / 100.0)
+    residual = residual_base * growth_factors * portions
+
+    if offset_wages:
+        rows, amounts = offset_rows(grid, offset_wages)
+        residual[rows] = amounts * portions[rows]
+
+    loss = gross - residual
+
+    if discount_rate:
+        discount_factors = (1.0 + discount_rate) ** (-grid["years_from_ref"])
+    else:
+        discount_factors = np.ones(len(portions))
+    present_value = loss * discount_factors
+
+    total_loss = float(loss.sum())
+    total_pv = float(present_value.sum()) if discount_rate else total_loss
+
+    return {
+        "growth_factors": growth_factors,
+        "wage_base": wage,
+        "residual": residual,
+        "gross": gross,
+        "loss": loss,
+        "discount_factors": discount_factors,
+        "present_value": present_value,
+        "total_loss": total_loss,
+        "total_pv": total_pv
+    }
+
+
+def patch_offset_year(
+    grid: Dict[str, np.ndarray],
+    schedule: Dict[str, np.ndarray],
+    residual_base: float,
+    year: int,
+    amount: Optional[float]
+) -> Tuple[np.ndarray, float]:
+    """
+    Apply a single offset wage change to a schedule in place.
+
+    amount replaces the residual for the year, or None restores the grown
+    residual base. Only the rows of that year (one row, or twelve on a
+    monthly grid) change, and the totals are adjusted by the delta. Returns
+    the changed row indices and the total change in loss.
+    """
+    rows = np.nonzero(grid["years"] == year)[0]
+    portions = grid["portions"][rows]
+    if amount is None:
+        residual = residual_base * schedule["growth_factors"][rows] * portions
+    else:
+        residual = amount * portions
+
+    delta = schedule["residual"][rows] - residual
+    schedule["residual"][rows] = residual
+    schedule["loss"][rows] += delta
+    schedule["present_value"][rows] = schedule["loss"][rows] * schedule["discount_factors"][rows]
+
+    schedule["total_loss"] += float(delta.sum())
+    schedule["total_pv"] += float((delta * schedule["discount_factors"][rows]).sum())
+    return rows, float(delta.sum())
+
+
+def compute_present_value_matrix(
+    grid: Dict[str, np.ndarray],
+    loss: np.ndarray,
+    discount_rates
+) -> np.ndarray:
+    """
+    Discount an undiscounted loss vector at several rates at once.
+
+    Returns a (years x rates) matrix; only the discount vector changes per rate.
+    """
+    rates = np.asarray(discount_rates, dtype=float)
+    discount_factors = (1.0 + rates[np.newaxis, :]) ** (-grid["years_from_ref"][:, np.newaxis])
+    return loss[:, np.newaxis] * discount_factors
+
+
+def compute_sensitivity_grid(
+    grid: Dict[str, np.ndarray],
+    wage_base: float,
+    residual_base: float,
+    growth_rates,
+    discount_rates,
+    adjustment_factor: float,
+    offset_wages: Optional[Dict[int, float]] = None,
+    wage_segments: Optional[List[dict]] = None
+) -> np.ndarray:
+    """
+    Present value of the earnings loss for every growth/discount rate pair.
+
+    The schedule is broadcast across a (growth x years) loss matrix and a
+    (discount x years) discount matrix; their product gives the
+    (growth x discount) present-value matrix without recomputing any table.
+    With wage_segments, segment wages keep their own growth rates and only
+    the uncovered wage and the residual follow each growth rate.
+    """
+    portions = grid["portions"]
+    growth = np.asarray(growth_rates, dtype=float)
+    discount = np.asarray(discount_rates, dtype=float)
+
+    growth_factors = (1.0 + growth[:, np.newaxis]) ** grid["growth_periods"][np.newaxis, :]
+    if wage_segments:
+        segment_wages, uncovered = segment_wage_parts(grid, wage_segments)
+        wage = (segment_wages + wage_base * growth_factors * uncovered) * portions
+        gross = wage * (adjustment_factor / 100.0)
+    else:
+        gross = wage_base * (adjustment_factor / 100.0) * portions * growth_factors
+    residual = residual_base * portions * growth_factors
+
+    if offset_wages:
+        rows, amounts = offset_rows(grid, offset_wages)
+        residual[:, rows] = amounts * portions[rows]
+
+    loss = gross - residual
+    discount_factors = (1.0 + discount[:, np.newaxis]) ** (-grid["years_from_ref"][np.newaxis, :])
+    return loss @ discount_factors.T
@@ -0,0 +1,75 @@
+"""
+Factor Cache Module.
+
+Shared LRU cache of compounding factor vectors. The life care plan,
+healthcare, household and pension calculators grow and discount at a small
+set of rates over similar horizons, so each vector of (1 + rate) ** t is
+built once per (rate, periods_per_year, n_periods, convention) and handed
+out as a read-only NumPy array. Factors are raised with Python's float
+power, the same operation the per-period loops use, so drawing from the
+cache never changes a result. Hit and miss counters show how well the
+cache is sized.
+"""
+
+import threading
+from typing import Dict
+
+import numpy as np
+
+from .result_cache import LRUCache
+
+# 'growth' vectors hold (1 + rate) ** t, 'discount' vectors 1 / (1 + rate) ** t
+FACTOR_CONVENTIONS = ("growth", "discount")
+
+# Factor vectors keyed by (rate, periods_per_year, n_periods, convention)
+factor_cache = LRUCache(maxsize=512)
+
+_MISSING = object()
+_counters = {"hits": 0, "misses": 0}
+_counter_lock = threading.Lock()
+
+
+def factor_vector(rate: float, periods_per_year: int, n_periods: int, convention: str = "growth") -> np.ndarray:
+    """
+    Read-only vector of n_periods compounding factors at an annual rate.
+
+    Entry k is taken at t = k / periods_per_year years, so entry 0 is the
+    present period (factor 1). End-of-period timing asks for one more period
+    and drops entry 0.
+    """
+    if convention not in FACTOR_CONVENTIONS:
+        raise ValueError(f"Unknown factor convention '{convention}'")
+    if periods_per_year < 1:
+        raise ValueError("Periods per year must be at least 1")
+    if n_periods < 0:
+        raise ValueError("Number of periods cannot be negative")
+
+    key = (float(rate), int(periods_per_year), int(n_periods), convention)
+    vector = factor_cache.get(key, _MISSING)
+    with _counter_lock:
+        _counters["hits" if vector is not _MISSING else "misses"] += 1
+    if vector is not _MISSING:
+        return vector
+
+    base = 1 + key[0]
+    step = float(key[1])
+    powers = [base ** (k / step) for k in range(key[2])]
+    if convention == "discount":
+        powers = [1 / power for power in powers]
+    vector = np.array(powers, dtype=float)
+    vector.setflags(write=False)
+    factor_cache.set(key, vector)
+    return vector
+
+
+def factor_cache_info() -> Dict[str, int]:
+    """Hit and miss counts since the last clear, with the current and maximum number of vectors."""
+    with _counter_lock:
+        return {**_counters, "size": len(factor_cache), "maxsize": factor_cache.maxsize}
+
+
+def clear_factor_cache() -> None:
+    """Drop every cached vector and reset the counters."""
+    factor_cache.clear()
+    with _counter_lock:
+        _counters["hits"] = _counters["misses"] = 0
@@ -0,0 +1,76 @@
+"""
+Presentation Formatting Module.
+
+The calculators return numbers only; this module turns them into display
+strings on demand. Templates use the registered Jinja filters, and
+format_earnings_frame builds a formatted copy of a raw earnings table for
+callers that still want one. Nothing here runs unless something is displayed.
+"""
+
+from decimal import Decimal
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from .numeric import float_to_cents
+
+
+def currency(value) -> str:
+    """$1,234.56, rounding half-up to the cent like the Decimal calculators."""
+    if value is None:
+        return ""
+    if not isinstance(value, Decimal):
+        value = float_to_cents(float(value))
+    return f"${value:,.2f}"
+
+
+def percent(value) -> str:
+    """Format a fraction as a percentage, e.g. 0.8361 -> 83.61%."""
+    if value is None:
+        return ""
+    return "{:.2%}".format(value)
+
+
+def decimal_age(value: Optional[float]) -> str:
+    """Format an age to two decimals, blank when unknown."""
+    if value is None or pd.isna(value):
+        return ""
+    return f"{value:.2f}"
+
+
+def _earnings_formatter(column: str) -> Optional[Callable]:
+    """Formatter for an earnings table column, or None to leave it as is."""
+    if column == "Portion of Year":
+        return percent
+    if column == "Age":
+        return decimal_age
+    if column in ("Wage Base Years", "Residual Earning Capacity", "Gross Earnings", "Loss") \
+            or column.startswith("Present Value"):
+        return currency
+    return None
+
+
+def format_earnings_row(row: Dict) -> Dict:
+    """Formatted copy of one raw earnings row."""
+    formatted = {}
+    for column, value in row.items():
+        formatter = _earnings_formatter(column)
+        formatted[column] = formatter(value) if formatter else value
+    return formatted
+
+
+def format_earnings_frame(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """Formatted (display) copy of a raw earnings DataFrame."""
+    display_columns = {}
+    for column in raw_df.columns:
+        formatter = _earnings_formatter(column)
+        values = raw_df[column].tolist()
+        display_columns[column] = [formatter(v) for v in values] if formatter else values
+    return pd.DataFrame(display_columns)
+
+
+def register_template_filters(app) -> None:
+    """Expose the formatters to Jinja as |currency, |percent and |age."""
+    app.add_template_filter(currency, 'currency')
+    app.add_template_filter(percent, 'percent')
+    app.add_template_filter(decimal_age, 'age')
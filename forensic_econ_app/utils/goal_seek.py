@@ -0,0 +1,243 @@
+"""
+Goal Seek Module.
+
+Solves for the value of one scenario parameter (a discount rate, growth rate
+or amount) that makes a present value equal a target. Each model gets an
+evaluator: a closure over the scenario's inputs that maps a trial parameter
+value to a present value with array math or the closed-form annuities. The
+evaluator is handed to a bracketed root finder (the Illinois variant of
+regula falsi), which keeps the root bracketed while converging superlinearly.
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .annuity import growing_annuity_pv
+from .earnings_engine import build_period_grid, compute_earnings_schedule
+
+# Stop once the present value is within half a cent of the target
+DEFAULT_TOLERANCE = 0.005
+MAX_ITERATIONS = 100
+MAX_BRACKET_EXPANSIONS = 60
+
+# Initial half-width of the search bracket around the current value, and hard limits
+RATE_STEP = 0.01
+RATE_LIMITS = (-0.99, 10.0)
+AMOUNT_STEP = 0.1  # relative to the current value
+AMOUNT_LIMITS = (0.0, 1e12)
+
+# Free parameters per model, mapped to their kind
+PARAMETERS = {
+    'earnings': {
+        'discount_rate': 'rate', 'growth_rate': 'rate', 'wage_base': 'amount', 'adjustment_factor': 'amount'
+    },
+    'household': {
+        'discount_rate': 'rate', 'growth_rate': 'rate', 'area_wage_adjustment': 'amount',
+        'reduction_percentage': 'amount'
+    },
+    'pension': {
+        'discount_rate': 'rate', 'growth_rate': 'rate', 'annual_amount': 'amount'
+    }
+}
+
+
+class TargetNotReachableError(ValueError):
+    """The target present value cannot be bracketed anywhere in the parameter's search range."""
+
+    def __init__(self, target: float, lower: float, upper: float, kind: str):
+        self.target, self.lower, self.upper = target, lower, upper
+        if kind == 'rate':
+            searched = f'any rate between {lower:.2%} and {upper:.2%}'
+        else:
+            searched = f'any value between {lower:,.2f} and {upper:,.2f}'
+        super().__init__(f'A present value of ${target:,.2f} cannot be reached with {searched}.')
+
+
+def _check_parameter(model: str, parameter: str) -> str:
+    if parameter not in PARAMETERS[model]:
+        raise ValueError(
+            f"Unsupported parameter '{parameter}' for {model}; expected one of {', '.join(PARAMETERS[model])}"
+        )
+    return PARAMETERS[model][parameter]
+
+
+def earnings_evaluator(inputs: dict, parameter: str) -> Callable[[float], float]:
+    """
+    Present value of an earnings scenario as a function of one input.
+
+    inputs are the earnings scenario inputs (see earnings_batch.scenario_inputs).
+    The PV is taken at the first discount rate, or is the undiscounted total
+    loss when the evaluee does not use discounting. The period grid is built
+    once and reused by every evaluation.
+    """
+    _check_parameter('earnings', parameter)
+    rates = inputs['discount_rates'] if inputs.get('include_discounting', True) else []
+    if parameter == 'discount_rate' and not rates:
+        raise ValueError('The evaluee does not use discounting, so the discount rate cannot be solved for')
+
+    grid = build_period_grid(inputs['start_date'], inputs['end_date'], inputs.get('date_of_birth'),
+                             inputs.get('reference_start'), inputs.get('granularity', 'annual'))
+    params = {
+        'wage_base': float(inputs['wage_base']),
+        'residual_base': float(inputs['residual_base']),
+        'growth_rate': float(inputs['growth_rate']),
+        'discount_rate': float(rates[0]) if rates else None,
+        'adjustment_factor': float(inputs['adjustment_factor']),
+        'offset_wages': {int(year): float(amount) for year, amount in (inputs.get('offset_wages') or {}).items()},
+        'wage_segments': inputs.get('wage_segments') or None
+    }
+
+    def evaluate(value: float) -> float:
+        trial = dict(params, **{parameter: value})
+        return compute_earnings_schedule(grid, **trial)['total_pv']
+
+    evaluate.current = params[parameter]
+    return evaluate
+
+
+def household_evaluator(scenario, parameter: str) -> Callable[[float], float]:
+    """Present value of a household services scenario as a function of one input."""
+    _check_parameter('household', parameter)
+    stages = [(float(stage.annual_value), stage.years) for stage in scenario.stages]
+    if not stages:
+        raise ValueError('The household services scenario has no stages')
+    params = {
+        field: float(getattr(scenario, field))
+        for field in ('area_wage_adjustment', 'reduction_percentage', 'growth_rate', 'discount_rate')
+    }
+
+    def evaluate(value: float) -> float:
+        p = dict(params, **{parameter: value})
+        adjustment = p['area_wage_adjustment'] * p['reduction_percentage']
+        return sum(growing_annuity_pv(annual_value * adjustment, p['growth_rate'], p['discount_rate'], years)
+                   for annual_value, years in stages)
+
+    evaluate.current = params[parameter]
+    return evaluate
+
+
+def pension_evaluator(scenario, parameter: str) -> Callable[[float], float]:
+    """
+    Present value of a pension scenario as a function of one input.
+
+    annual_amount is the annual contribution or the annual pension benefit,
+    depending on the scenario's calculation method.
+    """
+    _check_parameter('pension', parameter)
+    contributions = scenario.calculation_method == 'contributions'
+    params = {
+        'growth_rate': float(scenario.growth_rate),
+        'discount_rate': float(scenario.discount_rate),
+        'annual_amount': float(scenario.annual_contribution if contributions else scenario.annual_pension_benefit)
+    }
+    if contributions:
+        periods = scenario.years_to_retirement
+    else:
+        periods = scenario.life_expectancy - scenario.retirement_age + 1
+
+    def evaluate(value: float) -> float:
+        p = dict(params, **{parameter: value})
+        if contributions:
+            return growing_annuity_pv(p['annual_amount'] * (1 + p['growth_rate']), p['growth_rate'],
+                                      p['discount_rate'], periods)
+        return growing_annuity_pv(p['annual_amount'], p['growth_rate'], p['discount_rate'], periods, due=True)
+
+    evaluate.current = params[parameter]
+    return evaluate
+
+
+def _expand_bracket(f: Callable[[float], float], lower: float, upper: float,
+                    limits: Tuple[float, float]) -> Optional[Tuple[float, float, float, float, int]]:
+    """
+    Widen [lower, upper] within limits until f changes sign.
+
+    Returns the bracket, f at its ends and the evaluations used, or None when
+    f keeps one sign across the whole range.
+    """
+    f_lower, f_upper = f(lower), f(upper)
+    evaluations = 2
+    for _ in range(MAX_BRACKET_EXPANSIONS):
+        if f_lower * f_upper <= 0:
+            return lower, upper, f_lower, f_upper, evaluations
+        width = upper - lower
+        if lower > limits[0]:
+            lower = max(limits[0], lower - width)
+            f_lower = f(lower)
+            evaluations += 1
+        if upper < limits[1]:
+            upper = min(limits[1], upper + width)
+            f_upper = f(upper)
+            evaluations += 1
+        if lower <= limits[0] and upper >= limits[1]:
+            break
+    if f_lower * f_upper <= 0:
+        return lower, upper, f_lower, f_upper, evaluations
+    return None
+
+
+def solve(
+    evaluate: Callable[[float], float],
+    target: float,
+    kind: str = 'rate',
+    lower: Optional[float] = None,
+    upper: Optional[float] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS
+) -> Dict:
+    """
+    Find the parameter value at which evaluate(value) equals target.
+
+    kind ('rate' or 'amount') picks the hard limits and the default bracket,
+    a narrow interval around evaluate.current (the scenario's own value) when
+    the evaluator has one. The bracket is widened until it contains a root,
+    then narrowed with the Illinois method. Returns the value, the present
+    value there, the residual (present value minus target), the iteration
+    count (function evaluations), whether the tolerance was met and the
+    elapsed milliseconds. Raises TargetNotReachableError when no value in the
+    search range brackets the target.
+    """
+    started = time.perf_counter()
+    limits = RATE_LIMITS if kind == 'rate' else AMOUNT_LIMITS
+    current = float(getattr(evaluate, 'current', 0.0))
+    step = RATE_STEP if kind == 'rate' else max(abs(current) * AMOUNT_STEP, 1.0)
+    lower = max(limits[0], current - step) if lower is None else float(lower)
+    upper = min(limits[1], current + step) if upper is None else float(upper)
+    if lower >= upper:
+        raise ValueError('The lower bound must be below the upper bound')
+
+    def f(value):
+        return evaluate(value) - target
+
+    search_range = (min(lower, limits[0]), max(upper, limits[1]))
+    bracket = _expand_bracket(f, lower, upper, search_range)
+    if bracket is None:
+        raise TargetNotReachableError(target, *search_range, kind)
+    a, b, fa, fb, iterations = bracket
+    x, fx = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+    side = 0
+    while abs(fx) > tolerance and iterations < max_iterations and b - a > 1e-15 * max(1.0, abs(b)):
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = f(x)
+        iterations += 1
+        if fx * fb > 0:
+            b, fb = x, fx
+            if side == -1:
+                fa /= 2
+            side = -1
+        elif fa * fx > 0:
+            a, fa = x, fx
+            if side == 1:
+                fb /= 2
+            side = 1
+        else:
+            break
+
+    return {
+        'value': x,
+        'present_value': fx + target,
+        'target': target,
+        'residual': fx,
+        'iterations': iterations,
+        'converged': abs(fx) <= tolerance,
+        'elapsed_ms': (time.perf_counter() - started) * 1000
+    }
@@ -6,10 +6,16 @@ with extensive validations, multiple patterns of item occurrences, and detailed
 """
 
 import math
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from decimal import Decimal
 
+from flask import current_app, has_app_context
+
+from .date_math import period_fractions
+from .factor_cache import factor_vector
+
 # Frequency mapping for different time periods
 FREQ_MAP = {
     "annual": 1,
@@ -20,6 +26,23 @@ FREQ_MAP = {
     "weekly": 52
 }
 
+# How much of a finished table verify_dataframe audits: nothing, a sample of rows, or every row
+VERIFY_LEVELS = ("off", "sampled", "full")
+DEFAULT_VERIFY_LEVEL = "full"
+# Rows checked per item at the 'sampled' level, spread evenly from the first period to the last
+VERIFY_SAMPLE_ROWS = 64
+# Violating rows listed per item in a verification error
+VERIFY_REPORT_ROWS = 10
+
+def resolve_verify_level(level: Optional[str] = None) -> str:
+    """Return the verification level for a call, consulting app config when none is given."""
+    if level is None:
+        level = (current_app.config.get("LIFE_CARE_PLAN_VERIFY_LEVEL", DEFAULT_VERIFY_LEVEL)
+                 if has_app_context() else DEFAULT_VERIFY_LEVEL)
+    if level not in VERIFY_LEVELS:
+        raise ValueError(f"Unknown verification level '{level}'; expected one of {', '.join(VERIFY_LEVELS)}")
+    return level
+
 def verify_inputs(
     start_year: int,
     start_age: float,
@@ -59,52 +82,83 @@ def verify_inputs(
                 f"Item '{name}' has unsupported pattern '{pattern}'. "
                 "Must be one of: 'once', 'interval', 'recurring', or 'continuous'."
             )
+        if pattern == "interval" and item.get("repeat_interval", 1.0) <= 0:
+            raise ValueError(
+                f"Item '{name}' has a non-positive repeat_interval ({item.get('repeat_interval')}); not allowed."
+            )
 
 def verify_dataframe(
     df: pd.DataFrame, 
     items: list,
     discounting_enabled: bool,
-    debug: bool = False
+    debug: bool = False,
+    summary: Optional[Dict] = None,
+    level: Optional[str] = None
 ) -> None:
     """
     Performs post-calculation checks on the final DataFrame:
       1. If discounting is enabled, check that discounted cost <= undiscounted cost for each row/item.
-      2. Check that the final sum row(s) match column sums.
-    Raises an AssertionError if any issue is found.
+      2. Check that the grand totals match column sums; the totals come from
+         summary when given (for a numeric table from build_life_care_plan),
+         otherwise from the Grand TOTAL row.
+    level ('off', 'sampled' or 'full', default LIFE_CARE_PLAN_VERIFY_LEVEL)
+    skips the checks, runs check 1 on VERIFY_SAMPLE_ROWS evenly spaced rows,
+    or runs it on every row. Check 2 always covers the whole table.
+    Raises an AssertionError listing every violation found.
     """
+    level = resolve_verify_level(level)
+    if level == "off":
+        return
+
     # 1. If discounting is enabled, ensure discounted <= undiscounted
-    if discounting_enabled:
-        for item in items:
-            undisc_col = f"{item['name']} (Undiscounted)"
-            disc_col   = f"{item['name']} (Discounted)"
-            for idx, row in df.iterrows():
-                # Skip summary rows that do not hold numeric data
-                if isinstance(row[undisc_col], (int, float)) and isinstance(row[disc_col], (int, float)):
-                    if row[disc_col] > row[undisc_col] + 1e-6:  # small float allowance
-                        raise AssertionError(
-                            f"Discounted value {row[disc_col]} exceeds Undiscounted {row[undisc_col]}"
-                            f" at row index {idx} for item '{item['name']}'."
-                        )
+    if discounting_enabled and items:
+        rows = df.index
+        if level == "sampled" and len(df) > VERIFY_SAMPLE_ROWS:
+            rows = df.index[np.unique(np.linspace(0, len(df) - 1, VERIFY_SAMPLE_ROWS).astype(int))]
+        # Summary rows hold strings; coercing them to NaN leaves them out of the comparison
+        undiscounted = np.column_stack([
+            pd.to_numeric(df.loc[rows, f"{item['name']} (Undiscounted)"], errors="coerce").to_numpy(dtype=float)
+            for item in items
+        ])
+        discounted = np.column_stack([
+            pd.to_numeric(df.loc[rows, f"{item['name']} (Discounted)"], errors="coerce").to_numpy(dtype=float)
+            for item in items
+        ])
+        violations = discounted > undiscounted + 1e-6  # small float allowance
+        if violations.any():
+            details = []
+            for c in np.nonzero(violations.any(axis=0))[0]:
+                bad = np.nonzero(violations[:, c])[0]
+                cells = ", ".join(f"row index {rows[r]} ({discounted[r, c]} > {undiscounted[r, c]})"
+                                  for r in bad[:VERIFY_REPORT_ROWS])
+                more = f" and {len(bad) - VERIFY_REPORT_ROWS} more" if len(bad) > VERIFY_REPORT_ROWS else ""
+                details.append(f"item '{items[c]['name']}' at {cells}{more}")
+            raise AssertionError(
+                f"Discounted value exceeds Undiscounted in {int(violations.sum())} cell(s): {'; '.join(details)}."
+            )
 
     # 2. Check that summary rows match the sums
-    grand_total_idx = df.index[df['Age'] == "Grand TOTAL"].tolist()
-    if len(grand_total_idx) == 0:
-        if debug:
-            print("No Grand TOTAL row found to verify.")
-        return
-    
-    grand_total_idx = grand_total_idx[0]
     undiscounted_total_col = "Total (Undiscounted)"
     discounted_total_col = "Total (Discounted)"
-    
-    if undiscounted_total_col in df.columns and discounted_total_col in df.columns:
+    if undiscounted_total_col not in df.columns or discounted_total_col not in df.columns:
+        return
+
+    if summary is not None:
+        undisc_values = df[undiscounted_total_col]
+        disc_values = df[discounted_total_col]
+        reported_undisc = summary["total_undiscounted"]
+        reported_disc = summary["total_discounted"]
+    else:
+        grand_total_idx = df.index[df['Age'] == "Grand TOTAL"].tolist()
+        if len(grand_total_idx) == 0:
+            if debug:
+                print("No Grand TOTAL row found to verify.")
+            return
+
+        grand_total_idx = grand_total_idx[0]
         # Convert values to numeric, coercing errors to NaN
         undisc_values = pd.to_numeric(df.loc[:grand_total_idx-1, undiscounted_total_col], errors='coerce')
         disc_values = pd.to_numeric(df.loc[:grand_total_idx-1, discounted_total_col], errors='coerce')
-        
-        # Sum only the numeric values
-        actual_undisc_sum = undisc_values.sum()
-        actual_disc_sum = disc_values.sum()
 
         reported_undisc = df.loc[grand_total_idx, undiscounted_total_col]
         reported_disc = df.loc[grand_total_idx, discounted_total_col]
@@ -114,22 +168,194 @@ def verify_dataframe(
         if isinstance(reported_disc, str):
             reported_disc = float(reported_disc.replace(",", ""))
 
-        if abs(actual_undisc_sum - reported_undisc) > 1e-3:
-            raise AssertionError(
-                f"Grand TOTAL (Undiscounted) mismatch: Expected ~{actual_undisc_sum:.2f}, "
-                f"Found {reported_undisc:.2f}"
-            )
-        if abs(actual_disc_sum - reported_disc) > 1e-3:
-            raise AssertionError(
-                f"Grand TOTAL (Discounted) mismatch: Expected ~{actual_disc_sum:.2f}, "
-                f"Found {reported_disc:.2f}"
-            )
+    # Sum only the numeric values
+    actual_undisc_sum = undisc_values.sum()
+    actual_disc_sum = disc_values.sum()
+
+    if abs(actual_undisc_sum - reported_undisc) > 1e-3:
+        raise AssertionError(
+            f"Grand TOTAL (Undiscounted) mismatch: Expected ~{actual_undisc_sum:.2f}, "
+            f"Found {reported_undisc:.2f}"
+        )
+    if abs(actual_disc_sum - reported_disc) > 1e-3:
+        raise AssertionError(
+            f"Grand TOTAL (Discounted) mismatch: Expected ~{actual_disc_sum:.2f}, "
+            f"Found {reported_disc:.2f}"
+        )
 
-        if debug:
-            print(f"Grand TOTAL verification OK. Undiscounted: {actual_undisc_sum:.2f}, "
-                  f"Discounted: {actual_disc_sum:.2f}.")
+    if debug:
+        print(f"Grand TOTAL verification OK. Undiscounted: {actual_undisc_sum:.2f}, "
+              f"Discounted: {actual_disc_sum:.2f}.")
+
+SPARSE_PATTERNS = ("once", "interval")
+
+def _candidate_periods(frac: np.ndarray, times: np.ndarray, window: float) -> np.ndarray:
+    """Indices of the periods within window years of any of the given times."""
+    lo = np.searchsorted(frac, times - window, side="left")
+    hi = np.searchsorted(frac, times + window, side="right")
+    counts = hi - lo
+    if not counts.sum():
+        return np.empty(0, dtype=np.intp)
+    starts = np.repeat(lo - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+    return np.unique(starts + np.arange(counts.sum()))
+
+def item_events(fracs: Sequence[float], item: dict) -> np.ndarray:
+    """
+    Period indices at which a 'once' or 'interval' item is incurred.
 
-def generate_life_care_plan_table(
+    Only the periods next to each scheduled occurrence (year_offset plus a
+    whole number of repeat_intervals) are examined, with the tolerances of
+    the original per-cell checks, so the work scales with the number of
+    occurrences rather than the number of periods.
+    """
+    frac = np.asarray(fracs, dtype=float)
+    pattern = item.get("pattern", "recurring").lower()
+    year_offset = item.get("year_offset", 0.0)
+    if not len(frac):
+        return np.empty(0, dtype=np.intp)
+
+    if pattern == "once":
+        tolerance = max(1e-5, 1e-9 * max(abs(year_offset), abs(frac[-1])))
+        rows = _candidate_periods(frac, np.array([year_offset]), 2 * tolerance)
+        # math.isclose(frac, year_offset, abs_tol=1e-5) with its default rel_tol
+        tolerance = np.maximum(1e-9 * np.maximum(np.abs(frac[rows]), abs(year_offset)), 1e-5)
+        return rows[np.abs(frac[rows] - year_offset) <= tolerance]
+
+    repeat_interval = item.get("repeat_interval", 1.0)
+    last = frac[-1]
+    if "duration_years" in item:
+        last = min(last, year_offset + item["duration_years"])
+    if last < year_offset - 1e-9:
+        return np.empty(0, dtype=np.intp)
+    n_occurrences = int((last - year_offset) / repeat_interval) + 2
+    if n_occurrences < len(frac):
+        occurrences = year_offset + repeat_interval * np.arange(n_occurrences)
+        rows = _candidate_periods(frac, occurrences, 2e-5 * repeat_interval + 1e-9)
+    else:
+        # An item recurring at least once per period is checked in every period
+        rows = np.arange(len(frac))
+    intervals_passed = (frac[rows] - year_offset) / repeat_interval
+    applies = (
+        (frac[rows] >= year_offset - 1e-9)
+        & (intervals_passed >= -1e-9)
+        & (np.abs(intervals_passed - np.round(intervals_passed)) < 1e-5)
+    )
+    if "duration_years" in item:
+        applies &= frac[rows] < year_offset + item["duration_years"]
+    return rows[applies]
+
+def applicability_mask(fracs: Sequence[float], items: list) -> np.ndarray:
+    """
+    Boolean (periods x items) mask of the periods in which each item is incurred.
+
+    fracs are the years elapsed at each period. Recurring and continuous items
+    apply in every period; 'once' items in the period at their year_offset;
+    'interval' items every repeat_interval years from year_offset, until
+    year_offset + duration_years when a duration is given (see item_events).
+    """
+    mask = np.zeros((len(fracs), len(items)), dtype=bool)
+    for col, item in enumerate(items):
+        pattern = item.get("pattern", "recurring").lower()
+        if pattern in ["recurring", "continuous"]:
+            mask[:, col] = True
+        elif pattern in SPARSE_PATTERNS:
+            mask[item_events(fracs, item), col] = True
+    return mask
+
+def _regular_periods(frac: np.ndarray, periods_per_year: Optional[int]) -> int:
+    """Number of leading periods that fall exactly on the k / periods_per_year grid."""
+    if not periods_per_year:
+        return 0
+    on_grid = frac == np.arange(len(frac)) / float(periods_per_year)
+    return len(frac) if on_grid.all() else int(np.argmin(on_grid))
+
+def _power_columns(
+    fracs: Sequence[float],
+    rates: Sequence[float],
+    periods_per_year: Optional[int] = None
+) -> np.ndarray:
+    """
+    (periods x len(rates)) matrix of (1 + rate) ** frac.
+
+    Periods on the k / periods_per_year grid are drawn from the shared
+    factor cache; the rest (a final partial period, or every period when
+    periods_per_year is not given) are raised with Python's float power.
+    Either way every factor is bit-for-bit the one the per-cell loop computed.
+    """
+    frac = np.asarray(fracs, dtype=float)
+    regular = _regular_periods(frac, periods_per_year)
+    columns = {}
+    for rate in rates:
+        if rate not in columns:
+            base = 1 + rate
+            tail = [base ** frac_yr for frac_yr in frac[regular:].tolist()]
+            head = factor_vector(rate, periods_per_year, regular) if regular else []
+            columns[rate] = np.concatenate([head, tail])
+    return np.array([columns[rate] for rate in rates], dtype=float).reshape(len(rates), len(frac)).T
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to cents exactly as Python's round(value, 2) does.
+
+    Scaling by 100 and rounding to the nearest integer agrees with round()
+    except where the scaled value sits within rounding error of a half cent;
+    those few cells are settled with round() itself.
+    """
+    scaled = values * 100.0
+    rounded = np.rint(scaled) / 100.0
+    distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    near_half = distance <= np.abs(scaled) * 1e-12 + 1e-9
+    for index in zip(*np.nonzero(near_half)):
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
+
+def life_care_plan_matrices(
+    fracs: Sequence[float],
+    items: list,
+    annual_discount_rate: float,
+    discounting_enabled: bool = True,
+    periods_per_year: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rounded undiscounted and discounted (periods x items) cost matrices.
+
+    Recurring and continuous items are computed as one dense block, with
+    growth factors built once per distinct rate. 'once' and 'interval'
+    items are expanded into sparse events (see item_events) whose costs are
+    computed only at their occurrences and scattered into the matrices.
+    Both use the per-cell order of operations, so every cell matches
+    round(base_cost * (1 + g) ** t * quantity [/ (1 + r) ** t], 2).
+    Cells where an item does not apply are zero. Given periods_per_year,
+    growth and discount factors come from the shared factor cache.
+    """
+    frac = np.asarray(fracs, dtype=float)
+    undiscounted = np.zeros((len(frac), len(items)))
+    discounted = np.zeros((len(frac), len(items)))
+    discount = _power_columns(frac, [annual_discount_rate], periods_per_year)[:, 0] if discounting_enabled else None
+
+    dense = [col for col, item in enumerate(items)
+             if item.get("pattern", "recurring").lower() in ["recurring", "continuous"]]
+    if dense:
+        block = [items[col] for col in dense]
+        base_costs = np.array([item["base_cost"] for item in block], dtype=float)
+        quantities = np.array([item.get("quantity_per_period", 1.0) for item in block], dtype=float)
+        growth = _power_columns(frac, [item.get("growth_rate", 0.0) for item in block], periods_per_year)
+        costs = (base_costs * growth) * quantities
+        undiscounted[:, dense] = round_cents(costs)
+        discounted[:, dense] = round_cents(costs / discount[:, None]) if discounting_enabled else undiscounted[:, dense]
+
+    for col, item in enumerate(items):
+        if item.get("pattern", "recurring").lower() not in SPARSE_PATTERNS:
+            continue
+        rows = item_events(frac, item)
+        growth_base = 1 + item.get("growth_rate", 0.0)
+        growth = np.array([growth_base ** frac_yr for frac_yr in frac[rows].tolist()], dtype=float)
+        costs = (float(item["base_cost"]) * growth) * float(item.get("quantity_per_period", 1.0))
+        undiscounted[rows, col] = round_cents(costs)
+        discounted[rows, col] = round_cents(costs / discount[rows]) if discounting_enabled else undiscounted[rows, col]
+    return undiscounted, discounted
+
+def build_life_care_plan(
     category_name: str,
     start_year: int,
     start_age: float,
@@ -138,12 +364,20 @@ def generate_life_care_plan_table(
     annual_discount_rate: float = 0.03,
     discounting_enabled: bool = True,
     frequency: str = "annual",
-    debug: bool = False
-) -> pd.DataFrame:
+    debug: bool = False,
+    verify_level: Optional[str] = None
+) -> Tuple[pd.DataFrame, Dict]:
     """
-    Generates a comprehensive life care plan table with extensive validations,
-    multiple patterns of item occurrences, separate Undiscounted and Discounted columns,
-    and final summary rows. Allows sub-year frequencies (monthly, quarterly, etc.).
+    Builds a life care plan as a numeric period table and a separate summary.
+
+    The table has one row per period with typed columns: Period Index and
+    Calendar Year (int), Age (float) and the Undiscounted/Discounted cost of
+    each item plus their row totals (float). The summary holds each item's
+    totals and the grand totals:
+        {"items": [{"name", "undiscounted", "discounted"}, ...],
+         "total_undiscounted": float, "total_discounted": float}
+    Use merge_summary_rows to get the display table with TOTAL rows.
+    verify_level is passed to verify_dataframe.
     """
     if debug:
         print("\nDEBUG: Life Care Plan Table Generation")
@@ -170,126 +404,38 @@ def generate_life_care_plan_table(
         print(f"Total periods: {total_periods}")
         print(f"Fractional part: {fractional_part}")
 
-    period_tuples = []
-    for p_idx in range(total_periods + 1):
-        frac_yr = p_idx / float(periods_per_year)
-        current_age = start_age + frac_yr
-        if current_age <= (start_age + duration_years):
-            period_tuples.append((p_idx, frac_yr))
-            if debug and (p_idx == 0 or p_idx == total_periods):
-                print(f"\nDEBUG: Period {p_idx}:")
-                print(f"Year fraction: {frac_yr}")
-                print(f"Current age: {current_age}")
-
-    if fractional_part > 1e-6:
-        final_p_idx = total_periods + 1
-        frac_yr = (total_periods + fractional_part) / float(periods_per_year)
-        current_age = start_age + frac_yr
-        if current_age <= (start_age + duration_years):
-            period_tuples.append((final_p_idx, frac_yr))
-            if debug:
-                print(f"\nDEBUG: Final fractional period:")
-                print(f"Period index: {final_p_idx}")
-                print(f"Year fraction: {frac_yr}")
-                print(f"Current age: {current_age}")
+    period_tuples = period_fractions(duration_years, periods_per_year, start_age)
+    if debug:
+        for p_idx, frac_yr in (period_tuples[0], period_tuples[-1]):
+            print(f"\nDEBUG: Period {p_idx}:")
+            print(f"Year fraction: {frac_yr}")
+            print(f"Current age: {start_age + frac_yr}")
 
-    rows = []
-    item_totals_undiscounted = {it["name"]: 0.0 for it in items}
-    item_totals_discounted = {it["name"]: 0.0 for it in items}
-
-    for (p_idx, frac_yr) in period_tuples:
-        cal_year = start_year + int(frac_yr)
-        current_age = start_age + frac_yr
-
-        row_data = {
-            "Period Index": p_idx,
-            "Calendar Year": cal_year,
-            "Age": f"{current_age:.2f}"
-        }
-
-        if debug and p_idx == 0:
-            print(f"\nDEBUG: First period details:")
-            print(f"Period Index: {p_idx}")
-            print(f"Calendar Year: {cal_year}")
-            print(f"Current Age: {current_age}")
-
-        for item in items:
-            name = item["name"]
-            base_cost = item["base_cost"]
-            growth_rate = item.get("growth_rate", 0.0)
-            pattern = item.get("pattern", "recurring").lower()
-            quantity_per_period = item.get("quantity_per_period", 1.0)
-            year_offset = item.get("year_offset", 0.0)
-            repeat_interval = item.get("repeat_interval", 1.0)
-
-            if debug and p_idx == 0:
-                print(f"\nDEBUG: Processing item {name} in first period:")
-                print(f"Base Cost: {base_cost}")
-                print(f"Growth Rate: {growth_rate}")
-                print(f"Pattern: {pattern}")
-                print(f"Year Offset: {year_offset}")
-
-            applies = False
-            if pattern in ["recurring", "continuous"]:
-                applies = True
-            elif pattern == "once":
-                if math.isclose(frac_yr, year_offset, abs_tol=1e-5):
-                    applies = True
-            elif pattern == "interval":
-                if frac_yr >= year_offset - 1e-9:
-                    intervals_passed = (frac_yr - year_offset) / repeat_interval
-                    if intervals_passed >= -1e-9:
-                        if abs(intervals_passed - round(intervals_passed)) < 1e-5:
-                            # Check if we're within the duration period
-                            if "duration_years" in item:
-                                duration_years = item["duration_years"]
-                                cutoff_year = year_offset + duration_years
-                                applies = frac_yr < cutoff_year
-                                if debug:
-                                    print(f"\nDEBUG: Duration check for {name} at year {cal_year}:")
-                                    print(f"Current year fraction: {frac_yr}")
-                                    print(f"Year offset: {year_offset}")
-                                    print(f"Duration years: {duration_years}")
-                                    print(f"Cutoff year: {cutoff_year}")
-                                    print(f"Applies: {applies}")
-                            else:
-                                applies = True
-                                if debug:
-                                    print(f"\nDEBUG: No duration limit for {name} at year {cal_year}")
-
-            if debug and p_idx == 0:
-                print(f"Applies in first period: {applies}")
-
-            if not applies:
-                row_data[name + " (Undiscounted)"] = 0.00
-                row_data[name + " (Discounted)"] = 0.00
-                continue
-
-            grown_cost = base_cost * ((1 + growth_rate)**frac_yr)
-            undiscounted_cost = grown_cost * quantity_per_period
-
-            if discounting_enabled:
-                discounted_cost = undiscounted_cost / ((1 + annual_discount_rate)**frac_yr)
-            else:
-                discounted_cost = undiscounted_cost
-
-            if debug and p_idx == 0:
-                print(f"Grown Cost: {grown_cost}")
-                print(f"Undiscounted Cost: {undiscounted_cost}")
-                print(f"Discounted Cost: {discounted_cost}")
-
-            undc_rounded = round(undiscounted_cost, 2)
-            disc_rounded = round(discounted_cost, 2)
-
-            row_data[name + " (Undiscounted)"] = undc_rounded
-            row_data[name + " (Discounted)"] = disc_rounded
-
-            item_totals_undiscounted[name] += undc_rounded
-            item_totals_discounted[name] += disc_rounded
-
-        rows.append(row_data)
-
-    df = pd.DataFrame(rows)
+    fracs = [frac_yr for _, frac_yr in period_tuples]
+    undiscounted, discounted = life_care_plan_matrices(
+        fracs, items, annual_discount_rate, discounting_enabled, periods_per_year
+    )
+
+    if debug:
+        for item, applies in zip(items, applicability_mask(fracs, items)[0]):
+            print(f"\nDEBUG: Item {item['name']} ({item.get('pattern', 'recurring')}) "
+                  f"applies in first period: {bool(applies)}")
+
+    # Per-item totals accumulate the rounded cells period by period, as a running sum would
+    cumulative_undiscounted = np.cumsum(undiscounted, axis=0)
+    cumulative_discounted = np.cumsum(discounted, axis=0)
+    item_totals_undiscounted = {it["name"]: float(cumulative_undiscounted[-1, col]) for col, it in enumerate(items)}
+    item_totals_discounted = {it["name"]: float(cumulative_discounted[-1, col]) for col, it in enumerate(items)}
+
+    columns = {
+        "Period Index": [p_idx for p_idx, _ in period_tuples],
+        "Calendar Year": [start_year + int(frac_yr) for frac_yr in fracs],
+        "Age": [start_age + frac_yr for frac_yr in fracs]
+    }
+    for col, item in enumerate(items):
+        columns[item["name"] + " (Undiscounted)"] = undiscounted[:, col]
+        columns[item["name"] + " (Discounted)"] = discounted[:, col]
+    df = pd.DataFrame(columns)
 
     # Add total columns
     undiscounted_cols = [f"{it['name']} (Undiscounted)" for it in items]
@@ -304,33 +450,78 @@ def generate_life_care_plan_table(
             print(f"  Undiscounted: {item_totals_undiscounted[name]}")
             print(f"  Discounted: {item_totals_discounted[name]}")
 
-    # Add summary rows
-    for item in items:
-        name = item["name"]
-        new_row = {col: "" for col in df.columns}
-        new_row["Age"] = f"{name} TOTAL"
-        new_row["Period Index"] = ""
-        new_row["Calendar Year"] = ""
-        new_row[f"{name} (Undiscounted)"] = f"{item_totals_undiscounted[name]:,.2f}"
-        new_row[f"{name} (Discounted)"] = f"{item_totals_discounted[name]:,.2f}"
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-    # Add grand total row
-    new_row = {col: "" for col in df.columns}
-    new_row["Age"] = "Grand TOTAL"
-    new_row["Period Index"] = ""
-    new_row["Calendar Year"] = ""
     total_undisc = sum(item_totals_undiscounted.values())
     total_disc = sum(item_totals_discounted.values())
-    new_row["Total (Undiscounted)"] = f"{total_undisc:,.2f}"
-    new_row["Total (Discounted)"] = f"{total_disc:,.2f}"
-    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+    summary = {
+        "items": [
+            {
+                "name": name,
+                "undiscounted": item_totals_undiscounted[name],
+                "discounted": item_totals_discounted[name]
+            }
+            for name in item_totals_undiscounted
+        ],
+        "total_undiscounted": total_undisc,
+        "total_discounted": total_disc
+    }
 
     if debug:
         print("\nDEBUG: Grand Totals:")
         print(f"Total Undiscounted: {total_undisc}")
         print(f"Total Discounted: {total_disc}")
 
-    verify_dataframe(df, items, discounting_enabled=discounting_enabled, debug=debug)
+    verify_dataframe(df, items, discounting_enabled=discounting_enabled, debug=debug, summary=summary,
+                     level=verify_level)
+
+    return df, summary
 
-    return df 
\ No newline at end of file
+def merge_summary_rows(table: pd.DataFrame, summary: Dict) -> pd.DataFrame:
+    """
+    Display copy of a life care plan table with its TOTAL rows appended.
+
+    Ages are formatted to two decimals and one TOTAL row per item plus a
+    Grand TOTAL row are added in a single concat, with totals formatted as
+    strings like "1,234.56". The result is for rendering and export only;
+    its columns are object dtype.
+    """
+    display = table.copy()
+    display["Age"] = [f"{age:.2f}" for age in table["Age"]]
+    blank = {col: "" for col in table.columns}
+    rows = []
+    for item in summary["items"]:
+        rows.append({
+            **blank,
+            "Age": f"{item['name']} TOTAL",
+            f"{item['name']} (Undiscounted)": f"{item['undiscounted']:,.2f}",
+            f"{item['name']} (Discounted)": f"{item['discounted']:,.2f}"
+        })
+    rows.append({
+        **blank,
+        "Age": "Grand TOTAL",
+        "Total (Undiscounted)": f"{summary['total_undiscounted']:,.2f}",
+        "Total (Discounted)": f"{summary['total_discounted']:,.2f}"
+    })
+    return pd.concat([display, pd.DataFrame(rows, columns=table.columns)], ignore_index=True)
+
+def generate_life_care_plan_table(
+    category_name: str,
+    start_year: int,
+    start_age: float,
+    duration_years: float,
+    items: list,
+    annual_discount_rate: float = 0.03,
+    discounting_enabled: bool = True,
+    frequency: str = "annual",
+    debug: bool = False,
+    verify_level: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Generates a comprehensive life care plan table with extensive validations,
+    multiple patterns of item occurrences, separate Undiscounted and Discounted columns,
+    and final summary rows. Allows sub-year frequencies (monthly, quarterly, etc.).
+    """
+    table, summary = build_life_care_plan(
+        category_name, start_year, start_age, duration_years, items,
+        annual_discount_rate, discounting_enabled, frequency, debug, verify_level
+    )
+    return merge_summary_rows(table, summary) 
\ No newline at end of file
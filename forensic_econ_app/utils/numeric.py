@@ -0,0 +1,59 @@
+"""
+Numeric Backend Module.
+
+The calculators can run on two numeric backends:
+
+- 'decimal': the original step-by-step Decimal arithmetic (28 significant
+  digits, ROUND_HALF_UP). Slow, but the historical reference.
+- 'float64': IEEE double precision, vectorized where possible. Every
+  intermediate carries a relative error of about 1e-16, so for totals below
+  $10^9 built from a few hundred operations the absolute error stays under
+  $10^-5, three orders of magnitude below half a cent. Floats become Decimal
+  at full precision (see float_to_decimal) and are rounded to the cent only
+  once, half-up like the Decimal path (see float_to_cents), so a value just
+  below a half cent rounds down on both backends. Only a float within
+  representation noise of an exact half cent is taken as that tie.
+
+The backend is chosen per call with backend='decimal' | 'float64', falling
+back to the NUMERIC_BACKEND config setting and then to DEFAULT_BACKEND. Run
+`flask numeric-parity` to confirm both backends agree to the cent.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+
+from flask import current_app, has_app_context
+
+BACKENDS = ('decimal', 'float64')
+DEFAULT_BACKEND = 'float64'
+
+CENT = Decimal('0.01')
+HALF_CENT = Decimal('0.005')
+
+# Relative distance from a half cent within which a float amount is taken to
+# land on it. float64 totals carry about 1e-16 relative error per operation,
+# so this absorbs representation noise without moving any real near-tie.
+HALF_CENT_TOLERANCE = Decimal('1e-13')
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """Return the backend to use for a call, consulting app config when none is given."""
+    if backend is None:
+        backend = current_app.config.get('NUMERIC_BACKEND', DEFAULT_BACKEND) if has_app_context() else DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown numeric backend '{backend}'; expected one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def float_to_decimal(value: float) -> Decimal:
+    """Convert a float amount to Decimal at full precision, landing float noise around a half cent on it."""
+    exact = Decimal(repr(float(value)))
+    half_cents = (exact / HALF_CENT).to_integral_value() * HALF_CENT
+    if abs(exact - half_cents) <= abs(exact) * HALF_CENT_TOLERANCE:
+        return half_cents
+    return exact
+
+
+def float_to_cents(value: float) -> Decimal:
+    """Round a float to the cent in a single step, half-up like the Decimal path."""
+    return float_to_decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
@@ -0,0 +1,104 @@
+"""
+Numeric Parity Module.
+
+Runs the earnings, AEF and household calculators on both numeric backends
+over a fixed corpus of cases and reports whether their totals agree to the
+cent. Used by the `flask numeric-parity` command and the test suite.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from .calculations import calculate_aef, compute_earnings_table
+from .numeric import BACKENDS
+from ..models.models import HouseholdServicesScenario, HouseholdServiceStage
+
+CENT = Decimal('0.01')
+
+EARNINGS_CORPUS = [
+    dict(start_date=datetime(2023, 3, 15), end_date=datetime(2065, 8, 1), wage_base=58250.0,
+         residual_base=21000.0, growth_rate=0.0325, discount_rate=0.045, adjustment_factor=87.5,
+         date_of_birth=datetime(1990, 6, 2)),
+    dict(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 9, 30), wage_base=41000.0,
+         residual_base=0.0, growth_rate=0.02, discount_rate=0.03, adjustment_factor=100.0),
+    dict(start_date=datetime(2020, 7, 4), end_date=datetime(2031, 12, 31), wage_base=97500.0,
+         residual_base=30000.0, growth_rate=-0.01, discount_rate=None, adjustment_factor=72.3,
+         date_of_birth=datetime(1975, 2, 28), offset_wages={2022: 12000.0, 2025: 0.0, 2031: 45000.0}),
+    dict(start_date=datetime(2025, 11, 20), end_date=datetime(2070, 2, 14), wage_base=250000.0,
+         residual_base=85000.0, growth_rate=0.041, discount_rate=0.0275, adjustment_factor=79.35,
+         date_of_birth=datetime(2001, 12, 1), offset_wages={2030: 60000.0}),
+    dict(start_date=datetime(2019, 2, 28), end_date=datetime(2044, 2, 29), wage_base=33333.33,
+         residual_base=12500.5, growth_rate=0.0, discount_rate=0.0, adjustment_factor=100.0),
+    # Total losses within a thousandth of a cent of a half cent, one either side
+    dict(start_date=datetime(2023, 4, 1), end_date=datetime(2035, 11, 9), wage_base=94655.67,
+         residual_base=15064.16, growth_rate=0.0482, discount_rate=0.0438, adjustment_factor=93.5),
+    dict(start_date=datetime(2016, 1, 5), end_date=datetime(2041, 5, 21), wage_base=228362.89,
+         residual_base=7189.81, growth_rate=0.0186, discount_rate=0.0363, adjustment_factor=62.12),
+]
+
+AEF_CORPUS = [
+    dict(gross_earnings_base=1.0, worklife_adjustment=0.919, unemployment_factor=0.035,
+         fringe_benefit=0.2135, tax_liability=0.12),
+    dict(gross_earnings_base=1.0, worklife_adjustment=0.8415, unemployment_factor=0.0425,
+         fringe_benefit=0.31, tax_liability=0.1675, wrongful_death=True, personal_percentage=0.245),
+    dict(gross_earnings_base=1.0, worklife_adjustment=1.0, unemployment_factor=0.0,
+         fringe_benefit=0.0, tax_liability=0.0),
+]
+
+HOUSEHOLD_CORPUS = [
+    dict(area_wage_adjustment='1.0450', reduction_percentage='0.6500', growth_rate='0.0275',
+         discount_rate='0.0410', stages=[(12, '18250.00'), (25, '9400.00')]),
+    dict(area_wage_adjustment='0.9120', reduction_percentage='1.0000', growth_rate='0.0300',
+         discount_rate='0.0300', stages=[(40, '22000.00')]),
+    dict(area_wage_adjustment='1.1875', reduction_percentage='0.3333', growth_rate='0.0150',
+         discount_rate='0.0525', stages=[(5, '31000.00'), (10, '15500.00'), (20, '4200.00')]),
+]
+
+
+def _household_scenario(case: dict) -> HouseholdServicesScenario:
+    scenario = HouseholdServicesScenario(**{
+        field: Decimal(case[field])
+        for field in ('area_wage_adjustment', 'reduction_percentage', 'growth_rate', 'discount_rate')
+    })
+    scenario.stages = [
+        HouseholdServiceStage(stage_number=number, years=years, annual_value=Decimal(value))
+        for number, (years, value) in enumerate(case['stages'], 1)
+    ]
+    return scenario
+
+
+def _row(model: str, case: int, quantity: str, values: Optional[Dict[str, Decimal]] = None,
+         agrees: Optional[bool] = None) -> dict:
+    """Report row; values are rounded to cents and agree when identical across backends."""
+    row = {'model': model, 'case': case, 'quantity': quantity}
+    if values is not None:
+        rounded = {backend: Decimal(value).quantize(CENT) for backend, value in values.items()}
+        row.update(rounded)
+        agrees = len(set(rounded.values())) == 1
+    row['agrees'] = agrees
+    return row
+
+
+def parity_report() -> List[dict]:
+    """Compare every corpus case across the numeric backends; one row per compared total."""
+    rows = []
+    for case, params in enumerate(EARNINGS_CORPUS, 1):
+        results = {backend: compute_earnings_table(**params, backend=backend) for backend in BACKENDS}
+        rows.append(_row('earnings', case, 'total_loss', {b: r[3] for b, r in results.items()}))
+        rows.append(_row('earnings', case, 'total_pv', {b: r[2] for b, r in results.items()}))
+        rows.append(_row('earnings', case, 'display_table',
+                         agrees=results['decimal'][1].equals(results['float64'][1])))
+
+    for case, params in enumerate(AEF_CORPUS, 1):
+        results = {backend: calculate_aef(**params, backend=backend) for backend in BACKENDS}
+        rows.append(_row('aef', case, 'aef_percent', {b: r[1] * 100 for b, r in results.items()}))
+        rows.append(_row('aef', case, 'steps_table',
+                         agrees=results['decimal'][0].equals(results['float64'][0])))
+
+    for case, params in enumerate(HOUSEHOLD_CORPUS, 1):
+        scenario = _household_scenario(params)
+        rows.append(_row('household', case, 'present_value', {
+            backend: scenario.calculate_present_value(backend=backend) for backend in BACKENDS
+        }))
+    return rows
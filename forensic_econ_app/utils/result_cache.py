@@ -0,0 +1,94 @@
+"""
+Result Cache Module.
+
+In-process LRU cache for computed scenario results. Entries are keyed by the
+scenario id and a fingerprint of every input that determines the result, so a
+changed input can never serve a stale table; routes also invalidate entries
+explicitly when a scenario, its offsets or its evaluee change.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+def input_fingerprint(inputs: Any) -> str:
+    """Stable SHA-256 hash of a JSON-serialisable structure of inputs."""
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed number of entries."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value and mark it as most recently used."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches predicate; returns the number removed."""
+        with self._lock:
+            stale = [key for key in self._data if predicate(key)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting entries if the cache is now too large."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Earnings tables keyed by (scenario_id, input fingerprint)
+earnings_cache = LRUCache()
+
+
+def invalidate_earnings_scenarios(scenario_ids: Iterable[int]) -> None:
+    """Drop every cached earnings result for the given scenario ids."""
+    ids = set(scenario_ids)
+    earnings_cache.invalidate(lambda key: key[0] in ids)
+
+
+# What-if inputs of recently viewed healthcare scenarios, keyed by (scenario_id, input fingerprint)
+healthcare_cache = LRUCache()
+
+
+def invalidate_healthcare_scenarios(scenario_ids: Optional[Iterable[int]] = None) -> None:
+    """Drop cached healthcare what-if inputs for the given scenario ids, or all of them."""
+    if scenario_ids is None:
+        healthcare_cache.clear()
+        return
+    ids = set(scenario_ids)
+    healthcare_cache.invalidate(lambda key: key[0] in ids)
+
+
+# Parsed rows of uploaded AEF batches, keyed by a fingerprint of the upload
+aef_batch_cache = LRUCache(maxsize=32)
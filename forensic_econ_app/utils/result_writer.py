@@ -0,0 +1,87 @@
+"""
+Result Writer Module.
+
+Write-behind persistence for computed results such as present_value and
+total_loss. Values are only assigned when they differ from the stored value at
+cent precision, so read-only page views of an unchanged scenario never open a
+write transaction. With the 'deferred' policy, changed values from one request
+are committed together in a single transaction after the response is built;
+persist_results_batch writes the results of many objects in one commit.
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, Set, Tuple
+
+from flask import current_app, g
+
+from ..models.models import db
+
+CENT = Decimal('0.01')
+
+
+def _to_cents(value):
+    """Quantize a numeric value to cents, keeping None as None."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(CENT)
+
+
+def _assign_changed(obj, values: Dict) -> bool:
+    """Set each result field whose cent value differs; returns True if any did."""
+    changed = False
+    for field, value in values.items():
+        new_value = _to_cents(value)
+        if _to_cents(getattr(obj, field)) != new_value:
+            setattr(obj, field, new_value)
+            changed = True
+    return changed
+
+
+def persist_results(obj, **values) -> bool:
+    """
+    Assign result fields on a model instance only when they changed.
+
+    Returns True if anything was written. The RESULT_WRITE_POLICY setting
+    controls when changes are committed: 'immediate' commits now, 'deferred'
+    batches every change made during the request into one commit.
+    """
+    changed = _assign_changed(obj, values)
+
+    if not changed:
+        return False
+
+    if current_app.config.get('RESULT_WRITE_POLICY', 'immediate') == 'deferred':
+        g.pending_result_writes = True
+    else:
+        db.session.commit()
+    return True
+
+
+def persist_results_batch(updates: Iterable[Tuple[object, Dict]]) -> Set[int]:
+    """
+    Assign result fields on many model instances and commit them together.
+
+    updates holds (obj, {field: value}) pairs. Only changed fields are
+    assigned, and nothing is committed when nothing changed. Returns the ids
+    of the objects that changed; on a failed commit the transaction is
+    rolled back and the error re-raised.
+    """
+    changed = {obj.id for obj, values in updates if _assign_changed(obj, values)}
+    if changed:
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    return changed
+
+
+def flush_pending_results(response):
+    """after_request hook committing every result deferred during the request."""
+    if g.pop('pending_result_writes', False):
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f'Error persisting deferred results: {str(e)}')
+    return response
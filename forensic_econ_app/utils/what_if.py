@@ -0,0 +1,153 @@
+"""
+What-If Module.
+
+Fast recomputation of a scenario's totals when one parameter is nudged. The
+earnings state (see calculations.compute_earnings_state) and the medical cost
+vectors built here keep the per-period factors: portions, growth exponents,
+undiscounted cash flows and discount exponents. A what-if call reapplies only
+the factor that changed, so it can back an interactive slider without a
+database load or a table rebuild.
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .calculations import present_value_column
+from .earnings_engine import compute_present_value_matrix, offset_rows, segment_wage_vector
+from .factor_cache import factor_vector
+
+
+def earnings_what_if(
+    state: dict,
+    growth_rate: Optional[float] = None,
+    discount_rate: Optional[float] = None,
+    adjustment_factor: Optional[float] = None
+) -> Dict:
+    """
+    Earnings totals for a cached state with growth, discount or adjustment factor changed.
+
+    A new growth rate rescales the wage and residual vectors by the ratio of
+    growth powers (wage segments are re-evaluated, offset years keep their
+    amounts); a new adjustment factor rescales gross earnings; a new discount
+    rate replaces the state's discount rates. Parameters left as None keep
+    the state's values.
+    """
+    grid, schedule = state["grid"], state["schedule"]
+    wage, residual = schedule["wage_base"], schedule["residual"]
+
+    if growth_rate is not None and growth_rate != state["growth_rate"]:
+        if growth_rate < -1:
+            raise ValueError("Growth rate cannot be less than -100%")
+        growth_factors = (1.0 + growth_rate) ** grid["growth_periods"]
+        if state["wage_segments"]:
+            wage = segment_wage_vector(grid, state["wage_base"], growth_rate, state["wage_segments"])
+        else:
+            wage = state["wage_base"] * growth_factors * grid["portions"]
+        residual = state["residual_base"] * growth_factors * grid["portions"]
+        if state["offset_wages"]:
+            rows, amounts = offset_rows(grid, state["offset_wages"])
+            residual[rows] = amounts * grid["portions"][rows]
+
+    if adjustment_factor is not None and adjustment_factor <= 0:
+        raise ValueError("Adjustment factor must be positive")
+    factor = (state["adjustment_factor"] if adjustment_factor is None else adjustment_factor) / 100.0
+    loss = wage * factor - residual
+
+    if discount_rate is not None:
+        if discount_rate < 0:
+            raise ValueError("Discount rate cannot be negative")
+        rates = [float(discount_rate)]
+    else:
+        rates = state["rates"]
+    pv_totals = compute_present_value_matrix(grid, loss, rates).sum(axis=0)
+
+    return {
+        "total_loss": float(loss.sum()),
+        "present_value": {present_value_column(r): float(total) for r, total in zip(rates, pv_totals)}
+    }
+
+
+def effective_medical_rates(growth_rate, discount_rate, partial_offset: bool, total_offset: bool,
+                            discount_method: str):
+    """
+    Growth and discount rates actually applied to a life care plan.
+
+    A total offset discounts at the growth rate; a partial offset discounts at
+    the net rate (1 + d) / (1 + g) - 1 with scenario growth set to zero; the
+    'net' method takes the entered discount rate as already net. Works on
+    Decimal or float rates.
+    """
+    if total_offset:
+        discount_rate = growth_rate
+    net_discount = discount_rate
+    if partial_offset:
+        net_discount = ((1 + discount_rate) / (1 + growth_rate)) - 1
+        growth_rate = Decimal('0.0') if isinstance(growth_rate, Decimal) else 0.0
+    if discount_method == 'net':
+        net_discount = discount_rate
+    return growth_rate, net_discount
+
+
+def medical_cost_vectors(items: Iterable[dict], projection_years: int) -> Dict[str, np.ndarray]:
+    """
+    Flatten medical items into one row per (item, projection year) with a cost.
+
+    items are dicts with annual_cost, growth_rate (None for the scenario rate),
+    start_year, duration_years, interval_years and is_one_time, resolved the
+    way compute_future_medical_costs resolves them; occurrences before year 1
+    fall outside the projection. Returns the zero-based year exponents, base
+    costs and item growth rates (NaN where the scenario rate applies).
+    """
+    exponents, costs, growth = [], [], []
+    for item in items:
+        start_year = item["start_year"]
+        years = np.arange(max(start_year, 1), min(start_year + item["duration_years"], projection_years + 1))
+        years = years[(years - start_year) % max(item["interval_years"], 1) == 0]
+        if item["is_one_time"]:
+            years = years[years <= start_year]
+        exponents.append(years - 1)
+        costs.append(np.full(len(years), item["annual_cost"]))
+        growth.append(np.full(len(years), np.nan if item["growth_rate"] is None else item["growth_rate"]))
+
+    def _concat(arrays, dtype):
+        return np.concatenate(arrays).astype(dtype) if arrays else np.empty(0, dtype=dtype)
+
+    return {
+        "exponents": _concat(exponents, np.int64),
+        "costs": _concat(costs, float),
+        "item_growth": _concat(growth, float)
+    }
+
+
+def medical_what_if(vectors: Dict[str, np.ndarray], growth_rate: float, discount_rate: float,
+                    partial_offset: bool = False, total_offset: bool = False,
+                    discount_method: str = 'nominal') -> Dict:
+    """
+    Life care plan totals from cached medical cost vectors at the given scenario rates.
+
+    growth_rate is the scenario growth rate before offsets and discount_rate
+    the entered discount rate; the offset rules are reapplied on the fly.
+    Growth and discount factors come from the shared factor cache.
+    """
+    growth, net_discount = effective_medical_rates(float(growth_rate), float(discount_rate),
+                                                   partial_offset, total_offset, discount_method)
+    exponents, item_growth = vectors["exponents"], vectors["item_growth"]
+    n_periods = int(exponents.max()) + 1 if len(exponents) else 0
+    rates = np.where(np.isnan(item_growth), growth, item_growth)
+    growth_factors = np.empty(len(exponents))
+    for rate in np.unique(rates):
+        rows = rates == rate
+        growth_factors[rows] = factor_vector(float(rate), 1, n_periods, "growth")[exponents[rows]]
+    future = vectors["costs"] * growth_factors
+    if discount_method != 'none':
+        present = future * factor_vector(float(net_discount), 1, n_periods, "discount")[exponents]
+    else:
+        present = future
+    return {
+        "growth_rate_effective": float(growth),
+        "discount_rate_effective": float(net_discount),
+        "grand_total_undiscounted": float(future.sum()),
+        "grand_total_present_value": float(present.sum())
+    }